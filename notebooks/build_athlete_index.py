@@ -0,0 +1,41 @@
+# notebooks/build_athlete_index.py
+# Build the athlete dimension (integer athlete_id per normalized URL slug) and
+# write keyed copies of the clean tables that carry athlete_id instead of the
+# repeated name / url strings.
+import pandas as pd
+
+from olympic_data.athlete_index import attach_athlete_id, build_athlete_dim
+from olympic_data.paths import CLEAN
+
+DIM_OUT = CLEAN / "olympic_athlete_dim.csv"
+
+# table -> (clean input, keyed output)
+TABLES = {
+    "athletes": (CLEAN / "olympic_athletes_clean.csv",   CLEAN / "olympic_athletes_keyed.csv"),
+    "results":  (CLEAN / "olympic_results_clean.csv",    CLEAN / "olympic_results_keyed.csv"),
+    "medals":   (CLEAN / "olympic_medals_clean_v2.csv",  CLEAN / "olympic_medals_keyed.csv"),
+}
+
+frames = {}
+for table, (path, _) in TABLES.items():
+    if path.exists():
+        frames[table] = pd.read_csv(path)
+        print(f"Loaded {table}: {frames[table].shape}")
+    else:
+        print(f" skipped {table} (missing {path.name})")
+
+# keep ids stable across runs: extend the previous dimension instead of renumbering
+existing = pd.read_csv(DIM_OUT) if DIM_OUT.exists() else None
+dim = build_athlete_dim(frames, existing=existing)
+dim.to_csv(DIM_OUT, index=False, encoding="utf-8")
+n_new = len(dim) - (0 if existing is None else len(existing))
+print(f" Saved athlete dim -> {DIM_OUT}  ({len(dim)} athletes, {n_new} new)")
+
+for table, df in frames.items():
+    keyed = attach_athlete_id(df, table, dim)
+    out = TABLES[table][1]
+    keyed.to_csv(out, index=False, encoding="utf-8")
+    before = df.memory_usage(deep=True).sum() / 1e6
+    after = keyed.memory_usage(deep=True).sum() / 1e6
+    print(f" Saved {table} keyed -> {out}  (rows: {len(keyed)}, "
+          f"ids missing: {keyed['athlete_id'].isna().sum()}, {before:.1f} MB -> {after:.1f} MB in memory)")
@@ -1,58 +1,53 @@
 # notebooks/clean_olympic_results.py
 import ast
 import re
+import sys
 import pandas as pd
-from pathlib import Path
 
-# -------- paths (portable) --------
-ROOT  = Path(__file__).resolve().parents[1]
-RAW   = ROOT / "data" / "raw"
-CLEAN = ROOT / "data" / "clean"
-CLEAN.mkdir(parents=True, exist_ok=True)
+from olympic_data.outofcore import CsvAppender, Spill, iter_html_table
+from olympic_data.partitioned import attach_season
+from olympic_data.performance import parse_values
+from olympic_data.paths import CLEAN, RAW
+from olympic_data.validation import run_validation, validate
 
+# -------- paths (see olympic_data/paths.py) --------
 HTML_IN   = RAW / "olympic_results.html"
 HOSTS_IN  = CLEAN / "olympic_hosts_clean.csv"  # join season if available
 OUT_DETA  = CLEAN / "olympic_results_clean.csv"
 OUT_AWARD = CLEAN / "olympic_results_awards.csv"
 
-print(f"Input exists? {HTML_IN.exists()} -> {HTML_IN}")
-if not HTML_IN.exists():
-    raise FileNotFoundError(f"Place olympic_results.html in {RAW}")
-
-# -------- load html table --------
-# Use pandas to parse first table; fallback to manual BeautifulSoup if needed
-try:
-    df = pd.read_html(HTML_IN)[0]
-except Exception:
-    from bs4 import BeautifulSoup
-    html = HTML_IN.read_text(encoding="utf-8", errors="ignore")
-    soup = BeautifulSoup(html, "html.parser")
-    rows = []
-    for tr in soup.select("table tr"):
-        cells = [td.get_text(strip=True) for td in tr.find_all(["th","td"])]
-        rows.append(cells)
-    df = pd.DataFrame(rows[1:], columns=rows[0])
+SPILL     = CLEAN / ".spill_results"
+# Out-of-core mode (python clean_olympic_results.py --out-of-core, or automatic
+# for big exports): the HTML is streamed in chunks, spilled to disk by year,
+# and each edition is expanded / validated / deduplicated on its own.
+OUT_OF_CORE_BYTES = 512 * 1024**2
+
+# text columns of the export: read as strings on both paths, so "1" never becomes "1.0"
+STRING_COLS = ["discipline_title","event_title","slug_game","participant_type","medal_type",
+               "country_name","country_code","country_3_letter_code","athlete_url","athlete_full_name",
+               "value_unit","value_type","rank_equal","rank_position"]
 
 # -------- basic tidy --------
-df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
-for junk in ["unnamed:_0", "index"]:
-    if junk in df.columns:
-        df = df.drop(columns=[junk])
-
-# Normalize strings
-for c in ["discipline_title","event_title","slug_game","participant_type","medal_type",
-          "country_name","country_code","country_3_letter_code","athlete_url","athlete_full_name",
-          "value_unit","value_type","rank_equal","rank_position"]:
-    if c in df.columns:
-        df[c] = df[c].astype(str).str.strip()
-
-# Extract year
-df["year"] = pd.to_numeric(df["slug_game"].str.extract(r"(\d{4})")[0], errors="coerce").astype("Int64")
-
-# Standardize medal field, upper
-if "medal_type" not in df.columns:
-    df["medal_type"] = ""
-df["medal_type"] = df["medal_type"].fillna("").str.upper()
+def tidy(df):
+    df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
+    for junk in ["unnamed:_0", "index"]:
+        if junk in df.columns:
+            df = df.drop(columns=[junk])
+
+    # Normalize strings
+    for c in STRING_COLS:
+        if c in df.columns:
+            # missing cells stay missing (astype(str) turns them into "nan" on pandas < 3)
+            df[c] = df[c].where(df[c].isna(), df[c].astype(str).str.strip())
+
+    # Extract year
+    df["year"] = pd.to_numeric(df["slug_game"].str.extract(r"(\d{4})")[0], errors="coerce").astype("Int64")
+
+    # Standardize medal field, upper
+    if "medal_type" not in df.columns:
+        df["medal_type"] = ""
+    df["medal_type"] = df["medal_type"].fillna("").str.upper()
+    return df
 
 # -------- expand 'athletes' (list of (name, url)) to rows --------
 # Example value: "[('Name SURNAME','https://...'), ('Teammate','https://...')]"
@@ -80,69 +75,71 @@ def parse_athletes(cell):
         names = re.findall(r"'([^']+)'", s)
         return [(n, "") for n in names]
 
-# explode athletes into separate rows (keep original row if none)
-df["_ath_list"] = df.get("athletes", "").apply(parse_athletes)
-has_list = df["_ath_list"].apply(lambda x: len(x) > 0)
-
-# Build exploded frame
-exploded = df[has_list].explode("_ath_list").copy()
-if not exploded.empty:
-    exploded["athlete_full_name_from_list"] = exploded["_ath_list"].apply(lambda t: t[0] if isinstance(t, (list, tuple)) else "")
-    exploded["athlete_url_from_list"]       = exploded["_ath_list"].apply(lambda t: t[1] if isinstance(t, (list, tuple)) and len(t) > 1 else "")
-
-# Merge athlete columns: prefer explicit athlete_full_name if present; else from list
-if not exploded.empty:
-    exploded["athlete_full_name"] = exploded["athlete_full_name"].where(
-        exploded["athlete_full_name"].astype(str).str.len() > 0,
-        exploded["athlete_full_name_from_list"]
-    )
-    exploded["athlete_url"] = exploded["athlete_url"].where(
-        exploded["athlete_url"].astype(str).str.len() > 0,
-        exploded["athlete_url_from_list"]
-    )
-
-# Combine: rows without list + exploded rows
-without_list = df[~has_list].copy()
-df_expanded = pd.concat([without_list, exploded.drop(columns=["_ath_list","athlete_full_name_from_list","athlete_url_from_list"], errors="ignore")],
-                        ignore_index=True)
-
-# -------- create medal flags --------
-for m in ["gold","silver","bronze"]:
-    df_expanded[m] = 0
-df_expanded.loc[df_expanded["medal_type"]=="GOLD","gold"] = 1
-df_expanded.loc[df_expanded["medal_type"]=="SILVER","silver"] = 1
-df_expanded.loc[df_expanded["medal_type"]=="BRONZE","bronze"] = 1
-
-# Rank to numeric where possible
-if "rank_position" in df_expanded.columns:
-    df_expanded["rank_position_num"] = pd.to_numeric(df_expanded["rank_position"], errors="coerce").astype("Int64")
-
-# Join season from hosts (optional)
-if HOSTS_IN.exists():
-    hosts = pd.read_csv(HOSTS_IN)
-    season_map = dict(zip(hosts["year"], hosts["season"]))
-    df_expanded["season"] = df_expanded["year"].map(season_map)
-
-# Standard column order
-keep_cols = [
-    "year","season","slug_game",
-    "discipline_title","event_title","participant_type",
-    "medal_type","gold","silver","bronze",
-    "rank_equal","rank_position","rank_position_num",
-    "country_name","country_code","country_3_letter_code",
-    "athlete_full_name","athlete_url",
-    "value_type","value_unit"
-]
-keep_cols = [c for c in keep_cols if c in df_expanded.columns]
-results_clean = df_expanded[keep_cols].copy().sort_values(["year","discipline_title","event_title","rank_position_num"], na_position="last")
-
-# Save detailed results
-results_clean.to_csv(OUT_DETA, index=False, encoding="utf-8")
-print(f" saved detailed results -> {OUT_DETA}  (rows: {len(results_clean)})")
-
-# -------- build awards table (1 row per medal award per NOC/event/year) --------
-# Keep only rows with a medal; deduplicate by (year, sport, event, medal, NOC)
-if not results_clean.empty and "country_3_letter_code" in results_clean.columns:
+
+def expand(df, hosts=None):
+    """Tidy rows -> one row per athlete, with medal flags, numeric rank and season."""
+    # explode athletes into separate rows (keep original row if none)
+    df["_ath_list"] = df.get("athletes", "").apply(parse_athletes)
+    has_list = df["_ath_list"].apply(lambda x: len(x) > 0)
+
+    # Build exploded frame
+    exploded = df[has_list].explode("_ath_list").copy()
+    if not exploded.empty:
+        exploded["athlete_full_name_from_list"] = exploded["_ath_list"].apply(lambda t: t[0] if isinstance(t, (list, tuple)) else "")
+        exploded["athlete_url_from_list"]       = exploded["_ath_list"].apply(lambda t: t[1] if isinstance(t, (list, tuple)) and len(t) > 1 else "")
+
+    # Merge athlete columns: prefer explicit athlete_full_name if present; else from list
+    if not exploded.empty:
+        exploded["athlete_full_name"] = exploded["athlete_full_name"].where(
+            exploded["athlete_full_name"].astype(str).str.len() > 0,
+            exploded["athlete_full_name_from_list"]
+        )
+        exploded["athlete_url"] = exploded["athlete_url"].where(
+            exploded["athlete_url"].astype(str).str.len() > 0,
+            exploded["athlete_url_from_list"]
+        )
+
+    # Combine: rows without list + exploded rows
+    without_list = df[~has_list].copy()
+    df_expanded = pd.concat([without_list, exploded.drop(columns=["_ath_list","athlete_full_name_from_list","athlete_url_from_list"], errors="ignore")],
+                            ignore_index=True)
+
+    # -------- create medal flags --------
+    for m in ["gold","silver","bronze"]:
+        df_expanded[m] = 0
+    df_expanded.loc[df_expanded["medal_type"]=="GOLD","gold"] = 1
+    df_expanded.loc[df_expanded["medal_type"]=="SILVER","silver"] = 1
+    df_expanded.loc[df_expanded["medal_type"]=="BRONZE","bronze"] = 1
+
+    # Rank to numeric where possible
+    if "rank_position" in df_expanded.columns:
+        df_expanded["rank_position_num"] = pd.to_numeric(df_expanded["rank_position"], errors="coerce").astype("Int64")
+
+    # Performance as a number (seconds / metres / points / kg, per value_type)
+    if "value_unit" in df_expanded.columns and "value_type" in df_expanded.columns:
+        df_expanded["value_num"] = parse_values(df_expanded["value_unit"], df_expanded["value_type"]).to_numpy()
+
+    # Join season from hosts (optional)
+    if hosts is not None:
+        df_expanded = attach_season(df_expanded, hosts)   # keyed on slug_game, not year
+
+    # Standard column order
+    keep_cols = [
+        "year","season","slug_game",
+        "discipline_title","event_title","participant_type",
+        "medal_type","gold","silver","bronze",
+        "rank_equal","rank_position","rank_position_num",
+        "country_name","country_code","country_3_letter_code",
+        "athlete_full_name","athlete_url",
+        "value_type","value_unit","value_num"
+    ]
+    keep_cols = [c for c in keep_cols if c in df_expanded.columns]
+    return df_expanded[keep_cols].copy().sort_values(["year","discipline_title","event_title","rank_position_num"], na_position="last", kind="stable")
+
+
+# -------- awards table (1 row per medal award per NOC/event/year) --------
+def build_awards(results_clean):
+    """Keep only rows with a medal; deduplicate by (year, sport, event, medal, NOC)."""
     awards = results_clean[results_clean["medal_type"].isin(["GOLD","SILVER","BRONZE"])].copy()
     # rename for consistency
     awards = awards.rename(columns={
@@ -156,17 +153,97 @@ if not results_clean.empty and "country_3_letter_code" in results_clean.columns:
     awards = awards.drop_duplicates(subset=[k for k in key if k in awards.columns]).copy()
     awards["award_count"] = 1
     # thin columns
-    keep_aw = [c for c in ["year","season","sport","event","noc","country","medal","award_count"] if c in awards.columns]
-    awards = awards[keep_aw].sort_values(["year","sport","event","noc","medal"])
-    awards.to_csv(OUT_AWARD, index=False, encoding="utf-8")
-    print(f" saved medal awards -> {OUT_AWARD}  (rows: {len(awards)})")
-else:
-    print(" skipped awards build (no medal rows or missing NOC column)")
-
-# -------- quick sanity prints --------
-print("\nNulls (results_clean):")
-print(results_clean.isnull().sum().sort_values(ascending=False).head(12))
-
-if HOSTS_IN.exists():
+    keep_aw = [c for c in ["year","season","slug_game","sport","event","noc","country","medal","award_count"] if c in awards.columns]
+    return awards[keep_aw].sort_values(["year","sport","event","noc","medal"])
+
+
+def run_in_memory(hosts):
+    """Whole export in memory; returns (nulls per column, France medal rows)."""
+    # -------- load html table --------
+    # Use pandas to parse first table; fallback to the streaming parser if lxml/bs4 are missing
+    try:
+        df = pd.read_html(HTML_IN, encoding="utf-8", converters={c: str for c in STRING_COLS + ["athletes"]})[0]
+    except Exception:
+        df = pd.concat(iter_html_table(HTML_IN), ignore_index=True)
+
+    results_clean = expand(tidy(df), hosts)
+
+    # Validate (bad rows -> data/clean/quarantine/results.csv)
+    results_clean = run_validation(results_clean, "results")
+
+    # Save detailed results
+    results_clean.to_csv(OUT_DETA, index=False, encoding="utf-8")
+    print(f" saved detailed results -> {OUT_DETA}  (rows: {len(results_clean)})")
+
+    if not results_clean.empty and "country_3_letter_code" in results_clean.columns:
+        awards = run_validation(build_awards(results_clean), "awards", out_name="results_awards")
+        awards.to_csv(OUT_AWARD, index=False, encoding="utf-8")
+        print(f" saved medal awards -> {OUT_AWARD}  (rows: {len(awards)})")
+    else:
+        print(" skipped awards build (no medal rows or missing NOC column)")
+
     fr = results_clean[results_clean["country_name"].str.upper()=="FRANCE"]
-    print("\nFrance medal rows in results (sample):", len(fr[fr['gold']+fr['silver']+fr['bronze']>0]))
+    return results_clean.isnull().sum(), len(fr[fr["gold"]+fr["silver"]+fr["bronze"]>0])
+
+
+def run_out_of_core(hosts):
+    """Stream -> spill by year -> one edition at a time; same outputs as run_in_memory()."""
+    # Rules and the award key all include the year, so per-edition validation and
+    # deduplication give the same rows as the in-memory path, in the same order.
+    spill = Spill(SPILL, by="year")
+    for chunk in iter_html_table(HTML_IN):
+        spill.add(tidy(chunk))
+    print(f" spilled {spill.rows} rows into {len(spill.buckets())} editions -> {SPILL}")
+
+    out_res, out_aw = CsvAppender(OUT_DETA), CsvAppender(OUT_AWARD)
+    q_res, q_aw = CsvAppender(CLEAN / "quarantine" / "results.csv"), CsvAppender(CLEAN / "quarantine" / "results_awards.csv")
+    (CLEAN / "quarantine").mkdir(parents=True, exist_ok=True)
+    hosts_ctx = pd.read_csv(HOSTS_IN) if HOSTS_IN.exists() else None    # None: known_games skipped
+    reports, nulls, fr_medals = [], pd.Series(dtype="int64"), 0
+    for year, part in spill:
+        res = expand(part, hosts)
+        res, bad, rep = validate(res, "results", hosts=hosts_ctx)
+        out_res.write(res)
+        q_res.write(bad)
+        reports.append(rep.assign(table="results"))
+        if not res.empty and "country_3_letter_code" in res.columns:
+            aw, bad, rep = validate(build_awards(res), "awards", hosts=hosts_ctx)
+            out_aw.write(aw)
+            q_aw.write(bad)
+            reports.append(rep.assign(table="awards"))
+        nulls = nulls.add(res.isnull().sum(), fill_value=0).astype("int64")
+        fr = res[res["country_name"].astype(str).str.upper()=="FRANCE"]
+        fr_medals += len(fr[fr["gold"]+fr["silver"]+fr["bronze"]>0])
+    spill.cleanup()
+
+    print(f" saved detailed results -> {OUT_DETA}  (rows: {out_res.close()})")
+    print(f" saved medal awards -> {OUT_AWARD}  (rows: {out_aw.close()})")
+    q_res.close()
+    q_aw.close()
+    if reports:
+        report = pd.concat(reports).groupby(["table", "rule", "action"], as_index=False, sort=False)["failed"].sum()
+        print("\nValidation (all editions):")
+        print(report.to_string(index=False))
+    return nulls, fr_medals
+
+
+def main():
+    CLEAN.mkdir(parents=True, exist_ok=True)
+    print(f"Input exists? {HTML_IN.exists()} -> {HTML_IN}")
+    if not HTML_IN.exists():
+        raise FileNotFoundError(f"Place olympic_results.html in {RAW}")
+    out_of_core = "--out-of-core" in sys.argv or HTML_IN.stat().st_size > OUT_OF_CORE_BYTES
+
+    hosts = pd.read_csv(HOSTS_IN, usecols=["slug", "season"]) if HOSTS_IN.exists() else None
+    nulls, fr_medals = run_out_of_core(hosts) if out_of_core else run_in_memory(hosts)
+
+    # -------- quick sanity prints --------
+    print("\nNulls (results_clean):")
+    print(nulls.sort_values(ascending=False).head(12))
+
+    if HOSTS_IN.exists():
+        print("\nFrance medal rows in results (sample):", fr_medals)
+
+
+if __name__ == "__main__":
+    main()
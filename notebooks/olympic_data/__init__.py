@@ -0,0 +1,28 @@
+# notebooks/olympic_data/__init__.py
+"""
+Shared helpers for the Olympic cleaning scripts and notebooks.
+
+The loaders below are cheap to import: pandas is only imported when a table
+is first loaded.
+"""
+from .datasets import (
+    clear_cache,
+    load,
+    load_athlete_dim,
+    load_athletes,
+    load_awards,
+    load_hosts,
+    load_medals,
+    load_results,
+)
+
+__all__ = [
+    "clear_cache",
+    "load",
+    "load_athlete_dim",
+    "load_athletes",
+    "load_awards",
+    "load_hosts",
+    "load_medals",
+    "load_results",
+]
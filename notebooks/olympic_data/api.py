@@ -0,0 +1,263 @@
+# notebooks/olympic_data/api.py
+"""
+Read-only medal API served from the clean data (no database round-trip).
+
+    cd notebooks && python -m olympic_data.api --port 8001
+
+Routes (JSON):
+    GET /api/health
+    GET /api/games/<games_slug>/medals          medal table of one Games
+    GET /api/countries/<noc>/history            medals per Games for one NOC
+    GET /api/sports/<sport>/leaders?season=&limit=
+    GET /api/search?q=&kind=&limit=              autocomplete (search.py)
+    GET /api/scenarios?q=<JSON list>&top=        2026 what-if projections (scenarios.py)
+
+Malformed parameters (a non-integer limit, bad scenario JSON, an unknown
+scenario key) are answered with 400.
+
+Responses are cached in an in-process LRU keyed by (dataset version, path,
+query) and carry an ETag derived from the same key, so a client sending
+If-None-Match gets a 304 without any work, and repeat requests are served
+from memory. The data store is pluggable: CleanDataStore reads
+data/clean, SharedDataStore attaches to the memory-mapped tables shared by
+all workers (shared.py), StaticDataStore wraps an in-memory frame (for
+tests / local stubs). Search and scenario responses also depend on other
+files (athlete dimension, models/*.csv): their size and mtime are part of
+the dataset version for those routes.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from urllib.parse import parse_qs, unquote
+
+from . import datasets
+
+MEDAL_COLS = ["gold", "silver", "bronze"]
+
+
+class BadRequest(ValueError):
+    """Malformed query parameters: answered with 400 and the message."""
+
+
+def _int_param(query, name, default):
+    value = query.get(name, [str(default)])[0]
+    try:
+        return int(value)
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer, got {value!r}") from None
+
+
+class StaticDataStore:
+    """Store over an awards-like frame (year, season, games_slug, sport, noc, country, medal)."""
+
+    def __init__(self, awards, version="static"):
+        self.version = version
+        self._counts = _medal_counts(awards)
+
+    def counts(self):
+        return self._counts
+
+
+class CleanDataStore(StaticDataStore):
+    """Store over olympic_medal_awards_v2.csv; version = hash of the file's size and mtime."""
+
+    def __init__(self):
+        path = datasets.table_path("awards")
+        stat = path.stat()
+        version = hashlib.sha1(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:12]
+        super().__init__(datasets.load_awards(), version=version)
+
+
+class SharedDataStore:
+    """Store over the shared memory-mapped awards (shared.py); follows new versions without a restart."""
+
+    def __init__(self, shared=None):
+        from .shared import SharedDataset
+        self.shared = shared or SharedDataset()
+        self._counts = {}
+
+    @property
+    def version(self):
+        return self.shared.version
+
+    def counts(self):
+        snap = self.shared.snapshot()
+        if snap.version not in self._counts:
+            self._counts = {snap.version: _medal_counts(snap.to_pandas("awards"))}
+        return self._counts[snap.version]
+
+
+def _medal_counts(awards):
+    """One row per (Games, sport, NOC) with gold/silver/bronze counts, computed once."""
+    df = awards.copy()
+    for m in MEDAL_COLS:
+        df[m] = (df["medal"] == m.upper()).astype("int64")
+    keys = ["year", "season", "games_slug", "sport", "noc", "country"]
+    return df.groupby(keys, dropna=False, as_index=False)[MEDAL_COLS].sum()
+
+
+def _table(df, by):
+    out = df.groupby(by, as_index=False, dropna=False)[MEDAL_COLS].sum()
+    out["total"] = out[MEDAL_COLS].sum(axis=1)
+    return out
+
+
+def games_medal_table(counts, slug):
+    df = counts[counts["games_slug"] == slug]
+    if df.empty:
+        return None
+    out = _table(df, ["noc", "country"]).sort_values(["gold", "silver", "bronze"], ascending=False)
+    out.insert(0, "rank", range(1, len(out) + 1))
+    return {"games_slug": slug, "year": int(df["year"].iloc[0]), "season": df["season"].iloc[0],
+            "medals": out.to_dict(orient="records")}
+
+
+def country_history(counts, noc):
+    df = counts[counts["noc"] == noc.upper()]
+    if df.empty:
+        return None
+    out = _table(df, ["year", "season", "games_slug"]).sort_values(["year", "season"])
+    return {"noc": noc.upper(), "country": df["country"].iloc[-1], "games": out.to_dict(orient="records")}
+
+
+def sport_leaders(counts, sport, season=None, limit=10):
+    df = counts[counts["sport"].str.lower() == sport.lower()]
+    if season:
+        df = df[df["season"].str.lower() == season.lower()]
+    if df.empty:
+        return None
+    out = _table(df, ["noc", "country"]).sort_values(["gold", "total"], ascending=False).head(limit)
+    return {"sport": df["sport"].iloc[0], "season": season, "leaders": out.to_dict(orient="records")}
+
+
+class LRUCache:
+    """Small ordered-dict LRU: get() refreshes an entry, put() evicts the oldest."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class MedalApi:
+    """WSGI app; `store` is any object with .version and .counts()."""
+
+    def __init__(self, store, cache_size=256):
+        self.store = store
+        self.cache = LRUCache(cache_size)
+
+    def _route(self, path, query):
+        counts = self.store.counts()
+        parts = [unquote(p) for p in path.strip("/").split("/")]
+        if parts == ["api", "health"]:
+            return {"status": "OK", "dataset_version": self.store.version,
+                    "cache": {"hits": self.cache.hits, "misses": self.cache.misses}}
+        if len(parts) == 4 and parts[:2] == ["api", "games"] and parts[3] == "medals":
+            return games_medal_table(counts, parts[2])
+        if len(parts) == 4 and parts[:2] == ["api", "countries"] and parts[3] == "history":
+            return country_history(counts, parts[2])
+        if len(parts) == 4 and parts[:2] == ["api", "sports"] and parts[3] == "leaders":
+            season = query.get("season", [None])[0]
+            limit = _int_param(query, "limit", 10)
+            return sport_leaders(counts, parts[2], season=season, limit=limit)
+        if parts == ["api", "search"]:
+            from .search import search_index
+            kind = query.get("kind", [None])[0]
+            limit = _int_param(query, "limit", 10)
+            return search_index().search(query.get("q", [""])[0], kind=kind, limit=limit)
+        if parts == ["api", "scenarios"]:
+            from .scenarios import scenario_engine
+            try:
+                scenarios = json.loads(query.get("q", ["[]"])[0])
+            except ValueError as e:
+                raise BadRequest(f"q must be a JSON list of scenarios: {e}") from None
+            top = _int_param(query, "top", 10)
+            try:
+                table = scenario_engine().score(scenarios if isinstance(scenarios, list) else [scenarios])
+            except ValueError as e:            # check_scenario: unknown key / wrong type
+                raise BadRequest(str(e)) from None
+            return {name: part.head(top).drop(columns="scenario").round(3).to_dict(orient="records")
+                    for name, part in table.groupby("scenario", sort=False)}
+        return None
+
+    def _version(self, path):
+        """Dataset version, plus the files a route reads besides the store (search index, models)."""
+        route = path.strip("/")
+        if route == "api/search":
+            from .search import source_paths
+        elif route == "api/scenarios":
+            from .scenarios import source_paths
+        else:
+            return self.store.version
+        return self.store.version, datasets.file_version(source_paths())
+
+    @staticmethod
+    def _error(start_response, status, payload):
+        body = json.dumps(payload).encode()
+        start_response(status, [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+        return [body]
+
+    def __call__(self, environ, start_response):
+        if environ.get("REQUEST_METHOD", "GET") not in ("GET", "HEAD"):
+            start_response("405 Method Not Allowed", [("Allow", "GET, HEAD")])
+            return [b""]
+        path = environ.get("PATH_INFO", "/")
+        qs = environ.get("QUERY_STRING", "")
+
+        # health is never cached: it reports the cache itself
+        if path.rstrip("/") == "/api/health":
+            body = json.dumps(self._route(path, {})).encode()
+            start_response("200 OK", [("Content-Type", "application/json"),
+                                      ("Content-Length", str(len(body)))])
+            return [body]
+
+        key = (self._version(path), path, qs)
+        etag = '"' + hashlib.sha1(repr(key).encode()).hexdigest()[:16] + '"'
+        headers = [("ETag", etag), ("Cache-Control", "public, max-age=0, must-revalidate")]
+        if environ.get("HTTP_IF_NONE_MATCH") == etag:
+            start_response("304 Not Modified", headers)
+            return [b""]
+
+        cached = self.cache.get(key)
+        if cached is None:
+            try:
+                payload = self._route(path, parse_qs(qs))
+            except BadRequest as e:
+                return self._error(start_response, "400 Bad Request", {"error": str(e), "path": path})
+            if payload is None:
+                return self._error(start_response, "404 Not Found", {"error": "not found", "path": path})
+            cached = json.dumps(payload, default=str).encode()
+            self.cache.put(key, cached)
+
+        start_response("200 OK", headers + [("Content-Type", "application/json"),
+                                            ("Content-Length", str(len(cached)))])
+        return [b""] if environ.get("REQUEST_METHOD") == "HEAD" else [cached]
+
+
+if __name__ == "__main__":
+    import argparse
+    from wsgiref.simple_server import make_server
+
+    parser = argparse.ArgumentParser(description="Serve the medal API from data/clean")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--shared", action="store_true",
+                        help="serve the tables published by `python -m olympic_data.shared`")
+    args = parser.parse_args()
+
+    app = MedalApi(SharedDataStore() if args.shared else CleanDataStore())
+    print(f"Medal API on http://localhost:{args.port} (dataset {app.store.version})")
+    make_server("", args.port, app).serve_forever()
@@ -0,0 +1,166 @@
+# notebooks/olympic_data/athlete_index.py
+"""
+Athlete dimension: one integer `athlete_id` per athlete, shared by the
+athletes, medals and results tables.
+
+The identity key is the normalized slug of the olympics.com athlete URL
+("https://olympics.com/en/athletes/amos-mosaner" -> "amos-mosaner").
+Rows with no URL fall back to "name:<folded name>", except team lines
+(participant_type "GameTeam" without a URL), whose name is the team's
+("United States team") and which get no athlete_id. Ids are append-only:
+rebuilding against an existing dimension keeps every known id and gives
+new athletes max(id)+1, ...
+"""
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+DIM_COLS = ["athlete_id", "athlete_key", "athlete_name", "athlete_url", "name_key"]
+
+# (name column, url column) for each clean table
+ATHLETE_COLS = {
+    "athletes": ("athlete_full_name", "athlete_url"),
+    "results": ("athlete_full_name", "athlete_url"),
+    "medals": ("athlete", "athlete_url"),
+}
+
+
+# letters NFKD cannot decompose into base + accent
+_NON_DECOMPOSABLE = str.maketrans({"ø": "o", "Ø": "O", "æ": "ae", "Æ": "AE",
+                                   "ß": "ss", "đ": "d", "Đ": "D", "ł": "l", "Ł": "L",
+                                   "œ": "oe", "Œ": "OE", "þ": "th", "Þ": "Th"})
+
+
+def _fold(x):
+    x = unicodedata.normalize("NFKD", x.translate(_NON_DECOMPOSABLE))
+    return x.encode("ascii", "ignore").decode("ascii")
+
+
+def normalize_name(s):
+    """Accent-folded search key for a Series of names: 'Marit BJØRGEN' -> 'marit bjorgen'."""
+    s = s.astype("string").fillna("")
+    # fold each distinct name once; names repeat a lot across medal rows
+    uniq = pd.unique(s)
+    folded = pd.Series([_fold(x) for x in uniq], index=uniq, dtype="string")
+    s = s.map(folded).astype("string")
+    return s.str.lower().str.replace(r"[^a-z0-9]+", " ", regex=True).str.strip()
+
+
+def athlete_keys(names, urls):
+    """Identity key per row: URL slug when present, else 'name:<folded name>'; NA if neither."""
+    urls = urls.astype("string").str.strip()
+    slug = (urls.str.rstrip("/").str.rsplit("/", n=1).str[-1]
+                .str.normalize("NFC").str.lower())
+    slug = slug.where(urls.str.len() > 0)
+    name_key = normalize_name(names)
+    by_name = ("name:" + name_key).where(name_key.str.len() > 0)
+    return slug.fillna(by_name)
+
+
+def _row_keys(df, table):
+    """athlete_keys() for a clean table; NA for team lines without a URL."""
+    name_col, url_col = ATHLETE_COLS[table]
+    urls = df[url_col] if url_col in df.columns else pd.Series(pd.NA, index=df.index)
+    keys = athlete_keys(df[name_col], urls)
+    if "participant_type" in df.columns:
+        no_url = urls.astype("string").str.strip().fillna("").eq("")
+        keys = keys.mask(df["participant_type"].eq("GameTeam") & no_url)
+    return keys, urls
+
+
+def build_athlete_dim(frames, existing=None):
+    """
+    Build (or extend) the athlete dimension from several clean tables.
+
+    frames:   {table_name: DataFrame}, column names looked up in ATHLETE_COLS
+    existing: a previous dimension whose ids must be kept stable
+    """
+    parts = []
+    for table, df in frames.items():
+        name_col, url_col = ATHLETE_COLS[table]
+        if name_col not in df.columns:
+            continue
+        keys, urls = _row_keys(df, table)
+        keyed = pd.DataFrame({
+            "athlete_key": keys,
+            "athlete_name": df[name_col].astype("string"),
+            "athlete_url": urls.astype("string"),
+        })
+        parts.append(keyed.dropna(subset=["athlete_key"]))
+
+    seen = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=DIM_COLS[1:4])
+    # first non-empty name / url per key wins
+    seen = seen.sort_values(["athlete_key", "athlete_url"], na_position="last")
+    new = seen.drop_duplicates(subset=["athlete_key"]).reset_index(drop=True)
+
+    if existing is not None and len(existing):
+        existing = existing[DIM_COLS].copy()
+        new = new[~new["athlete_key"].isin(existing["athlete_key"])].reset_index(drop=True)
+        start = int(existing["athlete_id"].max()) + 1
+    else:
+        existing = None
+        start = 1
+
+    new = new.sort_values("athlete_key").reset_index(drop=True)
+    new.insert(0, "athlete_id", np.arange(start, start + len(new), dtype="int64"))
+    new["name_key"] = normalize_name(new["athlete_name"])
+    dim = new[DIM_COLS] if existing is None else pd.concat([existing, new[DIM_COLS]], ignore_index=True)
+    dim["athlete_id"] = dim["athlete_id"].astype("int64")
+    return dim
+
+
+def attach_athlete_id(df, table, dim, drop_strings=True):
+    """
+    Add `athlete_id` (Int64, NA for team lines with no athlete) to a clean table.
+
+    With drop_strings=True the repeated name / url columns are removed; join
+    `dim` on athlete_id to get them back.
+    """
+    name_col, url_col = ATHLETE_COLS[table]
+    keys, _ = _row_keys(df, table)
+    id_by_key = pd.Series(dim["athlete_id"].values, index=dim["athlete_key"].values)
+    out = df.copy()
+    pos = out.columns.get_loc(name_col)
+    out.insert(pos, "athlete_id", keys.map(id_by_key).astype("Int64"))
+    if drop_strings:
+        # team lines keep their display name in participant_title / country
+        out = out.drop(columns=[c for c in (name_col, url_col) if c in out.columns])
+    return out
+
+
+def with_athlete_names(df, dim, name_col="athlete_name"):
+    """Inverse of attach_athlete_id: bring the display name (and url) back for display."""
+    names = dim[["athlete_id", "athlete_name", "athlete_url"]].rename(columns={"athlete_name": name_col})
+    return df.merge(names, on="athlete_id", how="left")
+
+
+class AthleteNameIndex:
+    """
+    Sorted array of name keys, one entry per word start ("marit bjorgen",
+    "bjorgen"), so a prefix lookup on first name or surname is two binary
+    searches instead of a scan of the name column.
+    """
+
+    def __init__(self, dim):
+        names = dim["name_key"].fillna("").str.split(" ")
+        keys, ids = [], []
+        for athlete_id, words in zip(dim["athlete_id"].to_numpy(), names):
+            for i in range(len(words)):
+                if words[i]:
+                    keys.append(" ".join(words[i:]))
+                    ids.append(athlete_id)
+        keys = np.asarray(keys, dtype=str)
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.ids = np.asarray(ids, dtype="int64")[order]
+
+    def lookup(self, query, limit=20):
+        """athlete_ids with a name word starting with `query` (accent-folded too)."""
+        q = re.sub(r"[^a-z0-9]+", " ", _fold(query).lower()).strip()
+        if not q:
+            return self.ids[:0]
+        lo = np.searchsorted(self.keys, q, side="left")
+        hi = np.searchsorted(self.keys, q + "\uffff", side="left")
+        return pd.unique(self.ids[lo:hi])[:limit]
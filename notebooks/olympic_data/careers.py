@@ -0,0 +1,243 @@
+# notebooks/olympic_data/careers.py
+"""
+Athlete career statistics.
+
+    cd notebooks && python -m olympic_data.careers
+
+Two typed tables, keyed by athlete_key (athlete_index.athlete_keys):
+
+    athlete_games    one row per athlete and Games: year, season, games_slug, age
+    careers          one row per athlete: first/last year, n_games,
+                     career_years, age_first / age_last / age_2026,
+                     medals, medals_per_games, active_2026
+
+Appearances come from `games_participations` (the Games listed in it, or
+only a count in some exports), `first_game`, and the medal / result rows of
+the athlete. Everything is a groupby over the long table; there are no
+per-athlete loops.
+
+careers() and athlete_games() memoize in-process and cache to
+data/clean/olympic_athlete_careers.* / olympic_athlete_games.* (Parquet
+when pyarrow is installed, CSV with fixed dtypes otherwise), rebuilt only
+when a source table is newer.
+"""
+import pandas as pd
+
+from . import datasets, paths
+from .athlete_index import ATHLETE_COLS, athlete_keys
+
+UPCOMING_YEAR = 2026
+ACTIVE_SINCE = 2018          # competed at PyeongChang 2018 or Beijing 2022
+MAX_ACTIVE_AGE = 45
+MEDAL_COLS = ["gold", "silver", "bronze"]
+
+GAMES_DTYPES = {"athlete_key": "string", "year": "Int64", "season": "string",
+                "games_slug": "string", "age": "Int64"}
+CAREER_DTYPES = {
+    "athlete_key": "string", "athlete_name": "string", "athlete_year_birth": "Int64",
+    "first_year": "Int64", "last_year": "Int64", "last_winter_year": "Int64",
+    "n_games": "Int64", "career_years": "Int64",
+    "age_first": "Int64", "age_last": "Int64", "age_2026": "Int64",
+    "gold": "Int64", "silver": "Int64", "bronze": "Int64", "medals": "Int64",
+    "medals_per_games": "Float64", "active_2026": "boolean",
+}
+SOURCES = ["athletes", "medals", "results"]
+_memo = {}
+
+
+def _athlete_rows(medals):
+    """Medal rows of real athletes (team rows backfilled with "<Country> Team" have no URL)."""
+    team = medals["participant_type"].astype("string").str.lower().eq("gameteam").fillna(False)
+    no_url = medals["athlete_url"].astype("string").str.strip().fillna("").eq("")
+    return medals[~(team & no_url)]
+
+
+def _keyed(df, table):
+    name_col, url_col = ATHLETE_COLS[table]
+    return athlete_keys(df[name_col], df[url_col])
+
+
+def parse_participations(athletes):
+    """
+    games_participations / first_game -> (long table of athlete_key, year; listed count per key).
+
+    Exports either list the Games ("Beijing 2022, PyeongChang 2018") or just
+    give their number ("2"); both are handled.
+    """
+    key = _keyed(athletes, "athletes")
+    text = athletes["games_participations"].astype("string")
+    found = pd.concat([text, athletes["first_game"].astype("string")], keys=[0, 1]).str.extractall(
+        r"((?:18|19|20)\d{2})")[0]
+    rows = found.index.get_level_values(1)
+    years = pd.DataFrame({"athlete_key": key.to_numpy()[rows], "year": pd.to_numeric(found.to_numpy())})
+
+    count = pd.to_numeric(text, errors="coerce")
+    count = count.where(count < 50)             # a bare year is not a count
+    listed = pd.Series(count.to_numpy(), index=key.to_numpy()).groupby(level=0).max()
+    return years.drop_duplicates().astype({"year": "Int64"}), listed
+
+
+def _games_rows(df, table, slug_col):
+    out = pd.DataFrame({"athlete_key": _keyed(df, table), "year": df["year"],
+                        "season": df.get("season"), "games_slug": df[slug_col]})
+    return out.dropna(subset=["athlete_key"]).drop_duplicates()
+
+
+def build_athlete_games(athletes=None, medals=None, results=None, hosts=None):
+    """
+    One row per (athlete, Games) seen in any source, with the age that year.
+
+    Years only known from the athlete bio get their season / slug from
+    `hosts` when a single Games was held that year (always true since 1994).
+    """
+    parts = []
+    if medals is not None:
+        parts.append(_games_rows(_athlete_rows(medals), "medals", "games_slug"))
+    if results is not None:
+        parts.append(_games_rows(results, "results", "slug_game"))
+    seen = pd.concat(parts, ignore_index=True).drop_duplicates(["athlete_key", "games_slug"]) if parts \
+        else pd.DataFrame(columns=["athlete_key", "year", "season", "games_slug"])
+
+    if athletes is not None:
+        listed, _ = parse_participations(athletes)
+        # years only known from the athlete bio: keep those not already matched to a Games
+        listed = listed.merge(seen[["athlete_key", "year"]].drop_duplicates(), how="left", indicator=True)
+        listed = listed[listed["_merge"] == "left_only"].drop(columns="_merge")
+        if hosts is not None:
+            single = hosts[~hosts["year"].duplicated(keep=False)][["year", "season", "slug"]]
+            listed = listed.merge(single.rename(columns={"slug": "games_slug"}).astype({"year": "Int64"}),
+                                  on="year", how="left")
+        seen = pd.concat([seen, listed], ignore_index=True)
+
+    games = seen.dropna(subset=["athlete_key", "year"])
+    if athletes is not None:
+        birth = pd.Series(pd.to_numeric(athletes["athlete_year_birth"], errors="coerce").to_numpy(),
+                          index=_keyed(athletes, "athletes").to_numpy())
+        birth = birth[birth.index.notna()].groupby(level=0).first()
+        games = games.assign(age=games["year"].astype("Int64") - games["athlete_key"].map(birth).astype("Int64"))
+    else:
+        games = games.assign(age=pd.NA)
+    games = games[list(GAMES_DTYPES)].astype(GAMES_DTYPES)
+    return games.sort_values(["athlete_key", "year", "season"]).reset_index(drop=True)
+
+
+def build_careers(games, athletes=None, medals=None):
+    """Per-athlete career table from build_athlete_games() output."""
+    winter = games["season"].eq("Winter").fillna(games["year"].ge(1994) & games["year"].mod(4).eq(2))
+    per = games.groupby("athlete_key").agg(
+        first_year=("year", "min"), last_year=("year", "max"), n_games=("year", "size"),
+        age_first=("age", "min"), age_last=("age", "max"))
+    per["last_winter_year"] = games["year"].where(winter).groupby(games["athlete_key"]).max()
+
+    names = pd.Series(dtype="string")
+    birth = pd.Series(dtype="Int64")
+    medal_counts = pd.DataFrame(columns=MEDAL_COLS, dtype="Int64")
+    if medals is not None:
+        medals = _athlete_rows(medals)
+        m = pd.DataFrame({"athlete_key": _keyed(medals, "medals"), "name": medals["athlete"]})
+        for c in MEDAL_COLS:
+            m[c] = medals[c]
+        medal_counts = m.groupby("athlete_key")[MEDAL_COLS].sum()
+        names = m.drop_duplicates("athlete_key").set_index("athlete_key")["name"]
+    if athletes is not None:
+        a = pd.DataFrame({"athlete_key": _keyed(athletes, "athletes")}).assign(
+            name=athletes["athlete_full_name"].to_numpy(),
+            birth=pd.to_numeric(athletes["athlete_year_birth"], errors="coerce").to_numpy())
+        a = a.dropna(subset=["athlete_key"]).drop_duplicates("athlete_key").set_index("athlete_key")
+        names = a["name"].combine_first(names)
+        birth = a["birth"]
+        # the athlete bio has the career totals (medal rows may miss early Games)
+        bio = pd.DataFrame({c: pd.to_numeric(athletes.get(f"medal_{c}"), errors="coerce").to_numpy()
+                            for c in MEDAL_COLS}, index=_keyed(athletes, "athletes").to_numpy())
+        bio = bio[bio.index.notna()].groupby(level=0).max()
+        medal_counts = bio.combine_first(medal_counts) if not bio.dropna(how="all").empty else medal_counts
+        _, listed = parse_participations(athletes)
+        per["n_games"] = pd.concat([per["n_games"], listed.reindex(per.index)], axis=1).max(axis=1)
+
+    per = per.join(medal_counts.reindex(per.index).fillna(0))
+    per["athlete_name"] = names.reindex(per.index)
+    per["athlete_year_birth"] = birth.reindex(per.index)
+    per["medals"] = per[MEDAL_COLS].sum(axis=1)
+    per["career_years"] = per["last_year"] - per["first_year"]
+    per["medals_per_games"] = per["medals"] / per["n_games"]
+    per["age_2026"] = UPCOMING_YEAR - per["athlete_year_birth"]
+    per["active_2026"] = (per["last_winter_year"].ge(ACTIVE_SINCE).fillna(False)
+                          & per["age_2026"].le(MAX_ACTIVE_AGE).fillna(True))
+    out = per.reset_index()
+    return out[list(CAREER_DTYPES)].astype(CAREER_DTYPES)
+
+
+# ---------- cache ----------
+def _load_sources():
+    have = {t: datasets.load(t) for t in SOURCES if datasets.table_path(t).exists()}
+    if not have:
+        raise FileNotFoundError("No athletes, medals or results table in data/clean: run the cleaners first")
+    return have.get("athletes"), have.get("medals"), have.get("results"), datasets.load_hosts()
+
+
+def _cache_path(name):
+    try:
+        import pyarrow  # noqa: F401
+        return paths.CLEAN / f"olympic_{name}.parquet"
+    except ImportError:          # optional: CSV + fixed dtypes
+        return paths.CLEAN / f"olympic_{name}.csv"
+
+
+def _read_cached(path, dtypes):
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype={k: v for k, v in dtypes.items() if v != "boolean"}).astype(dtypes)
+
+
+def _write_cached(df, path):
+    if path.suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False, encoding="utf-8")
+
+
+def _cached(refresh=False):
+    if "careers" in _memo and not refresh:
+        return _memo["careers"], _memo["athlete_games"]
+    targets = {"careers": (_cache_path("athlete_careers"), CAREER_DTYPES),
+               "athlete_games": (_cache_path("athlete_games"), GAMES_DTYPES)}
+    sources = [datasets.table_path(t) for t in SOURCES if datasets.table_path(t).exists()]
+    newest = max((p.stat().st_mtime for p in sources), default=0)
+    fresh = all(p.exists() and p.stat().st_mtime >= newest for p, _ in targets.values())
+    if fresh and not refresh:
+        for name, (path, dtypes) in targets.items():
+            _memo[name] = _read_cached(path, dtypes)
+    else:
+        athletes, medals, results, hosts = _load_sources()
+        _memo["athlete_games"] = build_athlete_games(athletes, medals, results, hosts)
+        _memo["careers"] = build_careers(_memo["athlete_games"], athletes, medals)
+        for name, (path, _) in targets.items():
+            _write_cached(_memo[name], path)
+    return _memo["careers"], _memo["athlete_games"]
+
+
+def careers(refresh=False):
+    """Per-athlete career table (typed, cached; see module docstring)."""
+    return _cached(refresh)[0].copy()
+
+
+def athlete_games(refresh=False):
+    """Per-(athlete, Games) table with age at each Games (typed, cached)."""
+    return _cached(refresh)[1].copy()
+
+
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    c = careers(refresh=True)
+    t1 = time.perf_counter()
+    careers()
+    _memo.clear()
+    t2 = time.perf_counter()
+    careers()
+    t3 = time.perf_counter()
+    print(f"{len(c)} careers built in {t1 - t0:.2f}s; memo {1e3 * (t2 - t1):.2f}ms, "
+          f"from cache file {1e3 * (t3 - t2):.1f}ms -> {_cache_path('athlete_careers')}")
+    print(f"Active heading into 2026: {int(c['active_2026'].sum())}")
+    print(c.sort_values(["medals", "n_games"], ascending=False).head(10).to_string(index=False))
@@ -0,0 +1,88 @@
+# notebooks/olympic_data/charts.py
+"""
+Pre-aggregated chart series for the notebook and the webapp.
+
+Charts plot these small tables directly instead of aggregating the
+row-level data on every render:
+
+    games_per_country  country, season, games            (hosts)
+    medals_by_year     year, season, noc, gold..total    (awards)
+    host_effect        one row per Games: host NOC's medal share at home
+                       vs its average share at other Games of that season
+
+chart_series(name) memoizes in-process and caches each series as
+data/clean/charts/<name>.csv, rebuilt only when a source table is newer
+(served as is when every source table is missing).
+"""
+import pandas as pd
+
+from . import datasets, paths
+from .countries import host_nocs
+
+MEDAL_COLS = ["gold", "silver", "bronze"]
+_memo = {}
+
+
+def games_per_country(hosts):
+    out = hosts.groupby(["country", "season"]).size().rename("games").reset_index()
+    order = out.groupby("country")["games"].sum().sort_values(ascending=False)
+    out["country"] = pd.Categorical(out["country"], categories=order.index, ordered=True)
+    return out.sort_values(["country", "season"]).reset_index(drop=True)
+
+
+def medals_by_year(awards):
+    df = awards[["year", "season", "noc", "medal"]].copy()
+    for m in MEDAL_COLS:
+        df[m] = (df["medal"] == m.upper()).astype("int64")
+    out = df.groupby(["year", "season", "noc"], as_index=False)[MEDAL_COLS].sum()
+    out["total"] = out[MEDAL_COLS].sum(axis=1)
+    return out
+
+
+def host_effect(awards, hosts):
+    per = medals_by_year(awards)
+    per["share"] = per["total"] / per.groupby(["year", "season"])["total"].transform("sum")
+    h = host_nocs(hosts, awards)[["year", "season", "slug", "country", "host_noc"]]
+
+    home = h.merge(per, left_on=["year", "season", "host_noc"], right_on=["year", "season", "noc"], how="left")
+    # average share of the same NOC at every other Games of that season
+    others = h[["year", "season", "host_noc"]].merge(per, left_on=["season", "host_noc"], right_on=["season", "noc"],
+                                                     suffixes=("", "_other"))
+    others = others[others["year_other"] != others["year"]]
+    away = others.groupby(["year", "season", "host_noc"], as_index=False)["share"].mean()
+    out = home[["year", "season", "slug", "country", "host_noc", "total", "share"]].merge(
+        away.rename(columns={"share": "away_share"}), on=["year", "season", "host_noc"], how="left")
+    out = out.rename(columns={"total": "home_medals", "share": "home_share"})
+    out["home_medals"] = out["home_medals"].fillna(0).astype("int64")
+    out["home_share"] = out["home_share"].fillna(0.0)
+    out["lift"] = out["home_share"] / out["away_share"]
+    return out.sort_values(["year", "season"]).reset_index(drop=True)
+
+
+# name -> (builder, source tables)
+SERIES = {
+    "games_per_country": (lambda: games_per_country(datasets.load_hosts()), ["hosts"]),
+    "medals_by_year": (lambda: medals_by_year(datasets.load_awards()), ["awards", "medals"]),
+    "host_effect": (lambda: host_effect(datasets.load_awards(), datasets.load_hosts()), ["awards", "medals", "hosts"]),
+}
+
+
+def chart_series(name, refresh=False):
+    """Small pre-aggregated table for chart `name` (see SERIES)."""
+    if name in _memo and not refresh:
+        return _memo[name].copy()
+    build, sources = SERIES[name]
+    path = paths.CLEAN / "charts" / f"{name}.csv"
+    newest = max((datasets.table_path(t).stat().st_mtime for t in sources if datasets.table_path(t).exists()),
+                 default=None)
+    if newest is None and (refresh or not path.exists()):
+        raise FileNotFoundError(f"No source table for chart {name!r} ({', '.join(sources)}) in data/clean: "
+                                "run the cleaners first")
+    if not refresh and path.exists() and (newest is None or path.stat().st_mtime >= newest):
+        df = pd.read_csv(path)          # sources gone: the cached series is all there is
+    else:
+        df = build()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(path, index=False, encoding="utf-8")
+    _memo[name] = df
+    return df.copy()
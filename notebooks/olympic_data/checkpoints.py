@@ -0,0 +1,190 @@
+# notebooks/olympic_data/checkpoints.py
+"""
+Per-edition checkpoints of history-dependent state.
+
+Steps fold one Games at a time into a dict of small state tables
+(cumulative NOC medals, per-athlete medals, ratings, ...). After each
+edition, in olympic_hosts_clean.csv start-date order, the state is saved
+under models/checkpoints/<nn>_<slug>/ together with a fingerprint of that
+edition's input rows.
+
+On the next run the fingerprints are compared edition by edition:
+
+- nothing changed             -> load the last checkpoint, no work;
+- a new edition arrived       -> resume from the last checkpoint;
+- an old edition was corrected -> replay from that edition forward only.
+
+Checkpoint folders that match no edition of the current list (an edition
+removed, renamed or moved in the order) are pruned at the end of the run.
+"""
+import json
+import re
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from .paths import MODELS
+from .ratings import ranks_from_medals, update_ratings
+
+CHECKPOINTS = MODELS / "checkpoints"
+AWARD_KEY = ["year", "sport", "event", "medal", "noc"]
+MEDAL_FLAGS = ["gold", "silver", "bronze"]
+
+
+# ---------- steps: (state tables, one edition's medal rows) -> state tables ----------
+def noc_medals_step(state, rows):
+    """Cumulative medals per NOC (team medals counted once)."""
+    awards = rows.drop_duplicates(subset=AWARD_KEY)
+    per = awards.groupby("noc")[MEDAL_FLAGS].sum()
+    per["editions"] = 1
+    per["last_year"] = int(rows["year"].max())
+    prev = state.get("noc_medals")
+    if prev is not None:
+        prev = prev.set_index("noc")
+        per = prev.add(per.drop(columns="last_year"), fill_value=0).assign(
+            last_year=per["last_year"].combine_first(prev["last_year"]))
+    per["total"] = per[MEDAL_FLAGS].sum(axis=1)
+    per = per[MEDAL_FLAGS + ["total", "editions", "last_year"]].astype("int64")
+    return {**state, "noc_medals": per.reset_index()}
+
+
+def athlete_medals_step(state, rows):
+    """Cumulative medals and Games with a medal per athlete_id (skipped without athlete_id)."""
+    if "athlete_id" not in rows.columns:
+        return state
+    rows = rows[rows["athlete_id"].notna()]
+    per = rows.groupby("athlete_id")[MEDAL_FLAGS].sum()
+    per["medal_games"] = 1
+    prev = state.get("athlete_medals")
+    if prev is not None:
+        per = prev.set_index("athlete_id").add(per, fill_value=0)
+    per = per[MEDAL_FLAGS + ["medal_games"]].astype("int64")
+    return {**state, "athlete_medals": per.reset_index()}
+
+
+def ratings_step(state, rows):
+    """(sport, noc) Elo ratings from podium ranks (see ratings.py)."""
+    prev = state.get("ratings")
+    if prev is None:
+        prev = pd.DataFrame(columns=["sport", "noc", "rating", "events", "last_year"])
+    return {**state, "ratings": update_ratings(prev, ranks_from_medals(rows), regress=0.1)}
+
+
+DEFAULT_STEPS = [noc_medals_step, athlete_medals_step, ratings_step]
+
+
+# ---------- store ----------
+def edition_order(hosts):
+    """Games slugs in the order they were held (start date; Winter 1924 before Paris 1924)."""
+    h = hosts.copy()
+    h["start"] = pd.to_datetime(h["start_date"], utc=True, errors="coerce")
+    return h.sort_values(["start", "year", "slug"])["slug"].tolist()
+
+
+def fingerprint(rows):
+    """Order-independent hash of an edition's input rows."""
+    if rows.empty:
+        return "empty"
+    h = pd.util.hash_pandas_object(rows.reset_index(drop=True), index=False)
+    return f"{len(rows)}-{int(h.sum()) & 0xFFFFFFFFFFFFFFFF:016x}"
+
+
+class CheckpointStore:
+    def __init__(self, root=CHECKPOINTS):
+        self.root = Path(root)
+        self.manifest_path = self.root / "manifest.json"
+
+    def manifest(self):
+        if self.manifest_path.exists():
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        return {"steps": [], "editions": []}
+
+    def _dir(self, i, slug):
+        return self.root / f"{i:02d}_{slug}"
+
+    def save(self, i, slug, state):
+        d = self._dir(i, slug)
+        if d.exists():
+            shutil.rmtree(d)
+        d.mkdir(parents=True)
+        for name, table in state.items():
+            table.to_csv(d / f"{name}.csv", index=False, encoding="utf-8")
+
+    def load(self, i, slug):
+        d = self._dir(i, slug)
+        return {p.stem: pd.read_csv(p) for p in sorted(d.glob("*.csv"))}
+
+    def prune(self, editions):
+        """Remove the <nn>_<slug> folders that are not checkpoints of `editions` (in order)."""
+        keep = {self._dir(i, ed["slug"]).name for i, ed in enumerate(editions)}
+        if not self.root.exists():
+            return
+        for d in self.root.iterdir():
+            if d.is_dir() and re.fullmatch(r"\d{2,}_.+", d.name) and d.name not in keep:
+                shutil.rmtree(d, ignore_errors=True)
+
+    def write_manifest(self, steps, editions):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"steps": steps, "editions": editions}, indent=1), encoding="utf-8")
+        tmp.replace(self.manifest_path)
+
+
+def run_incremental(medals, hosts, steps=DEFAULT_STEPS, store=None, verbose=True):
+    """
+    Bring the checkpointed state up to date with `medals`; returns the final state dict.
+
+    medals needs games_slug and year (athlete_id is optional).
+    """
+    store = store or CheckpointStore()
+    order = [s for s in edition_order(hosts) if s in set(medals["games_slug"])]
+    by_slug = dict(tuple(medals.groupby("games_slug", sort=False)))
+    prints = [fingerprint(by_slug[s]) for s in order]
+
+    step_names = [f.__name__ for f in steps]
+    old = store.manifest()
+    old_eds = old["editions"] if old["steps"] == step_names else []
+
+    # first edition whose input differs from what its checkpoint was built on
+    start = 0
+    while (start < len(order) and start < len(old_eds)
+           and old_eds[start]["slug"] == order[start] and old_eds[start]["fingerprint"] == prints[start]):
+        start += 1
+
+    state = store.load(start - 1, order[start - 1]) if start else {}
+    if verbose:
+        if start == len(order):
+            print(f"Checkpoints up to date ({len(order)} editions), nothing to replay")
+        else:
+            print(f"Replaying {len(order) - start} edition(s) from {order[start]} "
+                  f"(resumed from {'scratch' if not start else order[start - 1]})")
+
+    editions = old_eds[:start]
+    for i in range(start, len(order)):
+        slug = order[i]
+        for step in steps:
+            state = step(state, by_slug[slug])
+        store.save(i, slug, state)
+        editions.append({"slug": slug, "fingerprint": prints[i]})
+        store.write_manifest(step_names, editions)   # a crash mid-replay keeps what is done
+
+    store.write_manifest(step_names, editions)
+    store.prune(editions)
+    return state
+
+
+if __name__ == "__main__":
+    import time
+
+    from .datasets import load_athlete_dim, load_hosts, load_medals, table_path
+    from .athlete_index import attach_athlete_id
+
+    medals = load_medals()
+    if table_path("athlete_dim").exists():
+        medals = attach_athlete_id(medals, "medals", load_athlete_dim(), drop_strings=False)
+
+    t0 = time.perf_counter()
+    state = run_incremental(medals, load_hosts())
+    print(f"Done in {time.perf_counter() - t0:.2f}s; state tables: "
+          + ", ".join(f"{k} ({len(v)} rows)" for k, v in state.items()))
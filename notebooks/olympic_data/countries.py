@@ -0,0 +1,73 @@
+# notebooks/olympic_data/countries.py
+"""Country name <-> NOC resolution shared by the host and chart tables."""
+import pandas as pd
+
+# host-country names (olympic_hosts_clean.csv) that differ from the medal feeds
+HOST_NOC = {
+    "United States": "USA",
+    "United Kingdom": "GBR",
+    "USSR": "URS",
+    "Russia": "RUS",
+    "China": "CHN",
+    "South Korea": "KOR",
+    "Federal Republic of Germany": "FRG",
+    "Australia, Sweden": "AUS",   # Melbourne 1956, equestrian held in Stockholm
+}
+
+
+# NOC codes that can no longer enter a Games (dissolved states, one-off teams and
+# Russia's neutral names, whose athletes do not compete as a nation in 2026)
+DEFUNCT_NOCS = {
+    "URS", "EUN", "GDR", "FRG", "EUA", "TCH", "YUG", "SCG", "BOH", "ANZ", "UAR", "RU1",
+    "ROC", "OAR", "IOP", "MIX",
+}
+
+
+def country_to_noc(awards):
+    """Country name -> NOC, taking the NOC a name was most often awarded under."""
+    pairs = awards.groupby(["country", "noc"]).size().rename("n").reset_index()
+    best = pairs.sort_values("n", ascending=False).drop_duplicates("country")
+    return pd.Series(best["noc"].values, index=best["country"].values)
+
+
+def host_nocs(hosts, awards):
+    """hosts with a `host_noc` column (NA when the host never appears in the medal feed)."""
+    by_name = country_to_noc(awards)
+    out = hosts.copy()
+    out["host_noc"] = out["country"].map(HOST_NOC).fillna(out["country"].map(by_name))
+    return out
+
+
+# land borders of the host NOCs (as NOC codes of the time); made symmetric by neighbour_pairs()
+HOST_NEIGHBOURS = {
+    "AUT": ["GER", "FRG", "CZE", "TCH", "SVK", "HUN", "SLO", "YUG", "ITA", "SUI", "LIE"],
+    "BEL": ["FRA", "NED", "GER", "FRG", "LUX"],
+    "BRA": ["ARG", "URU", "PAR", "BOL", "PER", "COL", "VEN", "GUY", "SUR"],
+    "CAN": ["USA"],
+    "CHN": ["RUS", "URS", "MGL", "KAZ", "KGZ", "TJK", "AFG", "PAK", "IND", "NEP", "BHU", "MYA", "LAO", "VIE", "PRK"],
+    "ESP": ["FRA", "POR", "AND"],
+    "FIN": ["SWE", "NOR", "RUS", "URS"],
+    "FRA": ["BEL", "LUX", "GER", "FRG", "SUI", "ITA", "ESP", "AND", "MON"],
+    "FRG": ["DEN", "GDR", "TCH", "AUT", "SUI", "FRA", "LUX", "BEL", "NED"],
+    "GBR": ["IRL"],
+    "GER": ["DEN", "POL", "CZE", "TCH", "AUT", "SUI", "FRA", "LUX", "BEL", "NED"],
+    "GRE": ["ALB", "MKD", "BUL", "TUR", "YUG"],
+    "ITA": ["FRA", "SUI", "AUT", "SLO", "YUG", "SMR"],
+    "KOR": ["PRK"],
+    "MEX": ["USA", "GUA", "BIZ"],
+    "NED": ["BEL", "GER", "FRG"],
+    "NOR": ["SWE", "FIN", "RUS", "URS"],
+    "RUS": ["NOR", "FIN", "EST", "LAT", "LTU", "BLR", "UKR", "GEO", "AZE", "KAZ", "CHN", "MGL", "PRK", "POL"],
+    "SUI": ["FRA", "GER", "FRG", "ITA", "AUT", "LIE"],
+    "SWE": ["NOR", "FIN"],
+    "URS": ["NOR", "FIN", "POL", "TCH", "HUN", "ROU", "TUR", "IRI", "AFG", "CHN", "MGL", "PRK"],
+    "USA": ["CAN", "MEX"],
+    "YUG": ["ITA", "AUT", "HUN", "ROU", "BUL", "GRE", "ALB"],
+}
+
+
+def neighbour_pairs(neighbours=HOST_NEIGHBOURS):
+    """(noc, neighbour) pairs in both directions."""
+    a = pd.DataFrame([(k, v) for k, vs in neighbours.items() for v in vs], columns=["noc", "neighbour"])
+    both = pd.concat([a, a.rename(columns={"noc": "neighbour", "neighbour": "noc"})])
+    return both.drop_duplicates().reset_index(drop=True)
@@ -0,0 +1,145 @@
+# notebooks/olympic_data/datasets.py
+"""
+Lazy, memoized loaders for the clean tables.
+
+    from olympic_data import load_medals
+    winter = load_medals(season="Winter", years=(1994, 2022), columns=["year", "noc", "medal"])
+
+Nothing is read (and pandas is not imported) until a loader is called. Each
+table is read once per process; later calls filter / select from memory.
+When a season/year filter is given and a partitioned copy exists
+(partition_clean_tables.py), only the matching partitions are read.
+Loaders return copies, so callers may modify the result freely.
+"""
+from . import paths
+
+# table -> file in data/clean
+TABLES = {
+    "hosts": "olympic_hosts_clean.csv",
+    "medals": "olympic_medals_clean_v2.csv",
+    "awards": "olympic_medal_awards_v2.csv",
+    "results": "olympic_results_clean.csv",
+    "results_awards": "olympic_results_awards.csv",
+    "athletes": "olympic_athletes_clean.csv",
+    "athlete_dim": "olympic_athlete_dim.csv",
+}
+# tables that get a `season` column from the Games slug
+SEASONED = {"medals", "awards", "results", "results_awards"}
+
+_cache = {}
+
+
+def table_path(table):
+    return paths.CLEAN / TABLES[table]
+
+
+def file_version(files):
+    """(name, size, mtime_ns) of each file, None for missing ones: changes whenever a file is rewritten."""
+    out = []
+    for f in files:
+        st = f.stat() if f.exists() else None
+        out.append((f.name, st.st_size, st.st_mtime_ns) if st else (f.name, None))
+    return tuple(out)
+
+
+def clear_cache():
+    """Forget every table read so far (e.g. after re-running a cleaner)."""
+    _cache.clear()
+
+
+def _season_key(season):
+    """"Winter" / ["Winter", "Summer"] -> a sorted tuple (hashable, same key whatever the order)."""
+    if season is None:
+        return None
+    return (season,) if isinstance(season, str) else tuple(sorted(season))
+
+
+def _years_key(years):
+    if years is None:
+        return None
+    return ("range", *years) if isinstance(years, tuple) else ("in", *sorted(years))
+
+
+def _read(table, season=None, years=None):
+    import pandas as pd
+    from .partitioned import attach_games_slug, attach_season, read_partitioned
+
+    season = _season_key(season)
+    use_parts = (season is not None or years is not None) and (paths.PARTITIONED / table).exists()
+    key = (table, season if use_parts else None, _years_key(years) if use_parts else None)
+    if key in _cache:
+        return _cache[key]
+
+    if use_parts:
+        df = read_partitioned(table, season=season, years=years, root=paths.PARTITIONED)
+    else:
+        path = table_path(table)
+        if not path.exists():
+            raise FileNotFoundError(f"{path} not found: run the cleaning script for {table!r} first")
+        df = pd.read_csv(path)
+        if table == "awards":
+            df = attach_games_slug(df, _read("medals"))
+        if table in SEASONED:
+            df = attach_season(df, _read("hosts"))
+    _cache[key] = df
+    return df
+
+
+def load(table, columns=None, season=None, years=None, **filters):
+    """
+    Load a clean table.
+
+    columns: list of columns to keep
+    season:  "Winter" / "Summer" (or a list)
+    years:   (first, last) inclusive, or an iterable of years
+    filters: column=value or column=[values], e.g. noc="NOR"
+    """
+    if table not in TABLES:
+        raise KeyError(f"Unknown table {table!r}; expected one of {sorted(TABLES)}")
+    df = _read(table, season=season, years=years)
+
+    masks = []
+    if season is not None and "season" in df.columns:
+        masks.append(df["season"].isin([season] if isinstance(season, str) else list(season)))
+    if years is not None:
+        if isinstance(years, tuple):
+            lo, hi = years
+            masks.append(df["year"].between(lo if lo is not None else -1, hi if hi is not None else 9999))
+        else:
+            masks.append(df["year"].isin(list(years)))
+    for col, value in filters.items():
+        masks.append(df[col].isin([value] if isinstance(value, (str, int)) else list(value)))
+
+    out = df
+    if masks:
+        mask = masks[0]
+        for m in masks[1:]:
+            mask &= m
+        out = df[mask.fillna(False)].reset_index(drop=True)
+    if columns is not None:
+        out = out[list(columns)]
+    return out.copy()
+
+
+def load_hosts(columns=None, **filters):
+    return load("hosts", columns=columns, **filters)
+
+
+def load_medals(columns=None, season=None, years=None, **filters):
+    return load("medals", columns=columns, season=season, years=years, **filters)
+
+
+def load_awards(columns=None, season=None, years=None, **filters):
+    return load("awards", columns=columns, season=season, years=years, **filters)
+
+
+def load_results(columns=None, season=None, years=None, **filters):
+    return load("results", columns=columns, season=season, years=years, **filters)
+
+
+def load_athletes(columns=None, **filters):
+    return load("athletes", columns=columns, **filters)
+
+
+def load_athlete_dim(columns=None, **filters):
+    return load("athlete_dim", columns=columns, **filters)
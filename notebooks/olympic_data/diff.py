@@ -0,0 +1,271 @@
+# notebooks/olympic_data/diff.py
+"""
+Row / column diff between two versions of a clean table, and a change-volume gate.
+
+    cd notebooks && python -m olympic_data.diff medals                 # data/clean vs last commit
+    cd notebooks && python -m olympic_data.diff medals --old ../data/clean/olympic_medals_clean.csv
+    cd notebooks && python -m olympic_data.diff awards --gate          # exit 1 if too much changed
+
+Rows are matched on the table's key (KEYS), hashed to one uint64 per row;
+repeated keys are told apart by their occurrence number, counted in the
+order of the hash of the whole row, so reordering a file does not change
+which rows match. Matched rows are
+compared column by column on value hashes (NaN == NaN), so the cost is a
+few vectorized passes whatever the table size. Key values are put in a
+canonical form first, so a year read as 2022.0 in one file matches 2022.
+
+The fetch gate (snapshot_tables / check_tables) does not keep whole tables
+in memory: each file is read in chunks of CHUNK_ROWS rows and reduced to
+table_digest(), one uint64 per cell plus the row key, and two digests are
+compared the same way (DigestDiff).
+"""
+import io
+import subprocess
+
+import numpy as np
+import pandas as pd
+
+from . import datasets, paths
+
+KEYS = {
+    "hosts": ["slug"],
+    "medals": ["games_slug", "sport", "event", "event_gender", "medal", "noc",
+               "athlete_url", "athlete", "participant_title"],
+    "awards": ["year", "sport", "event", "medal", "noc"],
+    "results": ["slug_game", "discipline_title", "event_title", "country_3_letter_code", "athlete_url"],
+    "results_awards": ["year", "sport", "event", "medal", "noc"],
+    "athletes": ["athlete_url", "athlete_full_name"],
+    "athlete_dim": ["athlete_id"],
+}
+# gate: largest share of the old row count that may be added / removed / changed in one run
+GATES = {"added": 0.10, "removed": 0.02, "changed": 0.05}
+_OCC_MIX = np.uint64(0x9E3779B97F4A7C15)
+CHUNK_ROWS = 100_000                     # rows per read_csv chunk in table_digest
+
+
+def _canon(s):
+    """Floats holding whole numbers -> Int64, so int and float copies of a column compare equal."""
+    if pd.api.types.is_float_dtype(s):
+        v = s.dropna()
+        if len(v) == 0 or (v == np.round(v)).all():
+            return s.astype("Int64")
+    return s
+
+
+def _value_hash(s):
+    return pd.util.hash_pandas_object(_canon(s), index=False).to_numpy()
+
+
+def _canon_text(s):
+    """Values as text, whole floats without '.0': the same whatever dtype a chunk was read as."""
+    out = s.astype("string")
+    if pd.api.types.is_float_dtype(s):
+        whole = (s == np.round(s)).to_numpy()
+        out[whole] = s[whole].astype("int64").astype("string")
+    return out
+
+
+def _key_columns(columns, key):
+    cols = [c for c in key if c in columns]
+    if not cols:
+        raise KeyError(f"None of the key columns {key} are present")
+    return cols
+
+
+def _number_repeats(h, row_hash):
+    """The n-th repeat of a key hash gets its own hash; repeats are numbered in row-content order, not file order."""
+    dup = pd.Series(h).duplicated(keep=False).to_numpy()
+    if not dup.any():
+        return h
+    order = np.lexsort((row_hash(dup), h[dup]))
+    occ = np.zeros(len(h), dtype=np.uint64)
+    pos = np.flatnonzero(dup)[order]
+    occ[pos] = pd.Series(h[pos]).groupby(h[pos]).cumcount().to_numpy().astype(np.uint64)
+    return h ^ (occ * _OCC_MIX)
+
+
+def key_hash(df, key):
+    """One uint64 per row from the key columns; the n-th repeat of a key gets its own hash."""
+    cols = _key_columns(df.columns, key)
+    h = pd.util.hash_pandas_object(df[cols].apply(_canon), index=False).to_numpy()
+    return _number_repeats(h, lambda dup: pd.util.hash_pandas_object(df[dup].apply(_canon), index=False).to_numpy())
+
+
+def table_digest(path, key, chunksize=CHUNK_ROWS):
+    """
+    A CSV table reduced to hashes, read `chunksize` rows at a time: one uint64
+    per cell, indexed by the row's key hash (repeats numbered as in key_hash).
+    """
+    cells, keys = [], []
+    for chunk in pd.read_csv(path, chunksize=chunksize, low_memory=False):
+        h = pd.DataFrame({c: pd.util.hash_pandas_object(_canon_text(chunk[c]), index=False).to_numpy()
+                          for c in chunk.columns})
+        keys.append(pd.util.hash_pandas_object(h[_key_columns(h.columns, key)], index=False).to_numpy())
+        cells.append(h)
+    cells = pd.concat(cells, ignore_index=True)
+    row = pd.util.hash_pandas_object(cells, index=False).to_numpy()
+    cells.index = _number_repeats(np.concatenate(keys), lambda dup: row[dup])
+    return cells
+
+
+def _match(ho, hn):
+    """Key hashes old / new -> (removed, matched old, matched new, added) row positions."""
+    match = pd.Index(hn).get_indexer(ho)                # one hash-table lookup, -1 when the key is gone
+    old_pos = np.flatnonzero(match >= 0)
+    seen = np.zeros(len(hn), dtype=bool)
+    seen[match[old_pos]] = True
+    return np.flatnonzero(match < 0), old_pos, match[old_pos], np.flatnonzero(~seen)
+
+
+class _Report:
+    """summary / violations / report, shared by TableDiff and DigestDiff."""
+
+    def summary(self):
+        return {
+            "rows_old": self.rows_old, "rows_new": self.rows_new,
+            "added": len(self.added_pos), "removed": len(self.removed_pos),
+            "changed": self.changed_rows, "unchanged": len(self.old_pos) - self.changed_rows,
+            "columns_added": self.columns_added, "columns_removed": self.columns_removed,
+        }
+
+    def violations(self, gates=GATES):
+        """Gate messages (empty when the change volume is within `gates`)."""
+        s = self.summary()
+        base = max(s["rows_old"], 1)
+        out = [f"{what}: {s[what]} rows ({s[what] / base:.1%}) > {limit:.0%}"
+               for what, limit in gates.items() if s[what] / base > limit]
+        if self.columns_removed:
+            out.append(f"columns removed: {self.columns_removed}")
+        return out
+
+    def report(self):
+        s = self.summary()
+        lines = [f"rows {s['rows_old']} -> {s['rows_new']}: +{s['added']} added, -{s['removed']} removed, "
+                 f"~{s['changed']} changed, {s['unchanged']} unchanged (key: {', '.join(self.key)})"]
+        if self.columns_added or self.columns_removed:
+            lines.append(f"columns added {self.columns_added}, removed {self.columns_removed}")
+        changed = self.column_changes[self.column_changes > 0]
+        if len(changed):
+            lines.append("changed values per column:")
+            lines += [f"  {c:24s} {n}" for c, n in changed.items()]
+        return "\n".join(lines)
+
+
+class TableDiff(_Report):
+    """Compare `old` and `new` versions of a table on `key` (see module docstring)."""
+
+    def __init__(self, old, new, key):
+        self.old, self.new = old.reset_index(drop=True), new.reset_index(drop=True)
+        self.rows_old, self.rows_new = len(self.old), len(self.new)
+        self.key = [c for c in key if c in old.columns and c in new.columns]
+        self.columns_added = [c for c in new.columns if c not in old.columns]
+        self.columns_removed = [c for c in old.columns if c not in new.columns]
+
+        ho, hn = key_hash(self.old, self.key), key_hash(self.new, self.key)
+        self.removed_pos, self.old_pos, self.new_pos, self.added_pos = _match(ho, hn)
+
+        common = [c for c in self.old.columns if c in self.new.columns and c not in self.key]
+        self.changed_mask = pd.DataFrame(index=pd.RangeIndex(len(self.old_pos)))
+        for c in common:
+            a, b = self.old[c], self.new[c]
+            if _canon(a).dtype != _canon(b).dtype:
+                a, b = a.astype("string"), b.astype("string")
+            self.changed_mask[c] = _value_hash(a)[self.old_pos] != _value_hash(b)[self.new_pos]
+        self.column_changes = self.changed_mask.sum().astype("int64").sort_values(ascending=False)
+        self.changed_rows = int(self.changed_mask.any(axis=1).sum()) if common else 0
+
+    @property
+    def added(self):
+        return self.new.iloc[self.added_pos]
+
+    @property
+    def removed(self):
+        return self.old.iloc[self.removed_pos]
+
+    def changes(self, column, limit=20):
+        """Key + old / new values of the matched rows where `column` changed."""
+        pos = np.flatnonzero(self.changed_mask[column].to_numpy())[:limit]
+        out = self.old[self.key].iloc[self.old_pos[pos]].reset_index(drop=True)
+        out["old"] = self.old[column].iloc[self.old_pos[pos]].to_numpy()
+        out["new"] = self.new[column].iloc[self.new_pos[pos]].to_numpy()
+        return out
+
+
+class DigestDiff(_Report):
+    """TableDiff counts between two table_digest()s (hashes only, so no row values to show)."""
+
+    def __init__(self, old, new, key):
+        self.rows_old, self.rows_new = len(old), len(new)
+        self.key = [c for c in key if c in old.columns and c in new.columns]
+        self.columns_added = [c for c in new.columns if c not in old.columns]
+        self.columns_removed = [c for c in old.columns if c not in new.columns]
+        self.removed_pos, self.old_pos, self.new_pos, self.added_pos = _match(old.index, new.index)
+
+        common = [c for c in old.columns if c in new.columns and c not in self.key]
+        changed = old[common].to_numpy()[self.old_pos] != new[common].to_numpy()[self.new_pos]
+        self.column_changes = pd.Series(changed.sum(axis=0), index=common, dtype="int64").sort_values(ascending=False)
+        self.changed_rows = int(changed.any(axis=1).sum())
+
+
+def diff_tables(old, new, table=None, key=None):
+    return TableDiff(old, new, key or KEYS[table])
+
+
+def snapshot_tables(tables=None, chunksize=CHUNK_ROWS):
+    """Digests of the clean tables as they are now, to compare after a pipeline run ({table: table_digest})."""
+    tables = tables or list(KEYS)
+    return {t: table_digest(datasets.table_path(t), KEYS[t], chunksize)
+            for t in tables if datasets.table_path(t).exists()}
+
+
+def check_tables(before, gates=GATES, chunksize=CHUNK_ROWS):
+    """Diff every snapshotted table against data/clean; returns {table: gate messages} for the failures."""
+    failed = {}
+    for table, old in before.items():
+        path = datasets.table_path(table)
+        if not path.exists():
+            failed[table] = ["table disappeared"]
+            continue
+        d = DigestDiff(old, table_digest(path, KEYS[table], chunksize), KEYS[table])
+        print(f"[{table}] {d.report()}")
+        if problems := d.violations(gates):
+            failed[table] = problems
+    return failed
+
+
+def read_committed(table, rev="HEAD"):
+    """The version of a clean table committed at `rev` (via git show)."""
+    rel = datasets.table_path(table).relative_to(paths.ROOT).as_posix()
+    blob = subprocess.run(["git", "show", f"{rev}:{rel}"], cwd=paths.ROOT, capture_output=True)
+    if blob.returncode:
+        raise FileNotFoundError(f"{rel} is not in git at {rev}: pass --old explicitly")
+    return pd.read_csv(io.BytesIO(blob.stdout), low_memory=False)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(description="Diff two versions of a clean table")
+    parser.add_argument("table", choices=sorted(KEYS))
+    parser.add_argument("--old", help="old CSV (default: the committed version)")
+    parser.add_argument("--new", help="new CSV (default: data/clean)")
+    parser.add_argument("--rev", default="HEAD", help="git revision for the default old version")
+    parser.add_argument("--gate", action="store_true", help="exit 1 when the change volume exceeds GATES")
+    parser.add_argument("--show", type=int, default=5, help="sample changed values per column")
+    args = parser.parse_args()
+
+    old = pd.read_csv(args.old, low_memory=False) if args.old else read_committed(args.table, args.rev)
+    new = pd.read_csv(args.new or datasets.table_path(args.table), low_memory=False)
+    t0 = time.perf_counter()
+    d = diff_tables(old, new, args.table)
+    print(f"[{args.table}] diffed in {time.perf_counter() - t0:.2f}s")
+    print(d.report())
+    for c in d.column_changes[d.column_changes > 0].index[:5] if args.show else []:
+        print(f"\n{c}:\n{d.changes(c, args.show).to_string(index=False)}")
+    problems = d.violations()
+    if problems:
+        print("\nGate:", "; ".join(problems))
+        if args.gate:
+            sys.exit(1)
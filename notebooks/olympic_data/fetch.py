@@ -0,0 +1,201 @@
+# notebooks/olympic_data/fetch.py
+"""
+Fetch / refresh stage for the raw feeds in data/raw.
+
+    cd notebooks && python -m olympic_data.fetch            # download + re-run affected cleaners
+    cd notebooks && python -m olympic_data.fetch --no-clean
+
+URLs come from data/raw/sources.json (or the file named by
+OLYMPIC_SOURCES), e.g.
+
+    {"olympic_hosts.xml": "https://example.org/olympic_hosts.xml", ...}
+
+All feeds are downloaded concurrently (asyncio, one worker thread per
+request). Each request is conditional: the ETag / Last-Modified of the
+previous download, kept in data/raw/.mirror.json, is sent back as
+If-None-Match / If-Modified-Since, so an unchanged feed answers 304 and
+is not transferred. Files are replaced atomically (a failed download
+leaves neither the old file changed nor a .part behind), and the command
+exits non-zero when a feed failed. Only the cleaners that
+read a changed feed (and the ones downstream of them) are re-run, and the
+clean tables are then diffed against their previous version: the run fails
+when more rows changed than olympic_data.diff.GATES allows (--no-gate to skip),
+and data/clean is put back as it was before the run.
+
+Any HTTP server works as a stand-in for tests, e.g.
+`python -m http.server` in a folder holding the four raw files
+(it answers If-Modified-Since with 304).
+"""
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from . import paths
+
+NOTEBOOKS = Path(__file__).resolve().parents[1]
+MIRROR_STATE = ".mirror.json"
+
+# raw file -> cleaners that read it
+CLEANERS = {
+    "olympic_hosts.xml": ["clean_olympic_hosts.py"],
+    "olympic_medals.xlsx": ["clean_olympic_medals.py", "patch_medals_v2.py"],
+    "olympic_results.html": ["clean_olympic_results.py"],
+    "olympic_athletes.json": ["clean_olympic_athletes.py"],
+}
+# pipeline order; a re-run cleaner also re-runs everything that reads its output
+PIPELINE = ["clean_olympic_hosts.py", "clean_olympic_medals.py", "patch_medals_v2.py",
+            "clean_olympic_results.py", "clean_olympic_athletes.py", "partition_clean_tables.py"]
+DOWNSTREAM = {
+    "clean_olympic_hosts.py": ["clean_olympic_medals.py", "patch_medals_v2.py", "clean_olympic_results.py"],
+    "clean_olympic_medals.py": ["patch_medals_v2.py"],
+    "patch_medals_v2.py": ["partition_clean_tables.py"],
+    "clean_olympic_results.py": ["partition_clean_tables.py"],
+}
+
+
+def load_sources(path=None):
+    path = Path(path or os.environ.get("OLYMPIC_SOURCES") or paths.RAW / "sources.json")
+    if not path.exists():
+        raise FileNotFoundError(f"No feed URLs configured: create {path} ({{'<raw file>': '<url>'}})")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _read_state(raw):
+    p = raw / MIRROR_STATE
+    return json.loads(p.read_text(encoding="utf-8")) if p.exists() else {}
+
+
+def _write_state(raw, state):
+    p = raw / MIRROR_STATE
+    tmp = p.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=1, sort_keys=True), encoding="utf-8")
+    tmp.replace(p)
+
+
+def _get(name, url, known, raw, timeout):
+    """Blocking conditional GET of one feed; returns (name, status, validators)."""
+    target = raw / name
+    req = urllib.request.Request(url, headers={"User-Agent": "olympic-prediction-fetch"})
+    if target.exists():
+        if known.get("etag"):
+            req.add_header("If-None-Match", known["etag"])
+        if known.get("last_modified"):
+            req.add_header("If-Modified-Since", known["last_modified"])
+    tmp = target.with_name(target.name + ".part")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            with open(tmp, "wb") as f:
+                while chunk := resp.read(1 << 20):
+                    f.write(chunk)
+            expected = resp.headers.get("Content-Length")
+            if expected is not None and tmp.stat().st_size != int(expected):
+                return name, f"error truncated ({tmp.stat().st_size}/{expected} bytes)", known
+            tmp.replace(target)
+            validators = {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified"),
+                          "url": url}
+            return name, "updated", validators
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return name, "unchanged", known
+        return name, f"error {e.code}", known
+    except (urllib.error.URLError, TimeoutError, OSError) as e:      # incl. a connection cut mid-body
+        return name, f"error {e}", known
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+async def fetch_all(sources, raw=None, concurrency=4, timeout=60):
+    """Download every feed concurrently; returns {raw file: 'updated' | 'unchanged' | 'error ...'}."""
+    raw = Path(raw or paths.RAW)
+    raw.mkdir(parents=True, exist_ok=True)
+    state = _read_state(raw)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(name, url):
+        known = state.get(name, {}) if state.get(name, {}).get("url") == url else {}
+        async with sem:
+            return await asyncio.to_thread(_get, name, url, known, raw, timeout)
+
+    results = await asyncio.gather(*(one(n, u) for n, u in sources.items()))
+    status = {}
+    for name, st, validators in results:
+        status[name] = st
+        if st == "updated":
+            state[name] = validators
+    _write_state(raw, state)
+    return status
+
+
+def affected_cleaners(changed):
+    """Cleaner scripts to re-run for the changed raw files, in pipeline order."""
+    todo = {s for name in changed for s in CLEANERS.get(name, [])}
+    frontier = list(todo)
+    while frontier:
+        for s in DOWNSTREAM.get(frontier.pop(), []):
+            if s not in todo:
+                todo.add(s)
+                frontier.append(s)
+    return [s for s in PIPELINE if s in todo]
+
+
+def run_cleaners(scripts, gate=True):
+    """
+    Run the cleaners; with `gate`, fail when a clean table changed more than
+    diff.GATES allows. data/clean is copied aside first and put back as it
+    was when the gate (or a cleaner) fails.
+    """
+    from .diff import check_tables, snapshot_tables
+
+    before = snapshot_tables() if gate else {}
+    backup = paths.CLEAN.with_name(paths.CLEAN.name + ".before-run")
+    if before:
+        shutil.rmtree(backup, ignore_errors=True)
+        shutil.copytree(paths.CLEAN, backup)
+    try:
+        for script in scripts:
+            print(f"\n>>> {script}")
+            subprocess.run([sys.executable, script], cwd=NOTEBOOKS, check=True)
+        if before:
+            print("\n>>> change report")
+            failed = check_tables(before)
+            if failed:
+                raise SystemExit("Unexpected change volume, data/clean restored: " + "; ".join(
+                    f"{t}: {', '.join(p)}" for t, p in failed.items()))
+    except BaseException:
+        if before:
+            shutil.rmtree(paths.CLEAN, ignore_errors=True)
+            backup.rename(paths.CLEAN)
+        raise
+    finally:
+        shutil.rmtree(backup, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Refresh data/raw from the configured feeds")
+    parser.add_argument("--sources", help="JSON file of {raw file: url}")
+    parser.add_argument("--no-clean", action="store_true", help="only download")
+    parser.add_argument("--no-gate", action="store_true", help="do not check the change volume of the clean tables")
+    args = parser.parse_args()
+
+    status = asyncio.run(fetch_all(load_sources(args.sources)))
+    for name, st in status.items():
+        print(f" {name:24s} {st}")
+    changed = [n for n, st in status.items() if st == "updated"]
+    scripts = affected_cleaners(changed)
+    if not scripts:
+        print("Nothing changed, no cleaner to run")
+    elif args.no_clean:
+        print("Would run:", ", ".join(scripts))
+    else:
+        run_cleaners(scripts, gate=not args.no_gate)
+    failed = [n for n, st in status.items() if st.startswith("error")]
+    if failed:
+        raise SystemExit(f"{len(failed)} feed(s) failed: {', '.join(failed)}")
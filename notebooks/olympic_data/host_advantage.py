@@ -0,0 +1,112 @@
+# notebooks/olympic_data/host_advantage.py
+"""
+Host-advantage features per (NOC, Games).
+
+    cd notebooks && python -m olympic_data.host_advantage
+
+One row per NOC and Games of a season, for every NOC that won a medal at
+that season's Games (rows start at the NOC's first medal), plus the
+upcoming Games. NOCs that no longer exist (countries.DEFUNCT_NOCS: URS,
+GDR, ROC, ...) stop at their last medal instead of running on with zeros:
+
+    is_host            the NOC hosts these Games
+    games_since_host   editions of the same season since the NOC last
+                       hosted (0 when hosting, NA if it never hosted before)
+    neighbour_host     the host NOC shares a land border with this NOC
+    gold..total        medals won (NA for the upcoming Games)
+
+Everything is built with joins over the (NOC x Games) grid; the last
+hosting before each edition comes from one merge_asof.
+"""
+import numpy as np
+import pandas as pd
+
+from .countries import DEFUNCT_NOCS, host_nocs, neighbour_pairs
+
+MEDAL_COLS = ["gold", "silver", "bronze"]
+# Games not yet in olympic_hosts_clean.csv that the models predict
+UPCOMING = pd.DataFrame([{"year": 2026, "season": "Winter", "slug": "milano-cortina-2026",
+                          "start_date": "2026-02-06", "host_noc": "ITA"}])
+
+
+def games_index(hosts, awards, upcoming=UPCOMING):
+    """Games with their host NOC and edition number within the season (in start-date order)."""
+    g = host_nocs(hosts, awards)[["year", "season", "slug", "start_date", "host_noc"]]
+    if upcoming is not None:
+        g = pd.concat([g, upcoming[~upcoming["slug"].isin(g["slug"])]], ignore_index=True)
+    g["start"] = pd.to_datetime(g["start_date"], utc=True, errors="coerce")
+    g = g.sort_values(["season", "start", "year"]).drop(columns=["start", "start_date"])
+    g["edition"] = g.groupby("season").cumcount()
+    return g.reset_index(drop=True)
+
+
+def host_advantage(hosts, awards, upcoming=UPCOMING):
+    games = games_index(hosts, awards, upcoming)
+
+    # --- medals per (NOC, Games) ---
+    aw = awards[["games_slug", "noc", "medal"]]
+    won = pd.DataFrame({"slug": aw["games_slug"], "noc": aw["noc"]})
+    for m in MEDAL_COLS:
+        won[m] = (aw["medal"] == m.upper()).astype("int64")
+    won = won.groupby(["slug", "noc"], as_index=False)[MEDAL_COLS].sum()
+    won["total"] = won[MEDAL_COLS].sum(axis=1)
+
+    # --- grid: every medal-winning NOC of a season x that season's Games since its first medal
+    #     (up to its last one for defunct NOCs) ---
+    span = won.merge(games[["slug", "season", "edition"]], on="slug").groupby(
+        ["season", "noc"], as_index=False)["edition"].agg(first_edition="min", last_edition="max")
+    span["last_edition"] = span["last_edition"].where(span["noc"].isin(DEFUNCT_NOCS), np.inf)
+    grid = games.merge(span, on="season")
+    grid = grid[grid["edition"].between(grid["first_edition"], grid["last_edition"])]
+    grid = grid.drop(columns=["first_edition", "last_edition"])
+
+    grid["is_host"] = grid["noc"] == grid["host_noc"]
+
+    # last edition (same season, up to this one) the NOC hosted
+    hosted = games[["season", "host_noc", "edition"]].dropna().rename(
+        columns={"host_noc": "noc", "edition": "host_edition"})
+    grid = pd.merge_asof(grid.sort_values("edition"), hosted.sort_values("host_edition"),
+                         left_on="edition", right_on="host_edition", by=["season", "noc"], direction="backward")
+    grid["games_since_host"] = (grid["edition"] - grid["host_edition"]).astype("Int64")
+
+    pairs = neighbour_pairs().rename(columns={"neighbour": "host_noc"})
+    pairs["neighbour_host"] = True
+    grid = grid.merge(pairs, on=["noc", "host_noc"], how="left")
+    grid["neighbour_host"] = grid["neighbour_host"].fillna(False).astype(bool)
+
+    out = grid.merge(won, on=["slug", "noc"], how="left")
+    played = out["slug"].isin(won["slug"])
+    for c in MEDAL_COLS + ["total"]:
+        out[c] = out[c].where(~played, out[c].fillna(0)).astype("Int64")
+    cols = ["year", "season", "slug", "edition", "host_noc", "noc",
+            "is_host", "games_since_host", "neighbour_host"] + MEDAL_COLS + ["total"]
+    return out[cols].sort_values(["season", "edition", "noc"]).reset_index(drop=True)
+
+
+def host_lift(feats, season="Winter", window=2):
+    """
+    Typical medal multiplier of hosting: geometric mean, over past hosts, of the
+    host's total divided by its mean total in the editions within `window` of it.
+    """
+    f = feats[(feats["season"] == season) & feats["total"].notna()][["noc", "edition", "is_host", "total"]]
+    hosting = f[f["is_host"]].drop(columns="is_host")
+    around = hosting.merge(f[~f["is_host"]], on="noc", suffixes=("", "_other"))
+    around = around[(around["edition"] - around["edition_other"]).abs() <= window]
+    usual = around.groupby(["noc", "edition"])["total_other"].mean()
+    ratio = (hosting.set_index(["noc", "edition"])["total"] / usual).astype("float64")
+    ratio = ratio[(ratio > 0) & np.isfinite(ratio)]
+    return float(np.exp(np.log(ratio).mean())) if len(ratio) else 1.0
+
+
+if __name__ == "__main__":
+    from .datasets import load_awards, load_hosts
+    from .paths import MODELS
+
+    feats = host_advantage(load_hosts(), load_awards())
+    MODELS.mkdir(parents=True, exist_ok=True)
+    out = MODELS / "features_host_advantage.csv"
+    feats.to_csv(out, index=False, encoding="utf-8")
+    lift = feats[feats["total"].notna()].groupby(["season", "is_host"])["total"].mean().unstack()
+    print(f"{len(feats)} (NOC, Games) rows -> {out}")
+    print("Mean medals, host vs not:\n", lift.to_string())
+    print(f"Winter host lift (vs the same NOC's neighbouring editions): x{host_lift(feats):.2f}")
@@ -0,0 +1,154 @@
+# notebooks/olympic_data/outofcore.py
+"""
+Out-of-core building blocks for tables that do not fit in memory.
+
+- iter_html_table(): streams the first <table> of an HTML export as
+  DataFrame chunks of strings (the file is never loaded whole, unlike
+  pd.read_html); typing is left to the caller, so a chunk that happens to
+  hold only numbers is not read differently from the rest;
+- Spill: appends chunks to disk in one bucket per value of a key column,
+  then hands the buckets back one at a time in key order, so sorting inside
+  each bucket sorts the whole table, and drop_duplicates / groupby on any
+  column set that includes the key is exact per bucket. Buckets come back
+  with the column types they were added with;
+- CsvAppender: writes an output CSV bucket by bucket and swaps it in at the end.
+
+Peak memory is one input chunk plus the largest bucket.
+"""
+import re
+import shutil
+from html.parser import HTMLParser
+from pathlib import Path
+
+import pandas as pd
+
+_SPACES = re.compile(r"[\r\n]+|\s{2,}")           # collapsed to one space, as read_html does
+CHUNK_ROWS = 200_000
+READ_BLOCK = 1 << 20
+# the cell texts pd.read_html (and read_csv) read as missing by default
+NA_VALUES = {"", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+             "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"}
+
+
+class _TableRows(HTMLParser):
+    """Cell texts of the first <table>, row by row (nested markup inside cells is flattened)."""
+
+    def __init__(self):
+        super().__init__()
+        self.rows, self.depth, self.done = [], 0, False
+        self._row = self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "table":
+            self.depth += 1
+        elif self.depth and tag == "tr":
+            self._row = []
+        elif self._row is not None and tag in ("td", "th"):
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        if tag in ("td", "th") and self._cell is not None:
+            self._row.append(_SPACES.sub(" ", "".join(self._cell)).strip())
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            if self._row:
+                self.rows.append(self._row)
+            self._row = None
+        elif tag == "table" and self.depth:
+            self.depth -= 1
+            self.done = self.depth == 0
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def iter_html_table(path, chunksize=CHUNK_ROWS, encoding="utf-8"):
+    """Yield the first table of an HTML file as DataFrames of at most `chunksize` rows of strings (NA for NA_VALUES)."""
+    parser, header = _TableRows(), None
+
+    def frame(rows):
+        df = pd.DataFrame(rows, columns=header, dtype=object)
+        return df.mask(df.isin(NA_VALUES))
+
+    with open(path, encoding=encoding, errors="ignore") as f:
+        while block := f.read(READ_BLOCK):
+            parser.feed(block)
+            if header is None and parser.rows:
+                # blank header cells (the index column) named as read_html names them
+                header = [h or f"Unnamed: {i}" for i, h in enumerate(parser.rows.pop(0))]
+            if len(parser.rows) >= chunksize:
+                rows, parser.rows = parser.rows, []
+                for i in range(0, len(rows), chunksize):
+                    yield frame(rows[i:i + chunksize])
+            if parser.done:
+                break
+    parser.close()
+    if parser.rows:
+        yield frame(parser.rows)
+
+
+class Spill:
+    """On-disk buckets of rows, one per value of column `by` (see module docstring)."""
+
+    def __init__(self, root, by):
+        self.root, self.by = Path(root), by
+        if self.root.exists():
+            shutil.rmtree(self.root)
+        self.root.mkdir(parents=True)
+        self.rows = 0
+        self.dtypes = {}
+
+    def add(self, df):
+        # numeric columns are re-typed on read; everything else comes back as strings
+        for c, t in df.dtypes.items():
+            if pd.api.types.is_numeric_dtype(t) and not pd.api.types.is_bool_dtype(t):
+                self.dtypes.setdefault(c, t)
+        ids = df[self.by].astype("string").fillna("__null__")
+        for bucket, part in df.groupby(ids, sort=False):
+            path = self.root / f"{bucket}.csv"
+            part.to_csv(path, mode="a", header=not path.exists(), index=False, encoding="utf-8")
+        self.rows += len(df)
+
+    def buckets(self):
+        ids = [p.stem for p in self.root.glob("*.csv")]
+        # numeric keys (years) in numeric order
+        return sorted(ids, key=lambda b: (0, float(b), b) if b.lstrip("-").replace(".", "", 1).isdigit() else (1, 0, b))
+
+    def read(self, bucket):
+        df = pd.read_csv(self.root / f"{bucket}.csv", dtype=str, keep_default_na=False, na_values=[""])
+        for c, t in self.dtypes.items():
+            if c in df.columns:
+                df[c] = pd.to_numeric(df[c]).astype(t)
+        return df
+
+    def __iter__(self):
+        for b in self.buckets():
+            yield b, self.read(b)
+
+    def cleanup(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class CsvAppender:
+    """Write a CSV in pieces (header from the first piece); the target is replaced on close()."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.tmp = self.path.with_name(self.path.name + ".part")
+        self.tmp.unlink(missing_ok=True)
+        self.rows = 0
+
+    def write(self, df):
+        df.to_csv(self.tmp, mode="a", header=not self.tmp.exists(), index=False, encoding="utf-8")
+        self.rows += len(df)
+
+    def close(self, columns=None):
+        if not self.tmp.exists():
+            pd.DataFrame(columns=columns or []).to_csv(self.tmp, index=False)
+        self.tmp.replace(self.path)
+        return self.rows
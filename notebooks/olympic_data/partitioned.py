@@ -0,0 +1,143 @@
+# notebooks/olympic_data/partitioned.py
+"""
+Hive-style partitioned copies of the clean tables.
+
+Layout (one CSV per Games edition):
+    data/clean/partitioned/<table>/season=Winter/year=2022/part-0.csv
+
+`season` and `year` live in the folder names only, so a reader can skip
+whole editions from a directory listing without opening any file.
+"""
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from .paths import CLEAN, PARTITIONED
+
+PARTITION_COLS = ["season", "year"]
+DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"   # rows whose season is unknown
+SLUG_COLS = ["games_slug", "slug_game", "slug"]
+
+
+def attach_season(df, hosts=None):
+    """
+    Set `season` from the Games slug (keyed join on hosts.slug).
+
+    The slug is the only safe key: 1924-1992 had Summer and Winter Games in
+    the same year, so mapping year -> season is ambiguous.
+    """
+    slug_col = next((c for c in SLUG_COLS if c in df.columns), None)
+    if slug_col is None:
+        return df
+    if hosts is None:
+        hosts = pd.read_csv(CLEAN / "olympic_hosts_clean.csv", usecols=["slug", "season"])
+    season_by_slug = pd.Series(hosts["season"].values, index=hosts["slug"].values)
+    df = df.copy()
+    df["season"] = df[slug_col].map(season_by_slug)
+    return df
+
+
+def attach_games_slug(awards, medals):
+    """Older awards files dropped games_slug: recover it from the medal rows they were built from."""
+    if "games_slug" in awards.columns:
+        return awards
+    key = ["year", "sport", "event", "medal", "noc"]
+    slug_by_key = medals.drop_duplicates(subset=key)[key + ["games_slug"]]
+    return awards.merge(slug_by_key, on=key, how="left", validate="many_to_one")
+
+
+def write_partitioned(df, table, root=PARTITIONED):
+    """Write `df` as <root>/<table>/season=*/year=*/part-0.csv, replacing any previous copy."""
+    missing = [c for c in PARTITION_COLS if c not in df.columns]
+    if missing:
+        raise KeyError(f"Cannot partition {table!r}: missing column(s) {missing}")
+
+    target = Path(root) / table
+    staging = Path(root) / f".{table}.tmp"
+    if staging.exists():
+        shutil.rmtree(staging)
+
+    keys = df[PARTITION_COLS].astype("string").fillna(DEFAULT_PARTITION)
+    body = df.drop(columns=PARTITION_COLS)
+    n_parts = 0
+    for (season, year), idx in keys.groupby(PARTITION_COLS, sort=True).groups.items():
+        part_dir = staging / f"season={season}" / f"year={year}"
+        part_dir.mkdir(parents=True, exist_ok=True)
+        body.loc[idx].to_csv(part_dir / "part-0.csv", index=False, encoding="utf-8")
+        n_parts += 1
+
+    # swap in the new copy only once every partition is written
+    if target.exists():
+        shutil.rmtree(target)
+    staging.rename(target)
+    return n_parts
+
+
+def _parse_key(part):
+    return part.name.partition("=")[2]
+
+
+def _year_ok(year, years):
+    if years is None:
+        return True
+    if year == DEFAULT_PARTITION:
+        return False
+    year = int(year)
+    if isinstance(years, tuple) and len(years) == 2:
+        lo, hi = years
+        return (lo is None or year >= lo) and (hi is None or year <= hi)
+    return year in set(years)
+
+
+def list_partitions(table, season=None, years=None, root=PARTITIONED):
+    """
+    Return [(season, year, path)] for partitions matching the filters.
+
+    season: "Winter", "Summer" or a list of them.
+    years:  (first, last) inclusive range (either end may be None) or an iterable of years.
+    """
+    base = Path(root) / table
+    if not base.exists():
+        raise FileNotFoundError(f"No partitioned dataset at {base} (run partition_clean_tables.py)")
+    seasons = {season} if isinstance(season, str) else (set(season) if season else None)
+
+    found = []
+    for s_dir in sorted(base.glob("season=*")):
+        s = _parse_key(s_dir)
+        if seasons is not None and s not in seasons:
+            continue
+        for y_dir in sorted(s_dir.glob("year=*")):
+            y = _parse_key(y_dir)
+            if _year_ok(y, years):
+                found.append((s, y, y_dir / "part-0.csv"))
+    return found
+
+
+def read_partitioned(table, season=None, years=None, columns=None, root=PARTITIONED):
+    """
+    Read only the partitions matching `season` / `years`.
+
+    e.g. read_partitioned("medals", season="Winter", years=(1994, 2022))
+    opens the eight Winter files from Lillehammer to Beijing and nothing else.
+    """
+    parts = list_partitions(table, season=season, years=years, root=root)
+    usecols = None
+    if columns is not None:
+        usecols = [c for c in columns if c not in PARTITION_COLS]
+
+    frames = []
+    for s, y, path in parts:
+        part = pd.read_csv(path, usecols=usecols)
+        part.insert(0, "season", pd.NA if s == DEFAULT_PARTITION else s)
+        part.insert(1, "year", pd.NA if y == DEFAULT_PARTITION else int(y))
+        frames.append(part)
+
+    if not frames:
+        cols = list(columns) if columns is not None else PARTITION_COLS
+        return pd.DataFrame(columns=cols)
+    out = pd.concat(frames, ignore_index=True)
+    out["year"] = out["year"].astype("Int64")
+    if columns is not None:
+        out = out[list(columns)]
+    return out
@@ -0,0 +1,15 @@
+# notebooks/olympic_data/paths.py
+"""
+Single place where the data folders are resolved.
+
+Set OLYMPIC_DATA_ROOT to point every script, notebook and loader at another
+checkout or data copy; by default the repo root is used.
+"""
+import os
+from pathlib import Path
+
+ROOT = Path(os.environ.get("OLYMPIC_DATA_ROOT") or Path(__file__).resolve().parents[2])
+RAW = ROOT / "data" / "raw"
+CLEAN = ROOT / "data" / "clean"
+PARTITIONED = CLEAN / "partitioned"           # hive-style season=/year= datasets
+MODELS = ROOT / "models"                      # fitted ratings, probabilities, simulations
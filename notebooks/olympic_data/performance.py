@@ -0,0 +1,119 @@
+# notebooks/olympic_data/performance.py
+"""
+Numeric performance values for the results table, and gap-to-winner features.
+
+    cd notebooks && python -m olympic_data.performance
+
+In the results export `value_unit` holds the performance as text and
+`value_type` says what it is:
+
+    TIME       "1:44:15.4", "2:05.45", "9.63"    -> seconds
+    DISTANCE   "8.95", "8,95 m"                   -> metres
+    POINTS     "5838", "98.25"                    -> points (SCORE too)
+    WEIGHT     "250"                              -> kg
+    IRM        "DNF", "DSQ", ...                  -> NA
+
+A "+" prefix ("+12.3", "+1:02.5") is a gap behind the leader, not a
+performance, and also gives NA.
+
+parse_values() only parses each distinct (type, text) pair once, with one
+vectorized regex pass over the distinct strings, and keeps the parsed
+values in a module-level memo: results repeat the same values heavily
+(ranks, points, "DNF"), and re-running on the next table reuses them.
+
+performance_gaps() adds, per event (slug_game, discipline_title,
+event_title), the winner's value and each row's absolute / relative gap to
+it. The winner is the rank 1 row, so the gap does not depend on whether
+lower or higher is better in that sport.
+"""
+import numpy as np
+import pandas as pd
+
+UNITS = {"TIME": "s", "DISTANCE": "m", "POINTS": "pts", "SCORE": "pts", "WEIGHT": "kg"}
+EVENT_KEY = ["slug_game", "discipline_title", "event_title"]
+
+_TIME = r"^(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d+)?)\s*s?$"           # [[h:]m:]s.ff
+_NUMBER = r"^(-?\d+(?:\.\d+)?)\s*[a-z]*$"                          # 8.95, 8.95 m, 98.25 pts
+_parsed = {}                                                       # (value_type, text) -> float
+
+
+def _parse_distinct(kinds, texts):
+    """Vectorized parse of distinct (kind, text) pairs -> float array."""
+    s = pd.Series(texts, dtype="string").str.strip().str.lower().str.replace(",", ".", regex=False)
+    out = np.full(len(s), np.nan)
+
+    is_time = (pd.Series(kinds, dtype="string") == "TIME").fillna(False).to_numpy()
+    if is_time.any():
+        hms = s[is_time].str.extract(_TIME).apply(pd.to_numeric).fillna({0: 0, 1: 0})
+        out[is_time] = (hms[0] * 3600 + hms[1] * 60 + hms[2]).to_numpy(dtype=float, na_value=np.nan)
+    if (~is_time).any():
+        num = pd.to_numeric(s[~is_time].str.extract(_NUMBER)[0])
+        out[~is_time] = num.to_numpy(dtype=float, na_value=np.nan)
+    return out
+
+
+def parse_values(values, value_types):
+    """value_unit texts + value_type labels -> float Series (seconds / metres / points / kg)."""
+    # one code per distinct (kind, text) pair: factorize each column, then the combined int codes
+    v_codes, v_uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=False)
+    k_codes, k_uniques = pd.factorize(np.asarray(value_types, dtype=object), use_na_sentinel=False)
+    codes, combined = pd.factorize(v_codes.astype(np.int64) * len(k_uniques) + k_codes)
+    kinds = [str(k).strip().upper() if isinstance(k, str) else "" for k in k_uniques]
+    texts = ["" if pd.isna(v) else str(v) for v in v_uniques]
+    pairs = [(kinds[c % len(kinds)], texts[c // len(kinds)]) for c in combined.tolist()]
+    new = [p for p in dict.fromkeys(pairs) if p not in _parsed]
+    if new:
+        parsed = _parse_distinct([k for k, _ in new], [t for _, t in new])
+        _parsed.update(zip(new, parsed.tolist()))
+        # IRM / unknown kinds never carry a performance
+        for k, t in new:
+            if k not in UNITS:
+                _parsed[(k, t)] = np.nan
+    lookup = np.array([_parsed[p] for p in pairs], dtype=float)
+    return pd.Series(lookup[codes] if len(codes) else np.array([], dtype=float), name="value_num")
+
+
+def clear_parsed():
+    _parsed.clear()
+
+
+def performance_gaps(results):
+    """
+    results (clean) -> copy with value_num, value_unit_si, winner_value, gap and rel_gap.
+
+    gap is |value - winner value| in the event's unit, rel_gap the same as
+    a share of the winner value; NA when the event has no parsable rank 1.
+    """
+    out = results.copy()
+    if "value_num" not in out.columns:
+        out["value_num"] = parse_values(out["value_unit"], out["value_type"]).to_numpy()
+    out["value_unit_si"] = out["value_type"].astype("string").str.upper().map(UNITS)
+    rank = pd.to_numeric(out.get("rank_position_num", out.get("rank_position")), errors="coerce")
+    keys = [out[c].astype("string").fillna("") for c in EVENT_KEY]
+    winner = out["value_num"].where(rank.eq(1)).groupby(keys).transform("first")
+    out["winner_value"] = winner
+    out["gap"] = (out["value_num"] - winner).abs()
+    out["rel_gap"] = out["gap"] / winner.abs().replace(0, np.nan)
+    return out
+
+
+if __name__ == "__main__":
+    import time
+
+    from .datasets import load_results
+    from .paths import MODELS
+
+    results = load_results()
+    t0 = time.perf_counter()
+    gaps = performance_gaps(results)
+    t1 = time.perf_counter()
+    n_distinct = len(_parsed)
+    print(f"{len(results)} results, {n_distinct} distinct values parsed in {t1 - t0:.2f}s "
+          f"({gaps['value_num'].notna().mean():.1%} numeric)")
+    MODELS.mkdir(parents=True, exist_ok=True)
+    out = MODELS / "features_performance_gaps.csv"
+    cols = ["year", "season", *EVENT_KEY, "country_3_letter_code", "athlete_url", "rank_position_num",
+            "value_type", "value_num", "value_unit_si", "winner_value", "gap", "rel_gap"]
+    gaps[[c for c in cols if c in gaps.columns]].to_csv(out, index=False, encoding="utf-8")
+    print(f" -> {out}")
+    print(gaps.groupby(gaps["value_type"].astype("string").str.upper())["rel_gap"].median().to_string())
@@ -0,0 +1,158 @@
+# notebooks/olympic_data/publish.py
+"""
+Publish stage: static, content-hashed data bundles for the frontend.
+
+    cd notebooks && python -m olympic_data.publish
+
+writes under webapp/frontend/public/data/:
+
+    manifest.json                      logical name -> hashed file names
+    countries/index.<hash>.json        NOC index (name, first/last Games, totals)
+    countries/<NOC>.<hash>.json        medal history of one NOC
+    games/index.<hash>.json            list of Games
+    games/<slug>.<hash>.json           medal table of one Games
+    predictions/2026.<hash>.json       simulated 2026 distribution (if models/ has one)
+
+Each JSON file also gets .gz (and .br when the `brotli` package is
+installed) siblings, and tabular bundles get an .arrow file when pyarrow is
+available. File names carry a hash of their content, so they can be served
+with an immutable, long cache lifetime; only manifest.json must be
+revalidated. A bundle is re-serialized only when the hash of its source
+rows changes.
+"""
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from .api import _medal_counts, country_history, games_medal_table
+from .paths import MODELS, ROOT
+
+PUBLIC = ROOT / "webapp" / "frontend" / "public" / "data"
+
+try:
+    import brotli
+except ImportError:          # optional: .gz only
+    brotli = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:          # optional: JSON only
+    pa = None
+
+
+def _source_hash(df):
+    return f"{len(df)}-{int(pd.util.hash_pandas_object(df, index=False).sum()) & 0xFFFFFFFFFFFF:012x}"
+
+
+class BundleWriter:
+    def __init__(self, out=PUBLIC):
+        self.out = Path(out)
+        manifest = self.out / "manifest.json"
+        self.previous = json.loads(manifest.read_text(encoding="utf-8")) if manifest.exists() else {}
+        self.manifest = {}
+        self.written = self.skipped = 0
+        self._fresh = set()              # files written in this run, never cleaned up
+
+    def _drop(self, prev):
+        """Remove the files of a previous version of a bundle (not ones just rewritten)."""
+        old = self.out / prev["json"]
+        for f in old.parent.glob(old.name.replace(".json", ".*")):
+            if f not in self._fresh:
+                f.unlink()
+
+    def _write(self, path, data):
+        path.write_bytes(data)
+        self._fresh.add(path)
+
+    def add(self, name, source, build, table=None):
+        """
+        Publish bundle `name` (e.g. "countries/NOR").
+
+        source: the rows the bundle is built from (hashed to detect changes)
+        build:  () -> JSON-able payload, only called when `source` changed
+        table:  optional () -> DataFrame to also write as Arrow
+        """
+        src = _source_hash(source)
+        prev = self.previous.get(name)
+        if prev and prev["source"] == src and (self.out / prev["json"]).exists():
+            self.manifest[name] = prev
+            self.skipped += 1
+            return
+
+        body = json.dumps(build(), separators=(",", ":"), ensure_ascii=False, default=str).encode()
+        digest = hashlib.sha256(body).hexdigest()[:10]
+        path = self.out / f"{name}.{digest}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._write(path, body)
+        entry = {"source": src, "json": str(path.relative_to(self.out)), "bytes": len(body)}
+
+        self._write(path.with_suffix(".json.gz"), gzip.compress(body, compresslevel=9, mtime=0))
+        if brotli is not None:
+            self._write(path.with_suffix(".json.br"), brotli.compress(body, quality=11))
+        if table is not None and pa is not None:
+            arrow_path = path.with_suffix(".arrow")
+            feather.write_feather(table(), arrow_path, compression="zstd")
+            self._fresh.add(arrow_path)
+            entry["arrow"] = str(arrow_path.relative_to(self.out))
+
+        # drop the files of the previous version of this bundle; when the JSON
+        # is byte-identical they have the same names as the ones just written
+        if prev:
+            self._drop(prev)
+        self.manifest[name] = entry
+        self.written += 1
+
+    def finish(self):
+        # bundles that disappeared (e.g. a NOC removed) go with their files
+        for name, prev in self.previous.items():
+            if name not in self.manifest:
+                self._drop(prev)
+        self.out.mkdir(parents=True, exist_ok=True)
+        tmp = self.out / "manifest.json.tmp"
+        tmp.write_text(json.dumps(self.manifest, indent=1, sort_keys=True), encoding="utf-8")
+        tmp.replace(self.out / "manifest.json")
+
+
+def publish(awards, hosts, predictions=None, out=PUBLIC):
+    """Build every bundle; returns the BundleWriter (for its counters)."""
+    w = BundleWriter(out)
+    counts = _medal_counts(awards)
+
+    # --- country / NOC index ---
+    per_noc = counts.groupby("noc").agg(
+        country=("country", "last"), first_year=("year", "min"), last_year=("year", "max"),
+        gold=("gold", "sum"), silver=("silver", "sum"), bronze=("bronze", "sum")).reset_index()
+    per_noc["total"] = per_noc[["gold", "silver", "bronze"]].sum(axis=1)
+    w.add("countries/index", per_noc, lambda: per_noc.to_dict(orient="records"), table=lambda: per_noc)
+
+    # --- per-country history ---
+    for noc, rows in counts.groupby("noc"):
+        w.add(f"countries/{noc}", rows, lambda rows=rows, noc=noc: country_history(rows, noc))
+
+    # --- per-Games medal tables ---
+    games = hosts[hosts["slug"].isin(counts["games_slug"])][["year", "season", "city", "country", "slug"]]
+    w.add("games/index", games, lambda: games.to_dict(orient="records"))
+    for slug, rows in counts.groupby("games_slug"):
+        w.add(f"games/{slug}", rows, lambda rows=rows, slug=slug: games_medal_table(rows, slug),
+              table=lambda rows=rows: rows)
+
+    # --- predictions ---
+    if predictions is not None:
+        w.add("predictions/2026", predictions, lambda: predictions.to_dict(orient="records"),
+              table=lambda: predictions)
+    w.finish()
+    return w
+
+
+if __name__ == "__main__":
+    from .datasets import load_awards, load_hosts
+
+    sim = MODELS / "sim_2026_medal_distribution.csv"
+    preds = pd.read_csv(sim) if sim.exists() else None
+    w = publish(load_awards(), load_hosts(), predictions=preds)
+    print(f"Bundles -> {PUBLIC}: {w.written} written, {w.skipped} unchanged"
+          f"{'' if brotli else ' (no brotli: .gz only)'}{'' if pa else ' (no pyarrow: no .arrow)'}")
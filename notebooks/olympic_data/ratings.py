@@ -0,0 +1,165 @@
+# notebooks/olympic_data/ratings.py
+"""
+Event-level strength ratings from historical ranks (multi-competitor Elo).
+
+Every event is treated as a set of head-to-head duels between its
+entrants: A "wins" against B when it finished ahead. All events of one
+Games are updated at once from the ratings held *before* that Games:
+
+    expected(A, B) = 1 / (1 + 10 ** ((r_B - r_A) / 400))
+    r_A += k / (n - 1) * sum_B (actual - expected)
+
+The state is a small table (entity -> rating, events, last_year), so a new
+Games is one update_ratings() call on the previous state; there is no
+need to replay history. Entities are (sport, noc) by default, or athletes
+(entity_cols=["athlete_id"]).
+
+Ratings turn into podium probabilities with a Plackett-Luce share,
+strength = 10 ** (rating / 400), which event_probabilities() writes in the
+(sport, event, event_gender, noc, prob) format used by simulate.py.
+"""
+import numpy as np
+import pandas as pd
+
+from .countries import DEFUNCT_NOCS
+
+BASE_RATING = 1500.0
+ENTITY_COLS = ["sport", "noc"]
+RANK_COLS = ["year", "games_slug", "sport", "event", "event_gender", "noc", "rank"]
+STATE_COLS = ["rating", "events", "last_year"]
+ACTIVE_SINCE = 2014         # 2026 candidates: competed at Sochi 2014 or later
+
+
+def ranks_from_results(results):
+    """Clean results table -> rank table (one row per entrant with a numeric rank)."""
+    df = results.rename(columns={
+        "slug_game": "games_slug", "discipline_title": "sport", "event_title": "event",
+        "country_3_letter_code": "noc", "rank_position_num": "rank",
+    })
+    if "event_gender" not in df.columns:
+        df["event_gender"] = ""
+    keep = RANK_COLS + [c for c in ["athlete_id", "season"] if c in df.columns]
+    return df[df["rank"].notna()][keep].reset_index(drop=True)
+
+
+def ranks_from_medals(medals):
+    """Podium-only fallback when results are not available: GOLD=1, SILVER=2, BRONZE=3."""
+    df = medals.copy()
+    df["rank"] = df["medal"].map({"GOLD": 1, "SILVER": 2, "BRONZE": 3})
+    keep = RANK_COLS + [c for c in ["athlete_id", "season"] if c in df.columns]
+    return df[df["rank"].notna()][keep].reset_index(drop=True)
+
+
+def new_state(entity_cols=ENTITY_COLS):
+    return pd.DataFrame(columns=list(entity_cols) + STATE_COLS)
+
+
+def update_ratings(state, games, entity_cols=ENTITY_COLS, k=32.0, regress=0.0):
+    """
+    Apply one Games (all its events at once) to `state`; returns the new state.
+
+    regress: fraction by which every existing rating is pulled back toward
+    BASE_RATING before the update (form fades between editions).
+    """
+    ent = list(entity_cols)
+    event_key = ["games_slug", "sport", "event", "event_gender"]
+    # an entity counts once per event, with its best rank (e.g. NOC with two finalists)
+    field = games.groupby(event_key + ent, as_index=False, dropna=False)["rank"].min()
+    year = int(games["year"].max())
+
+    state = state.copy()
+    if regress and len(state):
+        state["rating"] = BASE_RATING + (1 - regress) * (state["rating"] - BASE_RATING)
+    field = field.merge(state[ent + ["rating"]], on=ent, how="left")
+    field["rating"] = field["rating"].fillna(BASE_RATING).astype(float)
+
+    # --- all duels of all events in one self-merge ---
+    field["eid"] = field.groupby(event_key, dropna=False).ngroup()
+    field["n"] = field.groupby("eid")["eid"].transform("size")
+    field["row"] = np.arange(len(field))
+    a = field[["eid", "row", "rank", "rating", "n"]]
+    pairs = a.merge(a[["eid", "row", "rank", "rating"]], on="eid", suffixes=("", "_b"))
+    pairs = pairs[pairs["row"] != pairs["row_b"]]
+
+    expected = 1.0 / (1.0 + 10.0 ** ((pairs["rating_b"].to_numpy() - pairs["rating"].to_numpy()) / 400.0))
+    ra, rb = pairs["rank"].to_numpy(), pairs["rank_b"].to_numpy()
+    actual = np.where(ra < rb, 1.0, np.where(ra == rb, 0.5, 0.0))
+    step = k / (pairs["n"].to_numpy() - 1) * (actual - expected)
+    delta = np.bincount(pairs["row"].to_numpy(), weights=step, minlength=len(field))
+
+    field["delta"] = delta
+    per_entity = field.groupby(ent, as_index=False, dropna=False).agg(
+        delta=("delta", "sum"), n_events=("eid", "size"), start=("rating", "first"))
+
+    merged = state.merge(per_entity, on=ent, how="outer")
+    merged["rating"] = merged["rating"].astype(float).fillna(merged["start"]) + merged["delta"].fillna(0.0)
+    merged["events"] = merged["events"].fillna(0).astype(int) + merged["n_events"].fillna(0).astype(int)
+    merged["last_year"] = np.where(merged["n_events"].notna(), year, merged["last_year"])
+    return merged[ent + STATE_COLS].reset_index(drop=True)
+
+
+def games_in_order(ranks):
+    """Games slugs in chronological order (Winter before Summer on shared years is arbitrary but stable)."""
+    return ranks.drop_duplicates("games_slug").sort_values(["year", "games_slug"])["games_slug"].tolist()
+
+
+def fit_ratings(ranks, state=None, entity_cols=ENTITY_COLS, k=32.0, regress=0.1, skip=()):
+    """
+    Fold update_ratings over every Games in `ranks`, edition by edition.
+
+    Pass the previous `state` and skip= the slugs it already includes to add
+    only the new editions.
+    """
+    state = new_state(entity_cols) if state is None else state
+    for slug in games_in_order(ranks):
+        if slug in skip:
+            continue
+        state = update_ratings(state, ranks[ranks["games_slug"] == slug],
+                               entity_cols=entity_cols, k=k, regress=regress)
+    return state
+
+
+def event_probabilities(state, events, min_events=1, active_since=ACTIVE_SINCE):
+    """
+    Podium probability per (event, NOC) from (sport, noc) ratings.
+
+    Candidates of an event are the NOCs rated in its sport that competed in
+    it since `active_since` and still exist (countries.DEFUNCT_NOCS); shares
+    are Plackett-Luce strengths 10 ** (rating / 400) normalized within the event.
+    """
+    active = (state["events"] >= min_events) & (state["last_year"].astype(float) >= active_since) \
+        & ~state["noc"].isin(DEFUNCT_NOCS)
+    rated = state[active][["sport", "noc", "rating"]]
+    cand = events.merge(rated, on="sport")
+    strength = 10.0 ** ((cand["rating"] - BASE_RATING) / 400.0)
+    cand["prob"] = strength / strength.groupby([cand[c] for c in ["sport", "event", "event_gender"]]).transform("sum")
+    cols = ["sport", "event", "event_gender", "noc", "prob"] + (["team"] if "team" in cand.columns else [])
+    return cand[cols].reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    import time
+
+    from .datasets import load_awards, load_medals, table_path
+    from .paths import MODELS
+    from .simulate import event_programme
+
+    if table_path("results").exists():
+        from .datasets import load_results
+        ranks = ranks_from_results(load_results(season="Winter"))
+        print("Ratings from results ranks:", ranks.shape)
+    else:
+        ranks = ranks_from_medals(load_medals(season="Winter"))
+        print("No olympic_results_clean.csv: ratings from podium ranks only:", ranks.shape)
+
+    t0 = time.perf_counter()
+    state = fit_ratings(ranks)
+    print(f"Fitted {len(state)} (sport, noc) ratings over {ranks['games_slug'].nunique()} Games "
+          f"in {time.perf_counter() - t0:.2f}s")
+
+    MODELS.mkdir(parents=True, exist_ok=True)
+    state.to_csv(MODELS / "ratings_sport_noc.csv", index=False, encoding="utf-8")
+    probs = event_probabilities(state, event_programme(load_awards(season="Winter"),
+                                                       medals=load_medals(season="Winter")))
+    probs.to_csv(MODELS / "event_probabilities_2026.csv", index=False, encoding="utf-8")
+    print(state.sort_values("rating", ascending=False).head(10).to_string(index=False))
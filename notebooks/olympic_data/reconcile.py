@@ -0,0 +1,146 @@
+# notebooks/olympic_data/reconcile.py
+"""
+Record linkage between the medals feed and the results feed.
+
+Both sources describe the same podiums but spell athletes and teams
+differently. Candidate pairs are only generated inside a block
+(year, event, noc), then scored with a vectorized name similarity:
+
+- every distinct name is folded and hashed into a 512-bit trigram signature
+  (8 x uint64), computed once per name;
+- similarity of a pair = popcount(a & b) / popcount(a | b), an approximate
+  trigram Jaccard computed on whole arrays of pairs at once.
+
+Team lines (participant_type "GameTeam" without an athlete URL, whatever
+name patch_medals_v2.py gave them, or rows with neither name nor URL) are
+matched on the block and medal alone.
+
+The assignment is one-to-one and greedy by confidence over all candidate
+pairs: the best-scoring pair is taken first, then the best pair whose medal
+row and result row are both still free, and so on. A medal row whose best
+result row went to a better-scoring medal row falls back to its next
+candidate, and is left unmatched only when none is left.
+"""
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from .athlete_index import athlete_keys, normalize_name
+
+SIG_WORDS = 8                       # 8 x 64 = 512 bits per name
+MATCH_COLS = ["medal_row", "result_row", "method", "name_sim", "medal_agree", "confidence"]
+
+# column names of each feed, mapped to a common schema
+MEDALS_SCHEMA = {"year": "year", "event": "event", "noc": "noc", "medal": "medal",
+                 "athlete": "name", "athlete_url": "url", "participant_type": "participant_type"}
+RESULTS_SCHEMA = {"year": "year", "event_title": "event", "country_3_letter_code": "noc",
+                  "medal_type": "medal", "athlete_full_name": "name", "athlete_url": "url",
+                  "participant_type": "participant_type"}
+
+
+def _trigram_hashes(name):
+    padded = f"  {name} "
+    return [zlib.crc32(padded[i:i + 3].encode()) for i in range(len(padded) - 2)]
+
+
+def name_signatures(names):
+    """(n, SIG_WORDS) uint64 trigram signatures for a Series of folded names."""
+    uniq, inverse = np.unique(names.fillna("").to_numpy(dtype=str), return_inverse=True)
+    bits = np.zeros((len(uniq), SIG_WORDS * 64), dtype=bool)
+    for i, name in enumerate(uniq):
+        if name:
+            bits[i, np.asarray(_trigram_hashes(name), dtype=np.int64) % (SIG_WORDS * 64)] = True
+    packed = np.packbits(bits, axis=1, bitorder="little").view(np.uint64)
+    return packed[inverse]
+
+
+_BYTE_BITS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount_bytes(a):
+    """Set bits per uint64 through a byte lookup table (numpy < 2 has no bitwise_count)."""
+    a = np.ascontiguousarray(a, dtype=np.uint64)
+    return _BYTE_BITS[a.view(np.uint8)].reshape(*a.shape, 8).sum(axis=-1)
+
+
+_popcount = getattr(np, "bitwise_count", _popcount_bytes)
+
+
+def signature_similarity(a, b):
+    """Row-wise approximate Jaccard between two (n, SIG_WORDS) signature arrays."""
+    inter = _popcount(a & b).sum(axis=1)
+    union = _popcount(a | b).sum(axis=1)
+    return np.divide(inter, union, out=np.zeros(len(a)), where=union > 0)
+
+
+def _prepare(df, schema):
+    out = pd.DataFrame({new: df[old] if old in df.columns else pd.NA for old, new in schema.items()})
+    out = out.reset_index(drop=True)
+    out["row"] = np.arange(len(df))
+    out["event_key"] = normalize_name(out["event"])
+    out["noc"] = out["noc"].astype("string").str.strip().str.upper()
+    out["medal"] = out["medal"].astype("string").fillna("").str.upper()
+    out["url_key"] = athlete_keys(pd.Series(pd.NA, index=out.index), out["url"])
+    out["name_key"] = normalize_name(out["name"])
+    # team lines: a GameTeam without an athlete URL (its name is the team's), or nothing to match on
+    is_team = out["participant_type"].astype("string").eq("GameTeam").fillna(False)
+    out["team_line"] = out["url_key"].isna() & (is_team | out["name_key"].eq(""))
+    return out
+
+
+def reconcile(medals, results, min_confidence=0.5):
+    """
+    Match medal rows to result rows.
+
+    Returns one row per matched medal row, with positional row numbers into
+    `medals` / `results` and a confidence in [0, 1]: method "url" (same
+    athlete URL), "name" (trigram similarity) or "team". Each result row is
+    used at most once (see module docstring).
+    """
+    m = _prepare(medals, MEDALS_SCHEMA)
+    r = _prepare(results, RESULTS_SCHEMA)
+    block = ["year", "event_key", "noc"]
+
+    # --- candidate pairs: only inside a (year, event, noc) block ---
+    pairs = m.merge(r, on=block, suffixes=("_m", "_r"))
+    if pairs.empty:
+        return pd.DataFrame(columns=MATCH_COLS)
+    # a team line only pairs with a team line, an athlete only with an athlete
+    pairs = pairs[pairs["team_line_m"] == pairs["team_line_r"]].reset_index(drop=True)
+
+    medal_agree = (pairs["medal_m"] == pairs["medal_r"]).to_numpy()
+    same_url = (pairs["url_key_m"].notna() & (pairs["url_key_m"] == pairs["url_key_r"])).to_numpy(dtype=bool)
+    team = pairs["team_line_m"].to_numpy(dtype=bool)
+
+    sim = signature_similarity(name_signatures(pairs["name_key_m"]), name_signatures(pairs["name_key_r"]))
+    sim = np.where(same_url, 1.0, np.where(team, 1.0, sim))
+
+    # name similarity carries most of the weight; agreeing medal breaks ties
+    confidence = np.where(same_url, 0.9 + 0.1 * medal_agree, 0.8 * sim + 0.2 * medal_agree)
+    method = np.select([same_url, team], ["url", "team"], default="name")
+
+    scored = pd.DataFrame({
+        "medal_row": pairs["row_m"].to_numpy(),
+        "result_row": pairs["row_r"].to_numpy(),
+        "method": method,
+        "name_sim": sim.round(4),
+        "medal_agree": medal_agree.astype(int),
+        "confidence": confidence.round(4),
+    })
+    scored = scored[scored["confidence"] >= min_confidence]
+
+    return assign_greedy(scored).sort_values("medal_row").reset_index(drop=True)[MATCH_COLS]
+
+
+def assign_greedy(scored):
+    """One-to-one subset of scored pairs, best confidence first (ties: lower medal_row, then input order)."""
+    scored = scored.sort_values(["confidence", "medal_row"], ascending=[False, True], kind="stable")
+    medal_rows, result_rows = scored["medal_row"].to_numpy(), scored["result_row"].to_numpy()
+    used_m, used_r, keep = set(), set(), np.zeros(len(scored), dtype=bool)
+    for i, (a, b) in enumerate(zip(medal_rows, result_rows)):
+        if a not in used_m and b not in used_r:
+            used_m.add(a)
+            used_r.add(b)
+            keep[i] = True
+    return scored[keep]
@@ -0,0 +1,264 @@
+# notebooks/olympic_data/scenarios.py
+"""
+"What if" medal projections for Milano-Cortina 2026.
+
+    cd notebooks && python -m olympic_data.scenarios
+    cd notebooks && python -m olympic_data.scenarios --scenarios my_scenarios.json --processes 4
+
+A scenario is a dict of overrides on the 2026 event probabilities
+(models/event_probabilities_2026.csv, or the baseline shares of simulate.py):
+
+    {"name": "no Russia",     "absent": ["RUS", "ROC"]}
+    {"name": "host x2",       "host_advantage": 2}
+    {"name": "NOR weaker",    "strength": {"NOR": 0.8}}
+    {"name": "no biathlon",   "drop_sports": ["Biathlon"]}
+
+    absent          NOCs removed from every field
+    strength        per-NOC multiplier on the Plackett-Luce strength
+    host_advantage  power of the historical host lift (host_advantage.host_lift,
+                    ~1.7 for Winter): 1 = usual (the default), 2 = doubled, 0 = none
+    host            host NOC (default ITA)
+    drop_sports     sports taken off the programme
+
+Any other key, or a value of the wrong type (e.g. "absent": "NOR" instead
+of a list), raises ValueError.
+
+The (events x entrants) probability matrix of simulate.probability_matrix
+is built once and cached (a NOC has several entrant slots in an individual
+event, so it can take more than one medal there, one in a team event). A batch of scenarios becomes one
+(scenarios x events x entrants) array of multipliers, and all of them are
+scored in one pass: expected gold / silver / bronze under the same draw
+(Plackett-Luce, without replacement) as simulate.py, in closed form, so
+there is no sampling noise between scenarios. processes=N splits the batch
+over worker processes. Results are memoized per scenario, so changing one
+scenario in a batch only scores that one.
+"""
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .host_advantage import UPCOMING, host_lift
+from .simulate import probability_matrix
+
+MEDALS = ["gold", "silver", "bronze"]
+BASELINE = {"name": "baseline"}
+CHUNK = 8                                # scenarios per array pass (bounds the S x E x W x W block)
+
+
+def _ratio(num, den):
+    return np.divide(num, den, out=np.zeros(np.broadcast(num, den).shape), where=den > 1e-12)
+
+
+def expected_podium(p):
+    """
+    p (..., W): per-event candidate probabilities -> (..., W, 3) expected gold / silver / bronze.
+
+    P(i silver) = sum_j p_j p_i / (1 - p_j); P(i bronze) sums p_j p_k p_i /
+    ((1 - p_j)(1 - p_j - p_k)) over ordered pairs j != k, both != i. Podium
+    places that cannot be filled (fewer than 3 candidates) stay empty.
+    """
+    q = _ratio(p, 1.0 - p)                                       # p_j / (1 - p_j)
+    silver = p * (q.sum(axis=-1, keepdims=True) - q)
+    pj, pk = p[..., :, None], p[..., None, :]
+    t = q[..., :, None] * _ratio(pk, 1.0 - pj - pk)              # t[j, k]: j gold, k silver
+    idx = np.arange(p.shape[-1])
+    t[..., idx, idx] = 0.0
+    bronze = p * (t.sum(axis=(-1, -2))[..., None] - t.sum(axis=-1) - t.sum(axis=-2))
+    return np.stack([p, silver, bronze], axis=-1)
+
+
+def _score_chunk(cand_noc, p, n_nocs):
+    """(s, E, W) probabilities -> (s, n_nocs, 3) expected medals per NOC."""
+    out = np.empty((len(p), n_nocs, 3))
+    for a in range(0, len(p), CHUNK):
+        pod = expected_podium(p[a:a + CHUNK])
+        s = len(pod)
+        flat = (np.arange(s)[:, None, None] * n_nocs + cand_noc[None]).ravel()
+        for m in range(3):
+            out[a:a + s, :, m] = np.bincount(flat, weights=pod[..., m].ravel(),
+                                             minlength=s * n_nocs).reshape(s, n_nocs)
+    return out
+
+
+# scenario key -> (accepted types, description for error messages)
+FIELDS = {
+    "name": (str, "a string"),
+    "absent": (list, "a list of NOCs"),
+    "strength": (dict, "an object {NOC: multiplier}"),
+    "host_advantage": ((int, float), "a number"),
+    "host": (str, "a NOC"),
+    "drop_sports": (list, "a list of sports"),
+}
+
+
+def _number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+def check_scenario(scenario):
+    """Raise ValueError unless `scenario` is a dict of known overrides with the right types."""
+    if not isinstance(scenario, dict):
+        raise ValueError(f"a scenario must be an object, got {scenario!r}")
+    unknown = sorted(set(scenario) - set(FIELDS))
+    if unknown:
+        raise ValueError(f"unknown scenario keys {unknown}, expected some of {list(FIELDS)}")
+    for k, v in scenario.items():
+        types, what = FIELDS[k]
+        ok = isinstance(v, types) and not isinstance(v, bool)
+        if ok and isinstance(v, list):
+            ok = all(isinstance(x, str) for x in v)
+        if ok and isinstance(v, dict):
+            ok = all(_number(x) for x in v.values())
+        if not ok:
+            raise ValueError(f"scenario {k!r} must be {what}, got {v!r}")
+
+
+def _key(scenario):
+    return json.dumps({k: v for k, v in scenario.items() if k != "name"}, sort_keys=True, default=str)
+
+
+class ScenarioEngine:
+    """Cached 2026 probability matrix + batched scenario scoring (see module docstring)."""
+
+    def __init__(self, probs, lift=1.0, host=UPCOMING["host_noc"].iloc[0]):
+        self.events, self.nocs, self.cand_noc, self.cand_p = probability_matrix(probs)
+        self.lift, self.host = lift, host
+        self._noc_pos = {n: i for i, n in enumerate(self.nocs)}
+        self._sport = self.events["sport"].to_numpy()
+        self._memo = {}
+
+    def _noc_mask(self, nocs):
+        idx = [self._noc_pos[n] for n in nocs if n in self._noc_pos]
+        return np.isin(self.cand_noc, idx) & (self.cand_p > 0)
+
+    def factors(self, scenarios):
+        """(S, E, W) strength multipliers for a list of scenarios (checked with check_scenario)."""
+        for sc in scenarios:
+            check_scenario(sc)
+        f = np.ones((len(scenarios),) + self.cand_p.shape)
+        for s, sc in enumerate(scenarios):
+            for noc, k in sc.get("strength", {}).items():
+                f[s][self._noc_mask([noc])] *= k
+            host_power = sc.get("host_advantage", 1.0)
+            if host_power != 0:
+                f[s][self._noc_mask([sc.get("host", self.host)])] *= self.lift ** host_power
+            if sc.get("absent"):
+                f[s][self._noc_mask(sc["absent"])] = 0.0
+            if sc.get("drop_sports"):
+                f[s][np.isin(self._sport, sc["drop_sports"])] = 0.0
+        return f
+
+    def probabilities(self, scenarios):
+        """(S, E, W) renormalized probabilities (events with nobody left are all 0)."""
+        p = self.cand_p[None] * self.factors(scenarios)
+        return _ratio(p, p.sum(axis=-1, keepdims=True))
+
+    def expected_medals(self, scenarios, processes=None):
+        """(S, n_nocs, 3) expected medals; scenarios already scored come from the memo."""
+        keys = [_key(sc) for sc in scenarios]
+        todo = list({k: sc for k, sc in zip(keys, scenarios) if k not in self._memo}.items())
+        if todo:
+            p = self.probabilities([sc for _, sc in todo])
+            n = len(self.nocs)
+            if not processes or processes == 1 or len(todo) < 2:
+                scored = _score_chunk(self.cand_noc, p, n)
+            else:
+                parts = np.array_split(p, min(processes, len(todo)))
+                with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+                    scored = np.concatenate(list(pool.map(_score_chunk, [self.cand_noc] * len(parts),
+                                                          parts, [n] * len(parts))))
+            self._memo.update(zip([k for k, _ in todo], scored))
+        return np.stack([self._memo[k] for k in keys])
+
+    def score(self, scenarios, processes=None):
+        """
+        Long table: scenario, noc, gold, silver, bronze, total, and the change
+        in gold / total against the baseline (no overrides).
+        """
+        for sc in scenarios:
+            check_scenario(sc)
+        scenarios = [BASELINE] + [sc for sc in scenarios if _key(sc) != _key(BASELINE)]
+        exp = self.expected_medals(scenarios, processes=processes)
+        names = [sc.get("name") or f"scenario {i}" for i, sc in enumerate(scenarios)]
+        order = np.repeat(np.arange(len(scenarios)), len(self.nocs))
+        out = pd.DataFrame({"scenario": np.asarray(names, dtype=object)[order],
+                            "noc": np.tile(self.nocs, len(scenarios))})
+        for m, col in enumerate(MEDALS):
+            out[col] = exp[:, :, m].ravel()
+        out["total"] = out[MEDALS].sum(axis=1)
+        out["gold_change"] = out["gold"] - np.tile(exp[0, :, 0], len(scenarios))
+        out["total_change"] = out["total"] - np.tile(exp[0].sum(axis=1), len(scenarios))
+        out["_order"] = order
+        out = out.sort_values(["_order", "gold", "total"], ascending=[True, False, False])
+        return out.drop(columns="_order").reset_index(drop=True)
+
+
+_engine = {}
+
+
+def source_paths():
+    """Files the engine is built from: the model outputs, else the clean awards / hosts."""
+    from . import datasets
+    from .paths import MODELS
+
+    return [MODELS / "event_probabilities_2026.csv", MODELS / "features_host_advantage.csv",
+            datasets.table_path("awards"), datasets.table_path("hosts")]
+
+
+def scenario_engine(refresh=False):
+    """Engine over the current 2026 probabilities (memoized, rebuilt when one of source_paths() changes)."""
+    from .datasets import file_version, load_awards, load_hosts, load_medals
+    from .host_advantage import host_advantage
+    from .simulate import baseline_probabilities, event_programme
+
+    rated, feats = source_paths()[:2]
+    stamp = file_version(source_paths())
+    if refresh or _engine.get("stamp") != stamp:
+        if rated.exists():
+            probs = pd.read_csv(rated)         # python -m olympic_data.ratings
+        else:
+            awards = load_awards(season="Winter")
+            probs = baseline_probabilities(awards, event_programme(awards, medals=load_medals(season="Winter")))
+        f = pd.read_csv(feats) if feats.exists() else host_advantage(load_hosts(), load_awards())
+        _engine.update(stamp=stamp, engine=ScenarioEngine(probs, lift=host_lift(f)))
+    return _engine["engine"]
+
+
+EXAMPLES = [
+    {"name": "no Russian athletes", "absent": ["RUS", "ROC", "OAR", "URS", "EUN"]},
+    {"name": "host advantage doubled", "host_advantage": 2},
+    {"name": "no host advantage", "host_advantage": 0},
+    {"name": "Norway at 80%", "strength": {"NOR": 0.8}},
+    {"name": "no biathlon", "drop_sports": ["Biathlon"]},
+]
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from .paths import MODELS
+
+    parser = argparse.ArgumentParser(description="Score what-if scenarios for the 2026 medal table")
+    parser.add_argument("--scenarios", help="JSON file with a list of scenarios (default: built-in examples)")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    scenarios = json.loads(open(args.scenarios, encoding="utf-8").read()) if args.scenarios else EXAMPLES
+    engine = scenario_engine()
+    t0 = time.perf_counter()
+    table = engine.score(scenarios, processes=args.processes)
+    print(f"{len(scenarios)} scenarios x {len(engine.events)} events scored in "
+          f"{1e3 * (time.perf_counter() - t0):.0f}ms (host lift {engine.lift:.2f})")
+
+    MODELS.mkdir(parents=True, exist_ok=True)
+    out = MODELS / "scenarios_2026.csv"
+    table.to_csv(out, index=False, encoding="utf-8")
+    for name, part in table.groupby("scenario", sort=False):
+        print(f"\n{name}:")
+        print(part.head(args.top)[["noc", "gold", "total", "gold_change", "total_change"]]
+              .round(2).to_string(index=False))
+    print(f"\n Saved -> {out}")
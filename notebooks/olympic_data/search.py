@@ -0,0 +1,281 @@
+# notebooks/olympic_data/search.py
+"""
+Search index over athletes, events, sports and countries (names and NOC codes).
+
+    from olympic_data.search import search_index
+    idx = search_index()
+    idx.search("bjørg")                    # prefix, topped up with fuzzy matches
+    idx.prefix("slalom", kind="event")
+    idx.fuzzy("bjorgenn")                  # typo tolerant
+
+    cd notebooks && python -m olympic_data.search "query" ...   # rebuild + query
+
+Every document has an accent-folded text (athlete_index.normalize_name:
+"Marit BJØRGEN" -> "marit bjorgen"), plus its German / Scandinavian
+spelling when different ("bjoergen"). Two structures, all NumPy arrays:
+
+- prefix: a sorted array of every word-start suffix of every text
+  ("marit bjorgen", "bjorgen"), so a prefix query on any word is two binary
+  searches, as in AthleteNameIndex;
+- fuzzy: the distinct words of all texts with a trigram inverted index
+  (CSR postings). Query words are matched to index words by trigram Dice
+  score; a document scores the mean over query words of its best match.
+
+The index is saved to data/clean/search_index.npz and rebuilt only when a
+source table is newer.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from . import datasets, paths
+from .athlete_index import _fold, normalize_name
+
+KINDS = ["athlete", "event", "sport", "country"]
+SOURCES = ["athlete_dim", "awards", "medals", "hosts"]
+_memo = {}
+
+# German / Scandinavian spellings: "Bjørgen" is also written "Bjoergen"
+_TRANSLIT = str.maketrans({"ø": "oe", "Ø": "OE", "ö": "oe", "Ö": "OE", "ä": "ae", "Ä": "AE",
+                           "ü": "ue", "Ü": "UE", "å": "aa", "Å": "AA"})
+
+
+def fold_query(query):
+    """Same folding as normalize_name, for one string (no pandas on the query path)."""
+    return re.sub(r"[^a-z0-9]+", " ", _fold(query).lower()).strip()
+
+
+def query_variants(query):
+    """Folded query, plus its transliterated spelling when it differs."""
+    folded = fold_query(query)
+    alt = fold_query(query.translate(_TRANSLIT))
+    return [folded, alt] if alt != folded else [folded]
+
+
+def _trigrams(word):
+    w = f" {word} "
+    return {w[i:i + 3] for i in range(len(w) - 2)}
+
+
+def _ranges(lo, hi):
+    """Concatenation of arange(lo[i], hi[i]) without a Python loop."""
+    n = hi - lo
+    total = int(n.sum())
+    if not total:
+        return np.zeros(0, dtype="int64")
+    return np.repeat(lo - np.concatenate(([0], np.cumsum(n)[:-1])), n) + np.arange(total)
+
+
+# ---------- documents ----------
+def build_documents(awards, dim=None, hosts=None):
+    """One row per searchable thing: kind, ref (id to look it up), label (display), text / alt_text (folded)."""
+    docs = []
+    if dim is not None:
+        # team lines (GameTeam without a URL) never get an athlete_id (athlete_index._row_keys)
+        docs.append(pd.DataFrame({"kind": "athlete", "ref": dim["athlete_id"].astype(str),
+                                  "label": dim["athlete_name"], "text": dim["name_key"]}))
+
+    ev = awards[["sport", "event", "event_gender"]].drop_duplicates().fillna("")
+    docs.append(pd.DataFrame({"kind": "event",
+                              "ref": ev["sport"] + "|" + ev["event"] + "|" + ev["event_gender"],
+                              "label": ev["sport"] + " - " + ev["event"],
+                              "text": normalize_name(ev["event"] + " " + ev["sport"])}))
+
+    sports = pd.Series(awards["sport"].dropna().unique())
+    docs.append(pd.DataFrame({"kind": "sport", "ref": sports, "label": sports, "text": normalize_name(sports)}))
+
+    names = awards[["noc", "country", "year"]].dropna()
+    if hosts is not None:
+        from .countries import host_nocs
+        h = host_nocs(hosts, awards).dropna(subset=["host_noc"])
+        names = pd.concat([names, pd.DataFrame({"noc": h["host_noc"], "country": h["country"], "year": h["year"]})])
+    names = names.sort_values("year").drop_duplicates(["noc", "country"], keep="last")
+    # one document per NOC: latest name as label; the code and every name it was listed under as text
+    latest = names.drop_duplicates("noc", keep="last").set_index("noc")["country"]
+    text = names.groupby("noc")["country"].agg(" ".join)
+    docs.append(pd.DataFrame({"kind": "country", "ref": text.index, "label": latest.reindex(text.index).values,
+                              "text": normalize_name(text.index.to_series() + " " + text).values}))
+
+    out = pd.concat(docs, ignore_index=True)
+    out = out[out["text"].str.len() > 0].reset_index(drop=True)
+    alt = normalize_name(out["label"].astype("string").str.translate(_TRANSLIT))
+    out["alt_text"] = alt.where(alt != normalize_name(out["label"]), "")
+    return out.astype({c: "string" for c in ["kind", "ref", "label", "text", "alt_text"]})
+
+
+# ---------- index ----------
+class SearchIndex:
+    ARRAYS = ["doc_kind", "doc_ref", "doc_label", "doc_len", "keys", "key_doc", "key_pos", "words",
+              "word_doc_ptr", "word_doc", "word_ngrams", "grams", "gram_ptr", "gram_word"]
+
+    def __init__(self, arrays):
+        for k in self.ARRAYS:
+            setattr(self, k, arrays[k])
+
+    @classmethod
+    def build(cls, docs):
+        texts = [(d, t) for col in ("text", "alt_text")
+                 for d, t in enumerate(docs[col].fillna("").tolist()) if t]
+
+        # prefix: word-start suffixes
+        keys, key_doc, key_pos = [], [], []
+        for d, t in texts:
+            words = t.split(" ")
+            for i in range(len(words)):
+                keys.append(" ".join(words[i:]))
+                key_doc.append(d)
+                key_pos.append(i)
+        keys = np.asarray(keys, dtype=str)
+        order = np.argsort(keys, kind="stable")
+
+        # fuzzy: distinct words -> docs (CSR), trigram -> words (CSR)
+        word_doc = pd.DataFrame([(w, d) for d, t in texts for w in t.split(" ")], columns=["word", "doc"])
+        word_doc = word_doc.drop_duplicates().sort_values(["word", "doc"])
+        words, first = np.unique(word_doc["word"].to_numpy(dtype=str), return_index=True)
+        tri = pd.DataFrame([(g, w) for w, word in enumerate(words.tolist()) for g in _trigrams(word)],
+                           columns=["gram", "word"]).sort_values(["gram", "word"])
+        grams, gram_first = np.unique(tri["gram"].to_numpy(dtype=str), return_index=True)
+
+        return cls({
+            "doc_kind": docs["kind"].map({k: i for i, k in enumerate(KINDS)}).to_numpy("int8"),
+            "doc_ref": docs["ref"].to_numpy(dtype=str),
+            "doc_label": docs["label"].fillna("").to_numpy(dtype=str),
+            "doc_len": docs["text"].str.len().to_numpy("int32"),
+            "keys": keys[order],
+            "key_doc": np.asarray(key_doc, dtype="int64")[order],
+            "key_pos": np.asarray(key_pos, dtype="int16")[order],
+            "words": words,
+            "word_doc_ptr": np.append(first, len(word_doc)).astype("int64"),
+            "word_doc": word_doc["doc"].to_numpy("int64"),
+            "word_ngrams": np.asarray([len(_trigrams(w)) for w in words.tolist()], dtype="int16"),
+            "grams": grams,
+            "gram_ptr": np.append(gram_first, len(tri)).astype("int64"),
+            "gram_word": tri["word"].to_numpy("int64"),
+        })
+
+    def save(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez(tmp, **{k: getattr(self, k) for k in self.ARRAYS})
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as z:
+            return cls({k: z[k] for k in cls.ARRAYS})
+
+    def _results(self, docs, scores, kind, limit):
+        if kind is not None:
+            keep = self.doc_kind[docs] == KINDS.index(kind)
+            docs, scores = docs[keep], scores[keep]
+        # best score first, then shorter (more specific) texts
+        order = np.lexsort((self.doc_len[docs], -scores))[:limit]
+        return [{"kind": KINDS[self.doc_kind[d]], "ref": str(self.doc_ref[d]), "label": str(self.doc_label[d]),
+                 "score": round(float(s), 3)} for d, s in zip(docs[order], scores[order])]
+
+    def prefix(self, query, kind=None, limit=10):
+        """
+        Documents with a word starting with `query` (several words: consecutive words).
+
+        Score: 1.0 whole-word match, 0.95 prefix of the first word, 0.9 of a later word.
+        """
+        docs, scores = [], []
+        for q in query_variants(query):
+            if not q:
+                continue
+            lo = np.searchsorted(self.keys, q, side="left")
+            hi = np.searchsorted(self.keys, q + "\uffff", side="left")
+            keys = self.keys[lo:hi]
+            whole = (np.char.str_len(keys) == len(q)) | np.char.startswith(keys, q + " ")
+            docs.append(self.key_doc[lo:hi])
+            scores.append(np.where(whole, 1.0, np.where(self.key_pos[lo:hi] == 0, 0.95, 0.9)))
+        if not docs:
+            return []
+        docs, scores = np.concatenate(docs), np.concatenate(scores)
+        # a document can match on several words / spellings: keep its best score
+        order = np.lexsort((-scores, docs))
+        docs, scores = docs[order], scores[order]
+        first = np.ones(len(docs), dtype=bool)
+        first[1:] = docs[1:] != docs[:-1]
+        return self._results(docs[first], scores[first], kind, limit)
+
+    def _similar_words(self, word, min_score):
+        """(word ids, Dice scores) of index words sharing enough trigrams with `word`."""
+        grams = np.asarray(sorted(_trigrams(word)), dtype=self.grams.dtype)
+        at = np.minimum(np.searchsorted(self.grams, grams), len(self.grams) - 1)
+        at = at[self.grams[at] == grams]
+        hits = self.gram_word[_ranges(self.gram_ptr[at], self.gram_ptr[at + 1])]
+        ids, shared = np.unique(hits, return_counts=True)
+        dice = 2.0 * shared / (len(grams) + self.word_ngrams[ids])
+        keep = dice >= min_score
+        return ids[keep], dice[keep]
+
+    def fuzzy(self, query, kind=None, limit=10, min_score=0.45):
+        """Documents whose words are close to the query words (Dice over trigrams)."""
+        variants = [v.split() for v in query_variants(query) if v]
+        if not variants:
+            return []
+        total = np.zeros(len(self.doc_kind))
+        for spellings in zip(*variants):           # transliteration keeps the word count
+            best = np.zeros(len(self.doc_kind))
+            for w in set(spellings):
+                ids, dice = self._similar_words(w, min_score)
+                lo, hi = self.word_doc_ptr[ids], self.word_doc_ptr[ids + 1]
+                np.maximum.at(best, self.word_doc[_ranges(lo, hi)], np.repeat(dice, hi - lo))
+            total += best
+        total /= len(variants[0])
+        docs = np.flatnonzero(total >= min_score)
+        return self._results(docs, total[docs], kind, limit)
+
+    def search(self, query, kind=None, limit=10):
+        """Prefix matches first, topped up with fuzzy matches (for autocomplete)."""
+        out = self.prefix(query, kind=kind, limit=limit)
+        if len(out) < limit:
+            seen = {(r["kind"], r["ref"]) for r in out}
+            out += [r for r in self.fuzzy(query, kind=kind, limit=limit)
+                    if (r["kind"], r["ref"]) not in seen][:limit - len(out)]
+        return out
+
+
+def index_path():
+    return paths.CLEAN / "search_index.npz"
+
+
+def source_paths():
+    """The clean tables the index is built from."""
+    return [datasets.table_path(t) for t in SOURCES]
+
+
+def search_index(refresh=False):
+    """The persisted index, rebuilt when a source table is newer than the file."""
+    stamp = datasets.file_version(source_paths())
+    if _memo.get("stamp") == stamp and not refresh:
+        return _memo["index"]
+    path = index_path()
+    sources = [p for p in source_paths() if p.exists()]
+    newest = max((p.stat().st_mtime for p in sources), default=0)
+    if not refresh and path.exists() and path.stat().st_mtime >= newest:
+        idx = SearchIndex.load(path)
+    else:
+        dim = datasets.load_athlete_dim() if datasets.table_path("athlete_dim").exists() else None
+        idx = SearchIndex.build(build_documents(datasets.load_awards(), dim, datasets.load_hosts()))
+        idx.save(path)
+    _memo.update(stamp=stamp, index=idx)
+    return idx
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    t0 = time.perf_counter()
+    idx = search_index(refresh=True)
+    print(f"Index of {len(idx.doc_kind)} documents, {len(idx.keys)} prefix keys, {len(idx.words)} words "
+          f"built in {time.perf_counter() - t0:.2f}s -> {index_path()}")
+    for q in sys.argv[1:] or ["bjørgen", "slalom", "nor", "bjorgenn"]:
+        t0 = time.perf_counter()
+        hits = idx.search(q)
+        print(f"\n{q!r} ({1e3 * (time.perf_counter() - t0):.2f} ms)")
+        for h in hits:
+            print(f"  {h['kind']:8s} {h['score']:.2f}  {h['label']}  [{h['ref']}]")
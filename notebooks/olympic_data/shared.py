@@ -0,0 +1,164 @@
+# notebooks/olympic_data/shared.py
+"""
+Clean tables published once as memory-mapped Arrow files, shared by worker processes.
+
+    cd notebooks && python -m olympic_data.shared          # publish a new version
+    cd notebooks && python -m olympic_data.api --shared    # API workers attach to it
+
+Layout:
+
+    data/clean/shared/<version>/<table>.arrow    uncompressed Arrow IPC files
+    data/clean/shared/CURRENT                    {"version": ..., "tables": [...]}
+
+Workers open the files with pyarrow.memory_map, so every process reads the
+same page-cache pages: numeric columns come out as zero-copy NumPy views and
+nothing is parsed on attach. A publish writes a complete new version folder
+and then replaces CURRENT (an atomic rename). A worker calls snapshot() per
+request: it only stats CURRENT, and when the version changed it maps the new
+folder; requests already holding the previous snapshot finish on it. Old
+versions are pruned after `keep` publishes (their open mappings stay valid).
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from .paths import CLEAN
+
+SHARED = CLEAN / "shared"
+POINTER = "CURRENT"
+DEFAULT_TABLES = ["hosts", "medals", "awards"]
+
+
+def _pa():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:      # optional dependency, only needed for shared mode
+        raise ImportError("Shared datasets need pyarrow (pip install pyarrow)") from e
+    return pa
+
+
+def _file_digest(folder):
+    digest = hashlib.sha1()
+    for path in sorted(folder.iterdir()):
+        digest.update(path.name.encode())
+        with open(path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def publish_shared(frames, root=SHARED, keep=2):
+    """
+    Write {name: DataFrame} as a new version and make it current; returns the version id.
+
+    The version is the publish time (microseconds, so versions sort in publish
+    order) plus a hash of the written files: two publishes never share a
+    version unless they wrote the same bytes at the same instant.
+    """
+    pa = _pa()
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    now = time.time_ns()
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.localtime(now // 10**9)) + f".{now // 1000 % 10**6:06d}"
+    tables = {name: pa.Table.from_pandas(df, preserve_index=False) for name, df in frames.items()}
+
+    staging = Path(tempfile.mkdtemp(prefix=".publish-", dir=root))
+    for name, table in tables.items():
+        with pa.OSFile(str(staging / f"{name}.arrow"), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    version = f"{stamp}-{_file_digest(staging)[:12]}"
+    try:
+        staging.rename(root / version)
+    except OSError:
+        if not (root / version).is_dir():
+            raise
+        shutil.rmtree(staging, ignore_errors=True)       # same bytes already published as this version
+
+    tmp = root / f".{POINTER}.{os.getpid()}.{now}.tmp"
+    tmp.write_text(json.dumps({"version": version, "tables": sorted(tables)}), encoding="utf-8")
+    os.replace(tmp, root / POINTER)
+
+    versions = sorted(p for p in root.iterdir() if p.is_dir() and not p.name.startswith("."))
+    for old in versions[:-keep]:
+        if old.name != version:
+            shutil.rmtree(old, ignore_errors=True)
+    return version
+
+
+class Snapshot:
+    """One version of the shared tables (immutable; safe to keep for the length of a request)."""
+
+    def __init__(self, root, version, names):
+        pa = _pa()
+        self.version = version
+        self._tables = {}
+        for name in names:
+            source = pa.memory_map(str(Path(root) / version / f"{name}.arrow"), "r")
+            self._tables[name] = pa.ipc.open_file(source).read_all()   # buffers point into the mapping
+
+    def __contains__(self, name):
+        return name in self._tables
+
+    def table(self, name):
+        return self._tables[name]
+
+    def column(self, name, col):
+        """NumPy view of one column (zero-copy for numeric columns without nulls)."""
+        return self._tables[name].column(col).to_numpy()
+
+    def to_pandas(self, name, columns=None):
+        t = self._tables[name]
+        return (t.select(list(columns)) if columns else t).to_pandas()
+
+
+class SharedDataset:
+    """Per-worker handle on data/clean/shared; snapshot() follows CURRENT."""
+
+    def __init__(self, root=SHARED):
+        self.root = Path(root)
+        self._stamp = None
+        self._snapshot = None
+
+    def snapshot(self):
+        pointer = self.root / POINTER
+        stat = pointer.stat()
+        stamp = (stat.st_mtime_ns, stat.st_ino)
+        if stamp != self._stamp:
+            current = json.loads(pointer.read_text(encoding="utf-8"))
+            if self._snapshot is None or current["version"] != self._snapshot.version:
+                self._snapshot = Snapshot(self.root, current["version"], current["tables"])
+            self._stamp = stamp
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self.snapshot().version
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import pandas as pd
+
+    from . import datasets
+    from .paths import MODELS
+
+    parser = argparse.ArgumentParser(description="Publish clean tables as shared memory-mapped Arrow files")
+    parser.add_argument("--tables", nargs="*", default=DEFAULT_TABLES)
+    parser.add_argument("--keep", type=int, default=2, help="versions kept on disk")
+    args = parser.parse_args()
+
+    frames = {t: datasets.load(t) for t in args.tables}
+    # model feature tables, when they have been built
+    for name, path in [("host_advantage", MODELS / "features_host_advantage.csv"),
+                       ("event_probabilities", MODELS / "event_probabilities_2026.csv")]:
+        if path.exists():
+            frames[name] = pd.read_csv(path)
+    version = publish_shared(frames, keep=args.keep)
+    print(f"Published {', '.join(f'{k} ({len(v)} rows)' for k, v in frames.items())} -> {SHARED / version}")
@@ -0,0 +1,242 @@
+# notebooks/olympic_data/simulate.py
+"""
+Monte Carlo simulation of a Games from event-level medal probabilities.
+
+Input is a long table (sport, event, event_gender, noc, prob[, team]): for
+each event, prob is how likely each NOC is to win it. A NOC enters an
+individual event with ENTRANTS athletes (its prob split evenly between
+them) and a team event (`team`, from participant_type, see
+event_programme) with one team, so a strong NOC can take several medals of
+an individual event, as in real Games (32 of the 109 Winter 2022 events had
+a NOC with two or more). Every simulated Games draws gold, then silver,
+then bronze per event among these entrants without replacement, on a whole
+(sims x events) block at once:
+
+- each event's candidate NOCs get a Walker/Vose alias table, so one draw is
+  two array gathers whatever the size of the field;
+- silver and bronze are drawn from the same table and redrawn only where
+  they hit an entrant already on the podium (exact conditional distribution, and
+  the redraw set shrinks geometrically).
+
+Counts per NOC come from one bincount per block. 100k Games for the ~110
+Winter events take a few seconds on one core; `processes=` splits the draws
+over worker processes with independent seeds.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .countries import DEFUNCT_NOCS
+
+EVENT_KEY = ["sport", "event", "event_gender"]
+ENTRANTS = 3                        # entrants per NOC in an individual event (enough for a sweep)
+MEDAL_POINTS = {"GOLD": 3, "SILVER": 2, "BRONZE": 1}
+
+
+def event_programme(awards, season="Winter", year=None, medals=None):
+    """
+    Events (sport, event, event_gender) of the latest edition of `season`: the programme proxy for 2026.
+    With `medals`, also `team`: the event's medal lines are mostly participant_type "GameTeam".
+    """
+    df = awards[awards["season"] == season]
+    year = year or int(df["year"].max())
+    events = (df[df["year"] == year][EVENT_KEY]
+              .drop_duplicates().sort_values(EVENT_KEY).reset_index(drop=True))
+    if medals is not None:
+        m = medals[(medals["season"] == season) & (medals["year"] == year)]
+        team = m["participant_type"].eq("GameTeam").groupby([m[c] for c in EVENT_KEY]).mean() >= 0.5
+        events = events.merge(team.rename("team").reset_index(), on=EVENT_KEY, how="left")
+        events["team"] = events["team"].fillna(False).astype(bool)
+    return events
+
+
+def baseline_probabilities(awards, events, season="Winter", since=1994, half_life=2, floor=0.02):
+    """
+    Historical podium share per (event, NOC): medal points (3/2/1), each edition
+    weighted 0.5 ** (editions_ago / half_life). NOCs that won the sport but
+    never this event get a small `floor` share so every event has >= 3 candidates.
+    NOCs that no longer exist (countries.DEFUNCT_NOCS) are not candidates.
+    """
+    df = awards[(awards["season"] == season) & (awards["year"] >= since)].copy()
+    editions = np.sort(df["year"].unique())
+    ago = len(editions) - 1 - np.searchsorted(editions, df["year"].to_numpy())
+    df["w"] = df["medal"].map(MEDAL_POINTS).fillna(0).to_numpy() * 0.5 ** (ago / half_life)
+
+    by_event = df.groupby(EVENT_KEY + ["noc"], as_index=False)["w"].sum()
+    by_sport = df.groupby(["sport", "noc"], as_index=False)["w"].sum()
+
+    # candidates per event: everyone with history in the event's sport that still exists
+    by_sport = by_sport[~by_sport["noc"].isin(DEFUNCT_NOCS)]
+    cand = events.merge(by_sport[["sport", "noc"]], on="sport")
+    cand = cand.merge(by_event, on=EVENT_KEY + ["noc"], how="left")
+    cand["w"] = cand["w"].fillna(0)
+    total = cand.groupby(EVENT_KEY)["w"].transform("sum")
+    n = cand.groupby(EVENT_KEY)["w"].transform("size")
+    share = np.where(total > 0, cand["w"] / total.where(total > 0, 1), 1.0 / n)
+    cand["prob"] = share + floor
+    cand["prob"] /= cand.groupby(EVENT_KEY)["prob"].transform("sum")
+    return cand[EVENT_KEY + ["noc", "prob"] + (["team"] if "team" in cand.columns else [])]
+
+
+def probability_matrix(probs, entrants=ENTRANTS):
+    """
+    Long probs -> (events, nocs, cand_noc, cand_p): per event a row of entrant
+    slots, each with its NOC index and probability, padded to the largest field
+    with p = 0. A NOC gets `entrants` slots of prob / entrants in an individual
+    event, one slot in a team event (probs["team"], all individual when absent).
+    """
+    probs = probs[probs["prob"] > 0]
+    events = probs[EVENT_KEY].drop_duplicates().reset_index(drop=True)
+    nocs = np.sort(probs["noc"].unique())
+    long = probs.merge(events.reset_index(), on=EVENT_KEY)
+    team = long["team"].fillna(False).astype(bool).to_numpy() if "team" in long.columns else False
+    k = np.where(team, 1, entrants) * np.ones(len(long), dtype=np.int64)
+    long = long.loc[long.index.repeat(k)].assign(prob=long["prob"].to_numpy().repeat(k) / k.repeat(k))
+    long = long.sort_values(["index", "prob", "noc"], ascending=[True, False, True], kind="stable")
+    ev_idx = long["index"].to_numpy()
+    slot = long.groupby("index").cumcount().to_numpy()
+    width = int(slot.max()) + 1
+    cand_noc = np.zeros((len(events), width), dtype=np.int64)
+    cand_p = np.zeros((len(events), width))
+    cand_noc[ev_idx, slot] = np.searchsorted(nocs, long["noc"].to_numpy())
+    cand_p[ev_idx, slot] = long["prob"].to_numpy()
+    return events, nocs, cand_noc, cand_p / cand_p.sum(axis=1, keepdims=True)
+
+
+def alias_tables(cand_p):
+    """Vose alias tables, one row per event: slot j is kept with prob[j], else replaced by alias[j]."""
+    n_events, width = cand_p.shape
+    prob = np.zeros((n_events, width))
+    alias = np.zeros((n_events, width), dtype=np.int64)
+    for e in range(n_events):
+        scaled = cand_p[e] * width
+        small = [j for j in range(width) if scaled[j] < 1.0]
+        large = [j for j in range(width) if scaled[j] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[e, s], alias[e, s] = scaled[s], l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for j in small + large:                  # leftovers are 1 up to rounding
+            prob[e, j], alias[e, j] = 1.0, j
+    return prob, alias
+
+
+def _draw(prob, alias, base, width, rng):
+    """
+    One slot per row; `base` = event index * width into the flattened tables.
+    A single uniform gives both the slot (integer part) and the keep test (fraction).
+    """
+    u = rng.random(base.shape) * width
+    j = u.astype(np.int64)
+    at = base + j
+    return np.where(u - j < prob[at], j, alias[at])
+
+
+def _simulate_block(cand_noc, prob, alias, n_nocs, n_sims, rng):
+    """(n_sims, n_nocs, 3) medal counts for one block of simulated Games."""
+    n_events, width = prob.shape
+    prob, alias, cand_noc = prob.ravel(), alias.ravel(), cand_noc.ravel()
+    base = np.tile(np.arange(n_events) * width, n_sims)      # flat (sim, event) rows
+
+    podium = []                                              # slot picks: gold, silver, bronze
+
+    def clashes(pick, rows, m):
+        """Subset of `rows` whose pick is already on the podium."""
+        hit = np.zeros(len(rows), dtype=bool)
+        for earlier in podium[:m]:
+            hit |= pick[rows] == earlier[rows]
+        return rows[hit]
+
+    for m in range(3):
+        pick = _draw(prob, alias, base, width, rng)
+        rows = clashes(pick, np.arange(len(base)), m)
+        while rows.size:
+            # redraw only the rows that picked a NOC already on this podium
+            pick[rows] = _draw(prob, alias, base[rows], width, rng)
+            rows = clashes(pick, rows, m)
+        podium.append(pick)
+
+    sim_off = np.repeat(np.arange(n_sims) * n_nocs, n_events)
+    counts = np.zeros(n_sims * n_nocs * 3, dtype=np.int64)
+    for m, pick in enumerate(podium):
+        nocs = cand_noc[base + pick]                         # slot -> NOC index
+        counts[m::3] = np.bincount(sim_off + nocs, minlength=n_sims * n_nocs)
+    return counts.reshape(n_sims, n_nocs, 3).astype(np.int16)
+
+
+def _run(cand_noc, cand_p, n_nocs, n_sims, seed, block):
+    rng = np.random.default_rng(seed)
+    prob, alias = alias_tables(cand_p)
+    out = [_simulate_block(cand_noc, prob, alias, n_nocs, min(block, n_sims - s), rng)
+           for s in range(0, n_sims, block)]
+    return np.concatenate(out) if out else np.zeros((0, n_nocs, 3), dtype=np.int16)
+
+
+def simulate_games(probs, n_sims=100_000, seed=2026, block=10_000, processes=None):
+    """
+    Simulate `n_sims` Games. Returns (nocs, counts) with counts of shape
+    (n_sims, n_nocs, 3) = gold/silver/bronze per simulated Games.
+
+    processes: None/1 runs in-process; N > 1 splits draws over N worker processes.
+    """
+    _, nocs, cand_noc, cand_p = probability_matrix(probs)
+    if ((cand_p > 0).sum(axis=1) < 3).any():
+        raise ValueError("Every event needs at least 3 entrants with non-zero probability to fill a podium")
+
+    if not processes or processes == 1:
+        return nocs, _run(cand_noc, cand_p, len(nocs), n_sims, seed, block)
+
+    seeds = np.random.SeedSequence(seed).spawn(processes)
+    sizes = [n_sims // processes + (i < n_sims % processes) for i in range(processes)]
+    n = [len(nocs)] * processes
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        parts = list(pool.map(_run, [cand_noc] * processes, [cand_p] * processes, n,
+                              sizes, seeds, [block] * processes))
+    return nocs, np.concatenate(parts)
+
+
+def summarize(nocs, counts, quantiles=(0.05, 0.5, 0.95)):
+    """Per-NOC mean and quantiles of gold and total medals across simulations."""
+    gold = counts[:, :, 0]
+    total = counts.sum(axis=2)
+    out = pd.DataFrame({"noc": nocs, "gold_mean": gold.mean(axis=0), "total_mean": total.mean(axis=0)})
+    for q, g, t in zip(quantiles, np.quantile(gold, quantiles, axis=0), np.quantile(total, quantiles, axis=0)):
+        out[f"gold_q{int(q * 100):02d}"] = g
+        out[f"total_q{int(q * 100):02d}"] = t
+    out["p_most_gold"] = (gold == gold.max(axis=1, keepdims=True)).mean(axis=0)
+    return out.sort_values(["gold_mean", "total_mean"], ascending=False).reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from .datasets import load_awards, load_medals
+    from .paths import MODELS
+
+    parser = argparse.ArgumentParser(description="Simulate Milano-Cortina 2026 medal tables")
+    parser.add_argument("--sims", type=int, default=100_000)
+    parser.add_argument("--processes", type=int, default=1)
+    args = parser.parse_args()
+
+    awards = load_awards(season="Winter")
+    events = event_programme(awards, medals=load_medals(season="Winter"))
+    rated = MODELS / "event_probabilities_2026.csv"
+    if rated.exists():
+        # written by `python -m olympic_data.ratings`
+        probs = pd.read_csv(rated)
+        print("Using rating-based probabilities:", rated)
+    else:
+        probs = baseline_probabilities(awards, events)
+    t0 = time.perf_counter()
+    nocs, counts = simulate_games(probs, n_sims=args.sims, processes=args.processes)
+    print(f"{args.sims} simulations of {len(events)} events in {time.perf_counter() - t0:.1f}s")
+
+    summary = summarize(nocs, counts)
+    MODELS.mkdir(parents=True, exist_ok=True)
+    out = MODELS / "sim_2026_medal_distribution.csv"
+    summary.to_csv(out, index=False, encoding="utf-8")
+    print(summary.head(15).to_string(index=False))
+    print(f" Saved -> {out}")
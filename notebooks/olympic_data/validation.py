@@ -0,0 +1,185 @@
+# notebooks/olympic_data/validation.py
+"""
+Declarative data checks run at the end of each cleaning stage.
+
+Each table has a list of rules; a rule is a name plus a function that takes
+the whole frame and returns a boolean mask of offending rows (no per-row
+Python). Rows failing a "quarantine" rule are moved to
+data/clean/quarantine/<table>.csv with the failed rule names; "warn" rules
+only show up in the report (e.g. genuine ties for gold).
+"""
+import pandas as pd
+
+from .paths import CLEAN
+
+QUARANTINE = CLEAN / "quarantine"
+MEDALS = ["GOLD", "SILVER", "BRONZE"]
+NULL_LIKE = ["nan", "none", "<na>", "nat", "null"]     # what astype(str) leaves behind
+NOC_RE = r"^[A-Z]{3}$"
+
+
+# ---------- rule builders (each returns df -> bool mask) ----------
+def unique(cols):
+    def check(df, ctx):
+        return df.duplicated(subset=cols, keep=False)
+    return check
+
+
+def not_null(cols):
+    def check(df, ctx):
+        present = [c for c in cols if c in df.columns]
+        return df[present].isna().any(axis=1)
+    return check
+
+
+def no_literal_nan(cols):
+    def check(df, ctx):
+        bad = pd.Series(False, index=df.index)
+        for c in cols:
+            if c in df.columns:
+                bad |= df[c].astype("string").str.strip().str.lower().isin(NULL_LIKE).fillna(False)
+        return bad
+    return check
+
+
+def between(col, lo, hi):
+    def check(df, ctx):
+        v = pd.to_numeric(df[col], errors="coerce")
+        return (v < lo) | (v > hi)
+    return check
+
+
+def medal_flags(medal_col="medal", allow_empty=False):
+    """gold/silver/bronze must be 0/1 and agree with the medal label (which may be empty with allow_empty)."""
+    def check(df, ctx):
+        bad = ~df[medal_col].isin(MEDALS)
+        if allow_empty:
+            bad &= df[medal_col].fillna("").ne("")
+        for m in MEDALS:
+            flag = m.lower()
+            if flag in df.columns:
+                bad |= df[flag].ne((df[medal_col] == m).astype(int))
+        return bad
+    return check
+
+
+def known_games(year_col="year", slug_col=None):
+    """Year (and slug when present) must be an edition listed in the hosts table."""
+    def check(df, ctx):
+        hosts = ctx["hosts"]
+        if hosts is None:
+            raise KeyError("hosts table")           # no olympic_hosts_clean.csv yet: rule skipped
+        bad = ~df[year_col].isin(hosts["year"])
+        if slug_col and slug_col in df.columns:
+            bad |= ~df[slug_col].isin(hosts["slug"])
+        return bad
+    return check
+
+
+def valid_noc(col="noc"):
+    def check(df, ctx):
+        noc = df[col].astype("string")
+        return ~noc.str.fullmatch(NOC_RE).fillna(False) | noc.str.lower().isin(NULL_LIKE).fillna(False)
+    return check
+
+
+def single_gold(event_cols, medal_col="medal", individual=None):
+    """At most one GOLD per individual event (counted with one groupby)."""
+    def check(df, ctx):
+        gold = df[medal_col].eq("GOLD")
+        if individual is not None:
+            gold &= individual(df)
+        n_gold = gold.groupby([df[c] for c in event_cols], dropna=False).transform("sum")
+        return gold & (n_gold > 1)
+    return check
+
+
+def _individual_medals(df):
+    return df["participant_type"].astype("string").str.lower().eq("athlete")
+
+
+# ---------- rules per table: (name, check, action) ----------
+AWARD_KEY = ["year", "sport", "event", "medal", "noc"]
+
+RULES = {
+    "hosts": [
+        ("unique_slug", unique(["slug"]), "quarantine"),
+        ("year_range", between("year", 1896, 2100), "quarantine"),
+        ("literal_nan", no_literal_nan(["city", "country", "slug", "name"]), "quarantine"),
+    ],
+    "medals": [
+        ("medal_flags", medal_flags(), "quarantine"),
+        ("known_games", known_games("year", "games_slug"), "quarantine"),
+        ("valid_noc", valid_noc("noc"), "quarantine"),
+        ("literal_nan", no_literal_nan(["sport", "event", "athlete", "athlete_url",
+                                        "participant_title", "country", "country_code"]), "quarantine"),
+        ("single_gold_individual", single_gold(["games_slug", "sport", "event", "event_gender"],
+                                               individual=_individual_medals), "warn"),
+    ],
+    "awards": [
+        ("unique_award_key", unique(AWARD_KEY), "quarantine"),
+        ("medal_values", lambda df, ctx: ~df["medal"].isin(MEDALS), "quarantine"),
+        ("known_games", known_games("year", "games_slug"), "quarantine"),
+        ("valid_noc", valid_noc("noc"), "quarantine"),
+        ("literal_nan", no_literal_nan(["sport", "event", "country"]), "quarantine"),
+    ],
+    "results": [
+        ("medal_flags", medal_flags("medal_type", allow_empty=True), "warn"),     # non-medalists: ""
+        ("known_games", known_games("year", "slug_game"), "quarantine"),
+        ("valid_noc", valid_noc("country_3_letter_code"), "warn"),
+        ("literal_nan", no_literal_nan(["athlete_full_name", "athlete_url", "country_name",
+                                        "rank_position", "value_type", "value_unit"]), "warn"),
+    ],
+    "athletes": [
+        ("unique_athlete", unique(["athlete_url"]), "quarantine"),
+        ("birth_year_range", between("athlete_year_birth", 1840, 2015), "quarantine"),
+        ("first_year_range", between("first_year", 1896, 2030), "quarantine"),
+        ("literal_nan", no_literal_nan(["athlete_full_name", "athlete_url", "first_game"]), "quarantine"),
+    ],
+}
+
+
+def validate(df, table, hosts=None):
+    """
+    Run RULES[table] on df.
+
+    Returns (kept, quarantined, report): quarantined rows carry a `failed_rules`
+    column; report has one line per rule with its action and failing row count.
+    hosts defaults to olympic_hosts_clean.csv; without it known_games is skipped.
+    """
+    hosts_path = CLEAN / "olympic_hosts_clean.csv"
+    if hosts is None and hosts_path.exists():
+        hosts = pd.read_csv(hosts_path)
+    ctx = {"hosts": hosts}
+    masks, report = {}, []
+    for name, check, action in RULES[table]:
+        try:
+            mask = check(df, ctx).fillna(False).astype(bool)
+        except KeyError as e:
+            # the stage did not produce that column: report and skip the rule
+            report.append({"rule": name, "action": "skipped", "failed": 0, "detail": f"missing {e}"})
+            continue
+        masks[name] = (mask, action)
+        report.append({"rule": name, "action": action, "failed": int(mask.sum()), "detail": ""})
+
+    to_quarantine = pd.Series(False, index=df.index)
+    failed = pd.Series("", index=df.index)
+    for name, (mask, action) in masks.items():
+        if action == "quarantine":
+            to_quarantine |= mask
+        failed = failed.where(~mask, failed + ";" + name)
+
+    quarantined = df[to_quarantine].copy()
+    quarantined["failed_rules"] = failed[to_quarantine].str.lstrip(";")
+    return df[~to_quarantine].copy(), quarantined, pd.DataFrame(report)
+
+
+def run_validation(df, table, hosts=None, out_dir=QUARANTINE, out_name=None):
+    """validate() + write the quarantine file + print the report; returns the kept rows."""
+    kept, quarantined, report = validate(df, table, hosts=hosts)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    q_path = out_dir / f"{out_name or table}.csv"
+    quarantined.to_csv(q_path, index=False, encoding="utf-8")
+    print(f"\nValidation [{table}]: kept {len(kept)} rows, quarantined {len(quarantined)} -> {q_path}")
+    print(report.to_string(index=False))
+    return kept
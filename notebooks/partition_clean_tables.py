@@ -0,0 +1,33 @@
+# notebooks/partition_clean_tables.py
+# Write the clean medals / awards / results tables as season=/year= partitions
+# so consumers (e.g. the Winter-only 2026 model) read only the Games they need.
+import pandas as pd
+
+from olympic_data.paths import CLEAN, PARTITIONED
+from olympic_data.partitioned import attach_games_slug, attach_season, write_partitioned
+
+hosts = pd.read_csv(CLEAN / "olympic_hosts_clean.csv", usecols=["slug", "season"])
+
+MEDALS_IN  = CLEAN / "olympic_medals_clean_v2.csv"
+AWARDS_IN  = CLEAN / "olympic_medal_awards_v2.csv"
+RESULTS_IN = CLEAN / "olympic_results_clean.csv"
+RES_AW_IN  = CLEAN / "olympic_results_awards.csv"
+
+# --- 1) medals (row per medalist / team) ---
+medals = attach_season(pd.read_csv(MEDALS_IN), hosts)
+n = write_partitioned(medals, "medals")
+print(f" medals  -> {PARTITIONED / 'medals'}  ({len(medals)} rows, {n} partitions)")
+
+# --- 2) awards (one medal per year/sport/event/medal/noc) ---
+awards = attach_season(attach_games_slug(pd.read_csv(AWARDS_IN), medals), hosts)
+n = write_partitioned(awards, "awards")
+print(f" awards  -> {PARTITIONED / 'awards'}  ({len(awards)} rows, {n} partitions)")
+
+# --- 3) results (only once clean_olympic_results.py has been run) ---
+for path, table in [(RESULTS_IN, "results"), (RES_AW_IN, "results_awards")]:
+    if not path.exists():
+        print(f" skipped {table} (missing {path.name})")
+        continue
+    res = attach_season(pd.read_csv(path), hosts)
+    n = write_partitioned(res, table)
+    print(f" {table} -> {PARTITIONED / table}  ({len(res)} rows, {n} partitions)")
@@ -0,0 +1,29 @@
+# notebooks/reconcile_medals_results.py
+# Link medal rows to result rows (athletes and team lines) and save the match
+# table with confidence scores.
+import pandas as pd
+
+from olympic_data.paths import CLEAN
+from olympic_data.reconcile import reconcile
+
+MEDALS_IN  = CLEAN / "olympic_medals_clean_v2.csv"
+RESULTS_IN = CLEAN / "olympic_results_clean.csv"
+OUT        = CLEAN / "olympic_medal_result_matches.csv"
+
+if not RESULTS_IN.exists():
+    raise FileNotFoundError(f"Run clean_olympic_results.py first (missing {RESULTS_IN})")
+
+medals = pd.read_csv(MEDALS_IN)
+results = pd.read_csv(RESULTS_IN)
+print("Loaded medals:", medals.shape, " results:", results.shape)
+
+matches = reconcile(medals, results)
+
+# carry the readable keys next to the row numbers
+matches = matches.join(medals[["year", "event", "noc", "athlete"]], on="medal_row")
+matches = matches.join(results[["athlete_full_name"]], on="result_row")
+matches.to_csv(OUT, index=False, encoding="utf-8")
+
+print(f" Saved matches -> {OUT}  ({len(matches)} of {len(medals)} medal rows matched)")
+print(matches["method"].value_counts())
+print("\nLow-confidence matches (< 0.7):", int((matches["confidence"] < 0.7).sum()))
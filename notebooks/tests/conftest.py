@@ -0,0 +1,130 @@
+# notebooks/tests/conftest.py
+"""
+Shared fixtures: small raw frames shaped like the four exports, the golden
+helper, and a stand-in `benchmark` fixture when pytest-benchmark is not
+installed (the benchmark tests then time a few rounds with perf_counter).
+"""
+import io
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+GOLDEN = Path(__file__).parent / "golden"
+
+
+def assert_golden(df, name):
+    """Compare `df` with tests/golden/<name>.csv (UPDATE_GOLDEN=1 rewrites the file)."""
+    path = GOLDEN / f"{name}.csv"
+    if os.environ.get("UPDATE_GOLDEN"):
+        df.to_csv(path, index=False, encoding="utf-8")
+    if not path.exists():
+        pytest.fail(f"No golden file {path.name}: run with UPDATE_GOLDEN=1 and review it")
+    # only empty cells are missing: a literal "nan" written by the transform must not pass as NA
+    read = dict(keep_default_na=False, na_values=[""])
+    expected = pd.read_csv(path, **read)
+    got = pd.read_csv(io.StringIO(df.to_csv(index=False)), **read)     # same CSV round trip
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+
+@pytest.fixture
+def raw_hosts():
+    return pd.DataFrame({
+        "index": [0, 1, 2, 3],
+        "game_slug": ["beijing-2022", "tokyo-2020", "albertville-1992", "barcelona-1992"],
+        "game_end_date": ["2022-02-20T00:00:00Z", "2021-08-08T14:00:00Z", "1992-02-23T00:00:00Z",
+                          "1992-08-09T00:00:00Z"],
+        "game_start_date": ["2022-02-04T15:00:00Z", "2021-07-23T11:00:00Z", "1992-02-08T00:00:00Z",
+                            "1992-07-25T00:00:00Z"],
+        "game_location": ["People's Republic of China", "Japan", "France", "Spain"],
+        "game_name": ["Beijing 2022", "Tokyo 2020", "Albertville 1992", "Barcelona 1992"],
+        "game_season": ["winter", "Summer", "Winter", "summer"],
+        "game_year": [2022, 2020, 1992, 1992],
+    })
+
+
+@pytest.fixture
+def raw_medals():
+    return pd.DataFrame({
+        "Unnamed: 0": [0, 1, 2, 3, 4],
+        "discipline_title": ["Alpine Skiing", "Alpine Skiing", "Ice Hockey", "Biathlon", "Biathlon"],
+        "event_title": ["Men's Downhill", "Men's Downhill", "Women", "Mixed Relay", "Men 10km Sprint"],
+        "slug_game": ["beijing-2022", "beijing-2022", "beijing-2022", "albertville-1992", "albertville-1992"],
+        "event_gender": ["Men", "Men", "Women", "Mixed", "Men"],
+        "medal_type": ["GOLD", "silver", "GOLD", "BRONZE", ""],
+        "participant_type": ["Athlete", "Athlete", "GameTeam", "GameTeam", "Athlete"],
+        "participant_title": [None, None, "Canada", None, None],
+        "athlete_url": ["https://olympics.com/en/athletes/beat-feuz", "https://olympics.com/en/athletes/johan-clarey",
+                        None, None, "https://olympics.com/en/athletes/mark-kirchner"],
+        "athlete_full_name": ["Beat FEUZ", "Johan CLAREY", None, None, "Mark KIRCHNER"],
+        "country_name": ["Switzerland", "France", "Canada", "Côte d'Ivoire", "Germany"],
+        "country_code": ["CH", "FR", "CA", None, "DE"],
+        "country_3_letter_code": ["sui", "FRA", "CAN", "CIV", "GER"],
+    })
+
+
+@pytest.fixture
+def raw_athletes():
+    return pd.DataFrame({
+        "athlete_url": ["https://olympics.com/en/athletes/marit-bjoergen", "https://olympics.com/en/athletes/a-b",
+                        "https://olympics.com/en/athletes/marit-bjoergen", "https://olympics.com/en/athletes/c-d"],
+        "athlete_full_name": ["Marit BJOERGEN", "A B", "Marit BJOERGEN", "C D"],
+        "games_participations": ["5", "1", "5", None],
+        "first_game": ["Salt Lake City 2002", None, "Salt Lake City 2002", "Beijing 2022"],
+        "athlete_year_birth": [1980, 1800, 1980, None],
+        "athlete_medals": ["8G 4S 3B", "", "8G 4S 3B", "1 Bronze"],
+        "bio": [None, None, None, "Biathlete"],
+    })
+
+
+@pytest.fixture
+def raw_results():
+    return pd.DataFrame({
+        "Unnamed: 0": [0, 1, 2, 3],
+        "discipline_title": ["Athletics", "Athletics", "Athletics", "Bobsleigh"],
+        "event_title": ["100m men", "100m men", "100m men", "Two-man"],
+        "slug_game": ["tokyo-2020", "tokyo-2020", "tokyo-2020", "beijing-2022"],
+        "participant_type": ["Athlete", "Athlete", "Athlete", "GameTeam"],
+        "medal_type": ["GOLD", "SILVER", None, "GOLD"],
+        "athletes": [None, None, None,
+                     "[('Francesco FRIEDRICH', 'https://olympics.com/en/athletes/francesco-friedrich'), "
+                     "('Thorsten MARGIS', 'https://olympics.com/en/athletes/thorsten-margis')]"],
+        "rank_equal": [False, False, False, False],
+        "rank_position": ["1", "2", "DNF", "1"],
+        "country_name": ["Italy", "United States of America", "France", "Germany"],
+        "country_code": ["IT", "US", "FR", "DE"],
+        "country_3_letter_code": ["ITA", "USA", "FRA", "GER"],
+        "athlete_url": ["https://olympics.com/en/athletes/lamont-marcell-jacobs",
+                        "https://olympics.com/en/athletes/fred-kerley", "", None],
+        "athlete_full_name": ["Lamont Marcell JACOBS", "Fred KERLEY", "Jimmy VICAUT", None],
+        "value_unit": ["9.80", "9.84", None, "3:56.89"],
+        "value_type": ["TIME", "TIME", "IRM", "TIME"],
+    })
+
+
+@pytest.fixture
+def hosts_seasons():
+    return pd.DataFrame({"slug": ["beijing-2022", "tokyo-2020", "albertville-1992", "barcelona-1992"],
+                         "season": ["Winter", "Summer", "Winter", "Summer"]})
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # minimal stand-in: same call style, stats.stats.mean in seconds
+    @pytest.fixture
+    def benchmark():
+        def run(fn, *args, **kwargs):
+            times, result = [], None
+            for _ in range(run.rounds):
+                t0 = time.perf_counter()
+                result = fn(*args, **kwargs)
+                times.append(time.perf_counter() - t0)
+            run.stats = SimpleNamespace(stats=SimpleNamespace(mean=sum(times) / len(times), min=min(times)))
+            return result
+
+        run.rounds, run.stats = 3, None
+        return run
@@ -0,0 +1,82 @@
+# notebooks/tests/test_api.py
+"""WSGI medal API over a stub store."""
+import json
+
+import pandas as pd
+import pytest
+
+from olympic_data import scenarios
+from olympic_data.api import MedalApi, StaticDataStore
+from olympic_data.scenarios import ScenarioEngine
+
+
+def _awards():
+    return pd.DataFrame({
+        "year": [2022] * 3, "season": ["Winter"] * 3, "games_slug": ["beijing-2022"] * 3,
+        "sport": ["Biathlon", "Biathlon", "Luge"], "noc": ["NOR", "FRA", "GER"],
+        "country": ["Norway", "France", "Germany"], "medal": ["GOLD", "SILVER", "GOLD"],
+    })
+
+
+def call(app, path, qs="", **headers):
+    out = {}
+
+    def start_response(status, hdrs):
+        out["status"], out["headers"] = int(status.split()[0]), dict(hdrs)
+
+    body = b"".join(app({"REQUEST_METHOD": "GET", "PATH_INFO": path, "QUERY_STRING": qs, **headers},
+                        start_response))
+    return out["status"], out["headers"], json.loads(body) if body else None
+
+
+@pytest.fixture
+def app(monkeypatch):
+    probs = pd.DataFrame({"sport": ["Biathlon"] * 3, "event": ["Sprint"] * 3, "event_gender": ["Men"] * 3,
+                          "noc": ["NOR", "FRA", "ITA"], "prob": [0.5, 0.3, 0.2]})
+    engine = ScenarioEngine(probs, lift=1.5, host="ITA")
+    monkeypatch.setattr(scenarios, "scenario_engine", lambda refresh=False: engine)
+    return MedalApi(StaticDataStore(_awards()))
+
+
+def test_scenarios_route(app):
+    q = json.dumps([{"name": "no NOR", "absent": ["NOR"]}])
+    status, _, body = call(app, "/api/scenarios", f"q={q}&top=2")
+    assert status == 200
+    assert list(body) == ["baseline", "no NOR"]
+    assert len(body["no NOR"]) == 2 and "NOR" not in [r["noc"] for r in body["no NOR"]]
+
+
+@pytest.mark.parametrize("q", ['{"absent": "NOR"}', '[{"absnet": ["NOR"]}]', '[{"strength": {"NOR": "x"}}]', '[1]'])
+def test_scenarios_route_rejects_bad_scenarios(app, q):
+    status, _, body = call(app, "/api/scenarios", f"q={q}")
+    assert status == 400 and "scenario" in body["error"]
+
+
+def test_status_codes(app):
+    status, headers, body = call(app, "/api/games/beijing-2022/medals")
+    assert status == 200 and body["medals"][0]["noc"] in {"NOR", "GER"}
+    assert call(app, "/api/games/beijing-2022/medals", HTTP_IF_NONE_MATCH=headers["ETag"])[0] == 304
+    assert call(app, "/api/games/nagano-1998/medals")[0] == 404
+    assert call(app, "/api/nothing")[0] == 404
+    assert call(app, "/api/sports/biathlon/leaders", "limit=3")[0] == 200
+
+
+@pytest.mark.parametrize("path, qs", [
+    ("/api/sports/biathlon/leaders", "limit=ten"),
+    ("/api/search", "q=nor&limit=1.5"),
+    ("/api/scenarios", "q=[{"),
+    ("/api/scenarios", "q=[]&top=x"),
+])
+def test_malformed_parameters_are_400(app, path, qs):
+    status, _, body = call(app, path, qs)
+    assert status == 400 and body["path"] == path
+
+
+def test_etag_follows_model_files(app, tmp_path, monkeypatch):
+    model = tmp_path / "event_probabilities_2026.csv"
+    monkeypatch.setattr(scenarios, "source_paths", lambda: [model])
+    _, headers, _ = call(app, "/api/scenarios", "q=[]")
+    assert call(app, "/api/scenarios", "q=[]", HTTP_IF_NONE_MATCH=headers["ETag"])[0] == 304
+    model.write_text("sport,event,event_gender,noc,prob\n")          # a new model run
+    status, new_headers, _ = call(app, "/api/scenarios", "q=[]", HTTP_IF_NONE_MATCH=headers["ETag"])
+    assert status == 200 and new_headers["ETag"] != headers["ETag"]
@@ -0,0 +1,31 @@
+# notebooks/tests/test_athlete_index.py
+"""Athlete ids: URL slugs, name fallback, and no ids for team lines."""
+import pandas as pd
+
+from olympic_data.athlete_index import attach_athlete_id, build_athlete_dim
+
+
+def _medals():
+    return pd.DataFrame({
+        "participant_type": ["Athlete", "Athlete", "GameTeam", "GameTeam", "GameTeam"],
+        "athlete": ["Marit BJØRGEN", "Old TIMER", "United States team", "United States team", "Kikkan RANDALL"],
+        "athlete_url": ["https://olympics.com/en/athletes/marit-bjorgen", None, None, None,
+                        "https://olympics.com/en/athletes/kikkan-randall"],
+    })
+
+
+def test_team_lines_without_url_get_no_id():
+    med = _medals()
+    dim = build_athlete_dim({"medals": med})
+    assert set(dim["athlete_key"]) == {"marit-bjorgen", "name:old timer", "kikkan-randall"}
+    keyed = attach_athlete_id(med, "medals", dim)
+    assert keyed["athlete_id"].isna().tolist() == [False, False, True, True, False]
+
+
+def test_ids_are_stable_when_extending():
+    dim = build_athlete_dim({"medals": _medals()})
+    more = pd.concat([_medals(), pd.DataFrame({"participant_type": ["Athlete"], "athlete": ["Anna NEW"],
+                                               "athlete_url": [None]})], ignore_index=True)
+    grown = build_athlete_dim({"medals": more}, existing=dim)
+    pd.testing.assert_frame_equal(grown.iloc[:len(dim)], dim)
+    assert grown["athlete_id"].iloc[-1] == dim["athlete_id"].max() + 1
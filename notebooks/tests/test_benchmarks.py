@@ -0,0 +1,78 @@
+# notebooks/tests/test_benchmarks.py
+"""
+Throughput of the hot per-row transforms, on columns shaped like the real exports.
+
+    cd notebooks && python -m pytest tests/test_benchmarks.py --benchmark-only   # with pytest-benchmark
+    cd notebooks && python -m pytest tests/test_benchmarks.py                    # plain timing fallback
+
+MIN_ROWS_PER_S are floors well below a laptop's speed, so a regression (or
+an accidental per-row Python slowdown) fails the run, and a faster rewrite
+can be checked against test_cleaners.py for the same outputs.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from clean_olympic_athletes import parse_medal_text
+from clean_olympic_hosts import extract_city
+from clean_olympic_results import parse_athletes
+from olympic_data.performance import clear_parsed, parse_values
+from patch_medals_v2 import to_iso2
+
+N = 20_000
+MIN_ROWS_PER_S = {
+    "parse_medal_text": 20_000,
+    "parse_athletes": 4_000,
+    "extract_city": 50_000,
+    "to_iso2": 200_000,
+    "parse_values": 200_000,
+}
+
+rng = np.random.default_rng(2026)
+
+
+def _column(values):
+    return pd.Series(rng.choice(np.array(values, dtype=object), N))
+
+
+COLUMNS = {
+    "parse_medal_text": _column(["", "1 Gold", "2G 1S", "3 Bronze", "1G 1S 1B", "4 Silver, 2 Bronze"]),
+    "parse_athletes": _column([
+        "",
+        "[('Francesco FRIEDRICH', 'https://olympics.com/en/athletes/francesco-friedrich'), "
+        "('Thorsten MARGIS', 'https://olympics.com/en/athletes/thorsten-margis')]",
+        "[('Team MEMBER', 'https://olympics.com/en/athletes/team-member')]",
+    ]),
+    "extract_city": _column(["Beijing 2022", "Milano Cortina 2026", "St. Moritz 1948", "Athens"]),
+    "to_iso2": _column(["Great Britain", "Republic of Korea", "Côte d'Ivoire", "", None]),
+}
+FUNCTIONS = {"parse_medal_text": parse_medal_text, "parse_athletes": parse_athletes,
+             "extract_city": extract_city, "to_iso2": to_iso2}
+
+
+def _check_throughput(benchmark, name):
+    if benchmark.stats is None:          # --benchmark-disable
+        return
+    rate = N / benchmark.stats.stats.mean
+    assert rate >= MIN_ROWS_PER_S[name], f"{name}: {rate:,.0f} rows/s < {MIN_ROWS_PER_S[name]:,} rows/s"
+
+
+@pytest.mark.parametrize("name", sorted(FUNCTIONS))
+def test_row_function_throughput(benchmark, name):
+    column, fn = COLUMNS[name], FUNCTIONS[name]
+    out = benchmark(column.map, fn)
+    assert len(out) == N
+    _check_throughput(benchmark, name)
+
+
+def test_parse_values_throughput(benchmark):
+    times = [f"{m}:{s:05.2f}" for m, s in zip(rng.integers(0, 3, 2_000), rng.uniform(0, 60, 2_000))]
+    values, types = _column(times), np.full(N, "TIME", dtype=object)
+
+    def cold():
+        clear_parsed()
+        return parse_values(values, types)
+
+    out = benchmark(cold)
+    assert out.notna().all()
+    _check_throughput(benchmark, "parse_values")
@@ -0,0 +1,94 @@
+# notebooks/tests/test_careers.py
+"""Career table from small athlete / medal fixtures: first / last edition, medal totals, gaps."""
+import pandas as pd
+import pytest
+
+from olympic_data.careers import build_athlete_games, build_careers, parse_participations
+
+URL = "https://olympics.com/en/athletes/"
+
+
+@pytest.fixture
+def athletes():
+    return pd.DataFrame({
+        "athlete_url": [URL + "ole-einar-bjorndalen", URL + "young-skier", URL + "comeback-kid"],
+        "athlete_full_name": ["Ole Einar BJØRNDALEN", "Young SKIER", "Comeback KID"],
+        "games_participations": ["Nagano 1998, Salt Lake City 2002, Turin 2006, Vancouver 2010, Sochi 2014",
+                                 "2", "Turin 2006, Beijing 2022"],
+        "first_game": ["Lillehammer 1994", "PyeongChang 2018", "Turin 2006"],
+        "athlete_year_birth": [1974, 2000, 1986],
+        "medal_gold": [8, None, None],
+        "medal_silver": [4, None, None],
+        "medal_bronze": [1, None, None],
+    })
+
+
+@pytest.fixture
+def medals():
+    return pd.DataFrame({
+        "games_slug": ["salt-lake-city-2002", "beijing-2022", "beijing-2022", "beijing-2022"],
+        "year": [2002, 2022, 2022, 2022],
+        "season": ["Winter"] * 4,
+        "athlete": ["Ole Einar BJØRNDALEN", "Young SKIER", "Young SKIER", "Norway Team"],
+        "athlete_url": [URL + "ole-einar-bjorndalen", URL + "young-skier", URL + "young-skier", None],
+        "participant_type": ["Athlete", "Athlete", "Athlete", "GameTeam"],
+        "gold": [1, 1, 0, 1],
+        "silver": [0, 0, 1, 0],
+        "bronze": [0, 0, 0, 0],
+    })
+
+
+@pytest.fixture
+def hosts():
+    years = list(range(1994, 2023, 4))
+    slugs = ["lillehammer-1994", "nagano-1998", "salt-lake-city-2002", "turin-2006", "vancouver-2010",
+             "sochi-2014", "pyeongchang-2018", "beijing-2022"]
+    return pd.DataFrame({"year": years, "season": "Winter", "slug": slugs})
+
+
+@pytest.fixture
+def careers(athletes, medals, hosts):
+    games = build_athlete_games(athletes, medals, None, hosts)
+    return build_careers(games, athletes, medals).set_index("athlete_key")
+
+
+@pytest.mark.parametrize("text, years, count", [
+    ("Nagano 1998, Turin 2006", [1998, 2006], None),
+    ("2", [], 2),
+    ("", [], None),
+])
+def test_parse_participations(text, years, count):
+    df = pd.DataFrame({"athlete_url": [URL + "x"], "athlete_full_name": ["X"],
+                       "games_participations": [text], "first_game": [None]})
+    long, listed = parse_participations(df)
+    assert long["year"].tolist() == years
+    assert listed.dropna().tolist() == ([count] if count else [])
+
+
+def test_first_and_last_edition(careers):
+    ole = careers.loc["ole-einar-bjorndalen"]
+    assert (ole["first_year"], ole["last_year"], ole["n_games"]) == (1994, 2014, 6)
+    assert (ole["age_first"], ole["age_last"], ole["age_2026"]) == (20, 40, 52)
+    assert not ole["active_2026"]
+
+    young = careers.loc["young-skier"]
+    assert (young["first_year"], young["last_year"], young["n_games"]) == (2018, 2022, 2)
+    assert young["active_2026"]
+
+
+def test_medal_totals(careers):
+    # the athlete bio has the career totals, medal rows fill in when it is empty
+    assert careers.loc["ole-einar-bjorndalen", ["gold", "silver", "bronze", "medals"]].tolist() == [8, 4, 1, 13]
+    assert careers.loc["young-skier", ["gold", "silver", "bronze", "medals"]].tolist() == [1, 1, 0, 2]
+    assert careers.loc["young-skier", "medals_per_games"] == 1.0
+    assert careers.loc["comeback-kid", "medals"] == 0
+    assert "name:norway team" not in careers.index                  # team line without athlete
+
+
+def test_gap_in_career(careers, athletes, medals, hosts):
+    kid = careers.loc["comeback-kid"]
+    assert (kid["first_year"], kid["last_year"], kid["n_games"], kid["career_years"]) == (2006, 2022, 2, 16)
+    games = build_athlete_games(athletes, medals, None, hosts)
+    kid_games = games[games["athlete_key"] == "comeback-kid"]
+    assert kid_games["games_slug"].tolist() == ["turin-2006", "beijing-2022"]
+    assert kid_games["age"].tolist() == [20, 36]
@@ -0,0 +1,27 @@
+# notebooks/tests/test_charts.py
+"""Chart series cache when the source tables are missing."""
+import pandas as pd
+import pytest
+
+from olympic_data import charts, paths
+
+
+@pytest.fixture
+def empty_clean(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "CLEAN", tmp_path)
+    monkeypatch.setattr(charts, "_memo", {})
+    return tmp_path
+
+
+def test_missing_sources_without_cache(empty_clean):
+    with pytest.raises(FileNotFoundError, match="hosts"):
+        charts.chart_series("games_per_country")
+
+
+def test_missing_sources_serves_cache(empty_clean):
+    cached = pd.DataFrame({"country": ["Norway"], "season": ["Winter"], "games": [2]})
+    (empty_clean / "charts").mkdir()
+    cached.to_csv(empty_clean / "charts" / "games_per_country.csv", index=False)
+    pd.testing.assert_frame_equal(charts.chart_series("games_per_country"), cached)
+    with pytest.raises(FileNotFoundError):
+        charts.chart_series("games_per_country", refresh=True)
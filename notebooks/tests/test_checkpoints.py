@@ -0,0 +1,110 @@
+# notebooks/tests/test_checkpoints.py
+"""Per-edition checkpoints: resume, replay from a corrected edition, pruning of stale folders."""
+import pandas as pd
+import pytest
+
+from olympic_data import checkpoints
+from olympic_data.checkpoints import CheckpointStore, run_incremental
+
+SLUGS = ["nagano-1998", "salt-lake-city-2002", "turin-2006"]
+
+
+@pytest.fixture
+def hosts():
+    return pd.DataFrame({"slug": SLUGS[::-1], "year": [2006, 2002, 1998],
+                         "start_date": ["2006-02-10T00:00:00Z", "2002-02-08T00:00:00Z", "1998-02-07T00:00:00Z"]})
+
+
+@pytest.fixture
+def medals():
+    rows = []
+    for slug, year in zip(SLUGS, [1998, 2002, 2006]):
+        for medal, noc in zip(["GOLD", "SILVER", "BRONZE"], ["NOR", "GER", "AUT"]):
+            rows.append({"games_slug": slug, "year": year, "sport": "Biathlon", "event": "Sprint",
+                         "event_gender": "Men", "medal": medal, "noc": noc,
+                         "athlete_id": f"{noc}-{year}", "gold": medal == "GOLD",
+                         "silver": medal == "SILVER", "bronze": medal == "BRONZE"})
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def calls():
+    seen = []
+    step = checkpoints.noc_medals_step
+
+    def noc_medals_step(state, rows):
+        seen.append(rows["games_slug"].iloc[0])
+        return step(state, rows)
+
+    return seen, [noc_medals_step, checkpoints.athlete_medals_step, checkpoints.ratings_step]
+
+
+def _assert_same_state(a, b):
+    assert sorted(a) == sorted(b)
+    for name in a:
+        pd.testing.assert_frame_equal(a[name].reset_index(drop=True), b[name].reset_index(drop=True),
+                                      check_dtype=False)
+
+
+def test_resume_after_partial_run(tmp_path, medals, hosts, calls):
+    seen, steps = calls
+    store = CheckpointStore(tmp_path)
+    run_incremental(medals[medals["year"] < 2006], hosts, steps=steps, store=store, verbose=False)
+    assert seen == SLUGS[:2]
+
+    seen.clear()
+    state = run_incremental(medals, hosts, steps=steps, store=store, verbose=False)
+    assert seen == SLUGS[2:]                                  # only the new edition
+    _assert_same_state(state, run_incremental(medals, hosts, store=CheckpointStore(tmp_path / "scratch"),
+                                              verbose=False))
+    assert state["noc_medals"].set_index("noc").loc["NOR", ["gold", "editions"]].tolist() == [3, 3]
+
+    seen.clear()
+    run_incremental(medals, hosts, steps=steps, store=store, verbose=False)
+    assert seen == []                                         # up to date
+
+
+def test_crash_keeps_finished_editions(tmp_path, medals, hosts, calls):
+    seen, steps = calls
+
+    def ratings_step(state, rows):
+        if rows["year"].iloc[0] == 2006:
+            raise RuntimeError("crash")
+        return checkpoints.ratings_step(state, rows)
+
+    store = CheckpointStore(tmp_path)
+    with pytest.raises(RuntimeError):
+        run_incremental(medals, hosts, steps=steps[:2] + [ratings_step], store=store, verbose=False)
+    assert [e["slug"] for e in store.manifest()["editions"]] == SLUGS[:2]
+
+    seen.clear()
+    run_incremental(medals, hosts, steps=steps, store=store, verbose=False)
+    assert seen == SLUGS[2:]
+
+
+def test_corrected_edition_replays_from_there(tmp_path, medals, hosts, calls):
+    seen, steps = calls
+    store = CheckpointStore(tmp_path)
+    run_incremental(medals, hosts, steps=steps, store=store, verbose=False)
+
+    fixed = medals.copy()
+    fixed.loc[(fixed["year"] == 2002) & (fixed["medal"] == "GOLD"), "noc"] = "FRA"
+    seen.clear()
+    state = run_incremental(fixed, hosts, steps=steps, store=store, verbose=False)
+    assert seen == SLUGS[1:]
+    _assert_same_state(state, run_incremental(fixed, hosts, store=CheckpointStore(tmp_path / "scratch"),
+                                              verbose=False))
+    assert state["noc_medals"].set_index("noc").loc["FRA", "gold"] == 1
+
+
+def test_stale_checkpoints_pruned(tmp_path, medals, hosts):
+    store = CheckpointStore(tmp_path)
+    run_incremental(medals, hosts, store=store, verbose=False)
+    (tmp_path / "07_sochi-2014").mkdir()                      # left over from another edition list
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == [
+        "00_nagano-1998", "01_salt-lake-city-2002", "02_turin-2006", "07_sochi-2014"]
+
+    # first edition dropped: every folder is renumbered
+    run_incremental(medals[medals["year"] > 1998], hosts, store=store, verbose=False)
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == ["00_salt-lake-city-2002", "01_turin-2006"]
+    assert [e["slug"] for e in store.manifest()["editions"]] == SLUGS[1:]
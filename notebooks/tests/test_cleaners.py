@@ -0,0 +1,153 @@
+# notebooks/tests/test_cleaners.py
+"""Golden inputs / outputs for the cleaner transforms (no data/ folder needed)."""
+import math
+
+import pandas as pd
+import pytest
+
+from clean_olympic_athletes import clean_athletes, parse_medal_text
+from clean_olympic_hosts import clean_hosts, extract_city
+from clean_olympic_medals import build_awards, clean_medals
+from clean_olympic_results import build_awards as build_results_awards
+from clean_olympic_results import expand, parse_athletes, tidy
+from olympic_data.performance import parse_values
+from olympic_data.validation import validate
+from patch_medals_v2 import patch_medals, to_iso2
+
+from conftest import assert_golden
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2 Gold, 1 Silver", {"gold": 2, "silver": 1, "bronze": 0}),
+    ("3G 2S", {"gold": 3, "silver": 2, "bronze": 0}),
+    ("1 B", {"gold": 0, "silver": 0, "bronze": 1}),
+    ("8G 4S 3B", {"gold": 8, "silver": 4, "bronze": 3}),
+    ("1 gold 1 GOLD", {"gold": 2, "silver": 0, "bronze": 0}),
+    ("10 Bronze", {"gold": 0, "silver": 0, "bronze": 10}),
+    ("Gold", {"gold": 0, "silver": 0, "bronze": 0}),
+    ("", {"gold": 0, "silver": 0, "bronze": 0}),
+    ("   ", {"gold": 0, "silver": 0, "bronze": 0}),
+    (None, {"gold": 0, "silver": 0, "bronze": 0}),
+    (float("nan"), {"gold": 0, "silver": 0, "bronze": 0}),
+])
+def test_parse_medal_text(text, expected):
+    assert parse_medal_text(text) == expected
+
+
+@pytest.mark.parametrize("cell, expected", [
+    ("[('Francesco FRIEDRICH', 'https://olympics.com/en/athletes/francesco-friedrich'), "
+     "('Thorsten MARGIS', 'https://olympics.com/en/athletes/thorsten-margis')]",
+     [("Francesco FRIEDRICH", "https://olympics.com/en/athletes/francesco-friedrich"),
+      ("Thorsten MARGIS", "https://olympics.com/en/athletes/thorsten-margis")]),
+    ("[('Solo NAME',)]", [("Solo NAME", "")]),
+    ("['Name ONE', 'Name TWO']", [("Name ONE", ""), ("Name TWO", "")]),
+    ("[('No URL', None)]", [("No URL", "")]),
+    ("[('Broken', 'https://x'", [("Broken", ""), ("https://x", "")]),     # regex fallback
+    ("[]", []),
+    ("", []),
+    (None, []),
+    (float("nan"), []),
+])
+def test_parse_athletes(cell, expected):
+    assert parse_athletes(cell) == expected
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Beijing 2022", "Beijing"),
+    ("Milano Cortina 2026", "Milano Cortina"),
+    ("  Rio 2016  ", "Rio"),
+    ("St. Moritz 1948", "St. Moritz"),
+    ("Athens", "Athens"),
+    ("2022", "2022"),
+    (None, None),
+    (float("nan"), None),
+])
+def test_extract_city(name, expected):
+    assert extract_city(name) == expected
+
+
+@pytest.mark.parametrize("country, expected", [
+    ("Great Britain", "GB"),
+    ("Republic of Korea", "KR"),
+    ("  Côte d'Ivoire ", "CI"),
+    ("Chinese Taipei", "TW"),
+    ("", None),
+    (None, None),
+    (42, None),
+])
+def test_to_iso2(country, expected):
+    assert to_iso2(country) == expected
+
+
+def test_to_iso2_pycountry_lookup():
+    pytest.importorskip("pycountry")
+    assert to_iso2("France") == "FR"
+    assert to_iso2("Atlantis") is None
+
+
+@pytest.mark.parametrize("text, kind", [("+12.3", "TIME"), ("+1:02.5", "TIME"), ("+0.45 m", "DISTANCE"),
+                                        ("+15", "POINTS")])
+def test_parse_values_offsets_are_na(text, kind):
+    assert math.isnan(parse_values([text], [kind])[0])
+
+
+def test_parse_values():
+    got = parse_values(["1:44:15.4", "2:05.45", "9.63", "DNF", "8,95 m", "5838", "250", None, "1"],
+                       ["TIME", "TIME", "time", "TIME", "DISTANCE", "POINTS", "WEIGHT", "TIME", "IRM"])
+    expected = [6255.4, 125.45, 9.63, None, 8.95, 5838.0, 250.0, None, None]
+    for g, e in zip(got, expected):
+        assert (math.isnan(g) and e is None) or g == pytest.approx(e)
+
+
+# ---------- whole transforms ----------
+def test_clean_hosts(raw_hosts):
+    out = clean_hosts(raw_hosts)
+    assert list(out["slug"]) == ["barcelona-1992", "albertville-1992", "tokyo-2020", "beijing-2022"]
+    assert_golden(out, "hosts_clean")
+
+
+def test_clean_medals(raw_medals, hosts_seasons):
+    out = clean_medals(raw_medals, hosts_seasons)
+    assert len(out) == 4                                  # the row without a medal is dropped
+    # missing cells stay missing whatever the pandas version (not the text "nan")
+    assert out["participant_title"].isna().tolist() == [True, True, False, True]
+    assert out["athlete"].replace("", None).isna().tolist() == [False, False, True, True]
+    assert not out.isin(["nan", "None", "<NA>"]).any().any()
+    assert_golden(out, "medals_clean")
+    assert_golden(build_awards(out), "medal_awards")
+
+
+def test_clean_medals_keeps_no_literal_nan(raw_medals, hosts_seasons):
+    out = clean_medals(raw_medals, hosts_seasons)
+    hosts = hosts_seasons.assign(year=hosts_seasons["slug"].str[-4:].astype(int))
+    kept, quarantined, report = validate(out, "medals", hosts=hosts)
+    assert report.set_index("rule").loc["literal_nan", "failed"] == 0
+    assert len(kept) == len(out)
+
+
+def test_patch_medals(raw_medals, hosts_seasons):
+    v2 = patch_medals(clean_medals(raw_medals, hosts_seasons))
+    assert v2.loc[v2["noc"] == "CAN", "athlete"].item() == "Canada"
+    assert v2.loc[v2["noc"] == "CIV", "athlete"].item() == "Côte d'Ivoire Team"
+    assert v2.loc[v2["noc"] == "CIV", "country_code"].item() == "CI"
+    assert_golden(v2, "medals_clean_v2")
+
+
+def test_clean_athletes(raw_athletes):
+    out = clean_athletes(raw_athletes)
+    assert len(out) == 3                                  # duplicate bio dropped
+    assert_golden(out, "athletes_clean")
+
+
+def test_expand_results(raw_results, hosts_seasons):
+    out = expand(tidy(raw_results.copy()), hosts_seasons)
+    assert len(out) == 5                                  # the two-man bob is one row per athlete
+    assert_golden(out, "results_clean")
+    assert_golden(build_results_awards(out), "results_awards")
+
+
+def test_transforms_do_not_modify_input(raw_hosts, raw_medals, raw_athletes):
+    for fn, df in [(clean_hosts, raw_hosts), (clean_medals, raw_medals), (clean_athletes, raw_athletes)]:
+        before = df.copy()
+        fn(df)
+        pd.testing.assert_frame_equal(df, before)
@@ -0,0 +1,32 @@
+# notebooks/tests/test_datasets.py
+"""Loaders over a partitioned copy of the clean tables."""
+import pandas as pd
+import pytest
+
+from olympic_data import datasets, paths
+from olympic_data.partitioned import write_partitioned
+
+
+@pytest.fixture
+def partitioned(tmp_path, monkeypatch):
+    medals = pd.DataFrame({"season": ["Winter", "Winter", "Summer"], "year": [2018, 2022, 2020],
+                           "games_slug": ["pyeongchang-2018", "beijing-2022", "tokyo-2020"],
+                           "noc": ["NOR", "NOR", "USA"], "medal": ["GOLD", "SILVER", "GOLD"]})
+    monkeypatch.setattr(paths, "CLEAN", tmp_path)
+    monkeypatch.setattr(paths, "PARTITIONED", tmp_path / "partitioned")
+    write_partitioned(medals, "medals", root=paths.PARTITIONED)
+    datasets.clear_cache()
+    yield
+    datasets.clear_cache()
+
+
+@pytest.mark.parametrize("season", ["Winter", ["Winter"], ("Winter",)])
+def test_load_season_forms(partitioned, season):
+    out = datasets.load_medals(season=season)
+    assert out["games_slug"].tolist() == ["pyeongchang-2018", "beijing-2022"]
+
+
+def test_season_list_cached_once(partitioned):
+    datasets.load_medals(season=["Summer", "Winter"], years=(2018, 2022))
+    datasets.load_medals(season=["Winter", "Summer"], years=(2018, 2022))
+    assert len(datasets._cache) == 1
@@ -0,0 +1,72 @@
+# notebooks/tests/test_diff.py
+"""Keyed table diff and the change-volume gate of the fetch stage."""
+import pandas as pd
+import pytest
+
+from olympic_data import fetch, paths
+from olympic_data.diff import KEYS, DigestDiff, diff_tables, table_digest
+
+
+def _medals():
+    # two team lines without athlete_url that only differ outside the old key
+    return pd.DataFrame({
+        "games_slug": ["paris-1900"] * 4,
+        "sport": ["Sailing"] * 4,
+        "event": ["3-10 Ton"] * 4,
+        "event_gender": ["Open"] * 4,
+        "medal": ["GOLD", "GOLD", "SILVER", "SILVER"],
+        "noc": ["FRA"] * 4,
+        "athlete_url": [None] * 4,
+        "athlete": ["Femur #1", "Femur #2", None, None],
+        "participant_title": ["Femur #1", "Femur #2", "Esterel", "Olle"],
+        "country": ["France"] * 4,
+    })
+
+
+def test_shuffled_table_has_no_changes():
+    old = _medals()
+    d = diff_tables(old, old.iloc[::-1], "medals")
+    assert d.summary()["changed"] == d.summary()["added"] == d.summary()["removed"] == 0
+
+
+def test_repeated_keys_matched_by_content():
+    old = _medals()
+    key = ["games_slug", "sport", "event", "event_gender", "medal", "noc"]     # not unique on purpose
+    d = diff_tables(old, old.iloc[[1, 0, 3, 2]], key=key)
+    assert d.summary()["changed"] == 0
+
+
+def test_chunked_digest_matches_table_diff(tmp_path):
+    old = pd.concat([_medals()] * 3, ignore_index=True)
+    old["games_slug"] = [f"games-{i // 4}" for i in range(len(old))]
+    old["rank"] = [1.0, 2.0, 3.0, 3.5] * 3           # int in some chunks, float in others
+    new = old.iloc[::-1].drop(index=[0, 5])
+    new.loc[[2, 3], "country"] = "FRA"
+    old.to_csv(tmp_path / "old.csv", index=False)
+    new.to_csv(tmp_path / "new.csv", index=False)
+
+    d = DigestDiff(table_digest(tmp_path / "old.csv", KEYS["medals"], chunksize=3),
+                   table_digest(tmp_path / "new.csv", KEYS["medals"], chunksize=5), KEYS["medals"])
+    assert d.summary() == diff_tables(old, new, "medals").summary()
+    assert (d.summary()["removed"], d.summary()["changed"]) == (2, 2)
+    assert d.column_changes.to_dict() == {"country": 2, "rank": 0}
+
+
+def test_gate_failure_restores_clean(tmp_path, monkeypatch):
+    clean = tmp_path / "data" / "clean"
+    clean.mkdir(parents=True)
+    hosts = pd.DataFrame({"slug": [f"games-{y}" for y in range(1900, 2000)], "year": range(1900, 2000)})
+    hosts.to_csv(clean / "olympic_hosts_clean.csv", index=False)
+    original = (clean / "olympic_hosts_clean.csv").read_bytes()
+    monkeypatch.setattr(paths, "CLEAN", clean)
+
+    script = tmp_path / "shrink_hosts.py"
+    script.write_text("import pandas as pd\n"
+                      f"p = {str(clean / 'olympic_hosts_clean.csv')!r}\n"
+                      "pd.read_csv(p).head(50).to_csv(p, index=False)\n"
+                      f"open({str(clean / 'stray.csv')!r}, 'w').write('x')\n")
+    with pytest.raises(SystemExit, match="restored"):
+        fetch.run_cleaners([str(script)])
+    assert (clean / "olympic_hosts_clean.csv").read_bytes() == original
+    assert not (clean / "stray.csv").exists()
+    assert [p.name for p in tmp_path.joinpath("data").iterdir()] == ["clean"]
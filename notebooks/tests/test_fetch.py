@@ -0,0 +1,85 @@
+# notebooks/tests/test_fetch.py
+"""Conditional downloads against a local http.server: 200, 304, then a failing feed."""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from olympic_data.fetch import MIRROR_STATE, fetch_all
+
+NOTEBOOKS = Path(__file__).resolve().parents[1]
+ETAG = '"v1"'
+LAST_MODIFIED = "Sun, 06 Feb 2022 00:00:00 GMT"
+BODY = b"<hosts/>"
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/broken":
+            self.send_response(500)
+            self.end_headers()
+        elif self.path == "/cut":                        # announces more than it sends
+            self.send_response(200)
+            self.send_header("Content-Length", "1000")
+            self.end_headers()
+            self.wfile.write(b"partial")
+        elif self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header("ETag", ETAG)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+def test_fetch_then_not_modified(server, tmp_path):
+    sources = {"olympic_hosts.xml": f"{server}/hosts"}
+    assert asyncio.run(fetch_all(sources, raw=tmp_path)) == {"olympic_hosts.xml": "updated"}
+    assert (tmp_path / "olympic_hosts.xml").read_bytes() == BODY
+    state = json.loads((tmp_path / MIRROR_STATE).read_text())["olympic_hosts.xml"]
+    assert state["etag"] == ETAG and state["last_modified"] == LAST_MODIFIED
+
+    assert asyncio.run(fetch_all(sources, raw=tmp_path)) == {"olympic_hosts.xml": "unchanged"}
+    assert (tmp_path / "olympic_hosts.xml").read_bytes() == BODY
+
+
+@pytest.mark.parametrize("path", ["broken", "cut"])
+def test_failed_feed_keeps_previous_file(server, tmp_path, path):
+    (tmp_path / "olympic_hosts.xml").write_bytes(BODY)
+    status = asyncio.run(fetch_all({"olympic_hosts.xml": f"{server}/{path}"}, raw=tmp_path))
+    assert status["olympic_hosts.xml"].startswith("error")
+    assert (tmp_path / "olympic_hosts.xml").read_bytes() == BODY
+    assert not (tmp_path / "olympic_hosts.xml.part").exists()
+    assert "olympic_hosts.xml" not in json.loads((tmp_path / MIRROR_STATE).read_text())
+
+
+def test_main_exits_non_zero_on_failed_feed(server, tmp_path):
+    sources = tmp_path / "sources.json"
+    sources.write_text(json.dumps({"olympic_hosts.xml": f"{server}/hosts",
+                                   "olympic_medals.xlsx": f"{server}/broken"}))
+    run = subprocess.run([sys.executable, "-m", "olympic_data.fetch", "--sources", str(sources), "--no-clean"],
+                         cwd=NOTEBOOKS, env={**os.environ, "OLYMPIC_DATA_ROOT": str(tmp_path)},
+                         capture_output=True, text=True)
+    assert run.returncode != 0
+    assert "olympic_medals.xlsx" in run.stderr
+    assert (tmp_path / "data" / "raw" / "olympic_hosts.xml").read_bytes() == BODY
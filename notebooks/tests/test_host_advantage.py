@@ -0,0 +1,37 @@
+# notebooks/tests/test_host_advantage.py
+"""(NOC, Games) grid of the host-advantage features."""
+import pandas as pd
+
+from olympic_data.host_advantage import host_advantage
+
+
+def _hosts():
+    return pd.DataFrame({
+        "slug": ["calgary-1988", "albertville-1992", "lillehammer-1994"],
+        "year": [1988, 1992, 1994], "season": ["Winter"] * 3,
+        "start_date": ["1988-02-13", "1992-02-08", "1994-02-12"],
+        "country": ["Canada", "France", "Norway"],
+    })
+
+
+def _awards():
+    return pd.DataFrame({
+        "games_slug": ["calgary-1988", "calgary-1988", "albertville-1992", "lillehammer-1994", "lillehammer-1994"],
+        "year": [1988, 1988, 1992, 1994, 1994],
+        "season": ["Winter"] * 5,
+        "noc": ["URS", "NOR", "EUN", "NOR", "RUS"],
+        "country": ["Soviet Union", "Norway", "Unified Team", "Norway", "Russian Federation"],
+        "medal": ["GOLD", "SILVER", "GOLD", "GOLD", "GOLD"],
+    })
+
+
+def test_defunct_nocs_stop_at_last_medal():
+    feats = host_advantage(_hosts(), _awards())
+    rows = feats.groupby("noc")["slug"].agg(list).to_dict()
+    assert rows["URS"] == ["calgary-1988"]
+    assert rows["EUN"] == ["albertville-1992"]
+    assert rows["NOR"] == ["calgary-1988", "albertville-1992", "lillehammer-1994", "milano-cortina-2026"]
+    assert rows["RUS"] == ["lillehammer-1994", "milano-cortina-2026"]
+    nor = feats[feats["noc"] == "NOR"].set_index("slug")
+    assert nor.loc["albertville-1992", "total"] == 0 and pd.isna(nor.loc["milano-cortina-2026", "total"])
+    assert nor.loc["lillehammer-1994", "is_host"]
@@ -0,0 +1,82 @@
+# notebooks/tests/test_outofcore.py
+"""The streamed HTML reader and the out-of-core results path agree with the in-memory ones."""
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from olympic_data.outofcore import Spill, iter_html_table
+
+NOTEBOOKS = Path(__file__).resolve().parents[1]
+
+HTML = """<html><body><table>
+<tr><th>slug_game</th><th>medal_type</th><th>rank_position</th><th>value_unit</th></tr>
+<tr><td>beijing-2022</td><td>GOLD</td><td>1</td><td>s</td></tr>
+<tr><td>beijing-2022</td><td>NaN</td><td>NA</td><td>null</td></tr>
+<tr><td>beijing-2022</td><td><b>SILVER</b></td><td>2</td><td>two
+  lines</td></tr>
+<tr><td>beijing-2022</td><td>None</td><td>N/A</td><td>n/a</td></tr>
+</table><table><tr><th>other</th></tr><tr><td>x</td></tr></table></body></html>"""
+
+
+def _norm(df):
+    return df.astype(object).where(df.notna(), None)
+
+
+def test_iter_html_table_matches_read_html(tmp_path):
+    # same cells as read_html reading every column as text (NA markers, collapsed whitespace)
+    path = tmp_path / "results.html"
+    path.write_text(HTML, encoding="utf-8")
+    expected = pd.read_html(io.StringIO(HTML), converters={c: str for c in ["rank_position", "value_unit"]})[0]
+    for chunksize in (1, 2, 10):
+        got = pd.concat(iter_html_table(path, chunksize=chunksize), ignore_index=True)
+        assert list(got.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(_norm(got), _norm(expected))
+    assert got["medal_type"].isna().sum() == 2                  # not the text "NAN" after upper()
+
+
+def test_spill_round_trip_keeps_text(tmp_path):
+    spill = Spill(tmp_path / "spill", by="year")
+    spill.add(pd.DataFrame({"year": pd.array([2022, 2022, 1904], dtype="Int64"),
+                            "rank_position": ["1", None, "=3"], "rank_equal": ["False", "True", "False"]}))
+    assert spill.buckets() == ["1904", "2022"]
+    part = spill.read("2022")
+    assert part["year"].dtype == "Int64"
+    assert part["rank_position"].tolist()[0] == "1" and pd.isna(part["rank_position"].iloc[1])
+    assert part["rank_equal"].tolist() == ["False", "True"]
+
+
+def _run_results(root, *args):
+    env = {**os.environ, "OLYMPIC_DATA_ROOT": str(root)}
+    subprocess.run([sys.executable, "clean_olympic_results.py", *args], cwd=NOTEBOOKS, env=env,
+                   check=True, capture_output=True)
+    clean = root / "data" / "clean"
+    return [(clean / f).read_bytes() for f in ("olympic_results_clean.csv", "olympic_results_awards.csv")]
+
+
+@pytest.mark.parametrize("with_hosts", [True, False])
+def test_out_of_core_matches_in_memory(tmp_path, raw_results, with_hosts):
+    pytest.importorskip("lxml")
+    raw = raw_results.drop(columns="Unnamed: 0")
+    # an edition whose ranks are only numbers and blanks: must stay "1", "2", not "1.0", "2.0"
+    extra = raw[raw["slug_game"] == "beijing-2022"].copy()
+    extra = pd.concat([extra.assign(rank_position="2", medal_type="SILVER", country_3_letter_code="SUI"),
+                       extra.assign(rank_position=None, medal_type=None, country_3_letter_code="AUT")])
+    raw = pd.concat([raw, extra], ignore_index=True)
+    (tmp_path / "data" / "raw").mkdir(parents=True)
+    (tmp_path / "data" / "clean").mkdir(parents=True)
+    (tmp_path / "data" / "raw" / "olympic_results.html").write_text(raw.to_html(), encoding="utf-8")
+    if with_hosts:
+        pd.DataFrame({"slug": ["tokyo-2020", "beijing-2022"], "year": [2020, 2022],
+                      "season": ["Summer", "Winter"]}).to_csv(
+            tmp_path / "data" / "clean" / "olympic_hosts_clean.csv", index=False)
+
+    in_memory = _run_results(tmp_path)
+    out_of_core = _run_results(tmp_path, "--out-of-core")
+    assert in_memory == out_of_core
+    res = pd.read_csv(io.BytesIO(out_of_core[0]), dtype=str)
+    assert set(res.loc[res["slug_game"] == "beijing-2022", "rank_position"].dropna()) == {"1", "2"}
@@ -0,0 +1,41 @@
+# notebooks/tests/test_publish.py
+"""Content-hashed bundles survive a republish whose JSON did not change."""
+import pandas as pd
+
+from olympic_data.publish import publish
+
+
+def _awards():
+    return pd.DataFrame({
+        "year": [2022] * 4,
+        "season": ["Winter"] * 4,
+        "games_slug": ["beijing-2022"] * 4,
+        "sport": ["Biathlon", "Biathlon", "Cross Country Skiing", "Luge"],
+        "noc": ["NOR", "NOR", "NOR", "GER"],
+        "country": ["Norway", "Norway", "Norway", "Germany"],
+        "medal": ["GOLD", "SILVER", "GOLD", "GOLD"],
+    })
+
+
+def _hosts():
+    return pd.DataFrame({"year": [2022], "season": ["Winter"], "city": ["Beijing"],
+                         "country": ["China"], "slug": ["beijing-2022"]})
+
+
+def test_republish_with_identical_json_keeps_files(tmp_path):
+    publish(_awards(), _hosts(), out=tmp_path)
+    moved = _awards()
+    moved.loc[1, "sport"] = "Cross Country Skiing"          # same per-Games totals, new source rows
+    w = publish(moved, _hosts(), out=tmp_path)
+    assert w.written > 0
+    for name, entry in w.manifest.items():
+        assert (tmp_path / entry["json"]).exists(), name
+        assert (tmp_path / entry["json"]).with_suffix(".json.gz").exists(), name
+    assert {"countries/NOR", "games/beijing-2022"} <= set(w.manifest)
+
+
+def test_removed_bundle_files_are_dropped(tmp_path):
+    first = publish(_awards(), _hosts(), out=tmp_path)
+    gone = tmp_path / first.manifest["countries/GER"]["json"]
+    w = publish(_awards()[lambda d: d["noc"] != "GER"], _hosts(), out=tmp_path)
+    assert "countries/GER" not in w.manifest and not gone.exists()
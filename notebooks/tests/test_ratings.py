@@ -0,0 +1,38 @@
+# notebooks/tests/test_ratings.py
+"""2026 candidate fields: only NOCs that still exist and competed recently."""
+import pandas as pd
+import pytest
+
+from olympic_data.countries import DEFUNCT_NOCS
+from olympic_data.ratings import event_probabilities
+from olympic_data.simulate import baseline_probabilities
+
+
+def test_event_probabilities_drop_defunct_and_inactive():
+    state = pd.DataFrame({
+        "sport": ["Biathlon"] * 6,
+        "noc": ["NOR", "FRA", "GER", "URS", "ROC", "ITA"],
+        "rating": [1700.0, 1650.0, 1600.0, 1900.0, 1800.0, 1550.0],
+        "events": [20, 15, 12, 30, 5, 3],
+        "last_year": [2022, 2022, 2018, 1988, 2022, 2006],
+    })
+    events = pd.DataFrame({"sport": ["Biathlon"], "event": ["Sprint"], "event_gender": ["Men"]})
+    probs = event_probabilities(state, events)
+    assert set(probs["noc"]) == {"NOR", "FRA", "GER"}              # URS / ROC defunct, ITA not since 2014
+    assert probs["prob"].sum() == pytest.approx(1.0)
+
+
+def test_baseline_probabilities_drop_defunct():
+    awards = pd.DataFrame({
+        "year": [2018, 2018, 2018, 2022, 2022, 2022, 1988],
+        "season": ["Winter"] * 7,
+        "sport": ["Luge"] * 7,
+        "event": ["Singles"] * 7,
+        "event_gender": ["Men"] * 7,
+        "noc": ["GER", "OAR", "AUT", "GER", "ROC", "ITA", "GDR"],
+        "medal": ["GOLD", "SILVER", "BRONZE", "GOLD", "SILVER", "BRONZE", "GOLD"],
+    })
+    events = awards[["sport", "event", "event_gender"]].drop_duplicates()
+    probs = baseline_probabilities(awards, events, since=1980)
+    assert not probs["noc"].isin(DEFUNCT_NOCS).any()
+    assert probs["prob"].sum() > 0.999
@@ -0,0 +1,59 @@
+# notebooks/tests/test_reconcile.py
+"""Medal rows linked to result rows, one-to-one."""
+import numpy as np
+import pandas as pd
+
+from olympic_data.reconcile import _popcount_bytes, assign_greedy, reconcile
+
+
+def _medals():
+    return pd.DataFrame({
+        "year": [2022] * 4,
+        "event": ["4 x 7.5km Relay"] * 2 + ["Sprint"] * 2,
+        "noc": ["NOR", "NOR", "FRA", "FRA"],
+        "medal": ["GOLD", "SILVER", "GOLD", "SILVER"],
+        "athlete": ["Gallia II", "Norway team", "Quentin FILLON MAILLET", "Emilien JACQUELIN"],
+        "athlete_url": [None, None, "https://olympics.com/en/athletes/quentin-fillon-maillet", None],
+        "participant_type": ["GameTeam", "GameTeam", "Athlete", "Athlete"],
+    })
+
+
+def _results():
+    return pd.DataFrame({
+        "year": [2022] * 4,
+        "event_title": ["4 x 7.5km Relay"] * 2 + ["Sprint"] * 2,
+        "country_3_letter_code": ["NOR", "NOR", "FRA", "FRA"],
+        "medal_type": ["GOLD", "SILVER", "GOLD", "SILVER"],
+        "athlete_full_name": [None, None, "Quentin FILLON MAILLET", "Emilien JACQUELIN"],
+        "athlete_url": [None, None, "https://olympics.com/en/athletes/quentin-fillon-maillet", None],
+        "participant_type": ["GameTeam", "GameTeam", "Athlete", "Athlete"],
+    })
+
+
+def test_team_lines_and_athletes():
+    m = reconcile(_medals(), _results()).set_index("medal_row")
+    assert m["method"].to_dict() == {0: "team", 1: "team", 2: "url", 3: "name"}
+    assert m["result_row"].to_dict() == {0: 0, 1: 1, 2: 2, 3: 3}
+
+
+def test_losing_medal_row_takes_next_candidate():
+    # both relay medal rows prefer result row 0 (GOLD): the SILVER one must get row 1, not be dropped
+    results = _results()
+    results.loc[1, "medal_type"] = "GOLD"
+    m = reconcile(_medals(), results)
+    assert sorted(m["medal_row"]) == [0, 1, 2, 3]
+    assert m["result_row"].is_unique
+
+
+def test_assignment_is_globally_greedy():
+    # B loses row 10 to A; its second choice (0.8) beats C's only candidate (0.7)
+    scored = pd.DataFrame({"medal_row": [0, 1, 1, 2], "result_row": [10, 10, 11, 11],
+                           "confidence": [0.9, 0.85, 0.8, 0.7]})
+    picked = assign_greedy(scored)
+    assert dict(zip(picked["medal_row"], picked["result_row"])) == {0: 10, 1: 11}
+
+
+def test_popcount_fallback():
+    a = np.random.default_rng(0).integers(0, 2**63, size=(50, 8), dtype=np.uint64) | np.uint64(2**63)
+    expected = [[bin(int(x)).count("1") for x in row] for row in a]
+    np.testing.assert_array_equal(_popcount_bytes(a), expected)
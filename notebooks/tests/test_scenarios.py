@@ -0,0 +1,75 @@
+# notebooks/tests/test_scenarios.py
+"""Closed-form scenario scoring against brute-force enumeration of podiums."""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from olympic_data.scenarios import EXAMPLES, ScenarioEngine, check_scenario, expected_podium
+
+
+def _brute_force(p):
+    out = np.zeros((len(p), 3))
+    for a, b, c in itertools.permutations(range(len(p)), 3):
+        pr = p[a] * p[b] / (1 - p[a]) * p[c] / (1 - p[a] - p[b])
+        out[a, 0] += pr
+        out[b, 1] += pr
+        out[c, 2] += pr
+    return out
+
+
+@pytest.mark.parametrize("p", [[0.5, 0.3, 0.2], [0.4, 0.3, 0.2, 0.05, 0.05], [0.7, 0.1, 0.1, 0.1, 0.0]])
+def test_expected_podium_matches_enumeration(p):
+    p = np.array(p)
+    np.testing.assert_allclose(expected_podium(p), _brute_force(p), atol=1e-12)
+
+
+def test_expected_podium_short_field():
+    pod = expected_podium(np.array([0.6, 0.4, 0.0]))
+    np.testing.assert_allclose(pod.sum(axis=0), [1.0, 1.0, 0.0])      # no third finisher
+
+
+@pytest.fixture
+def engine():
+    probs = pd.DataFrame({
+        "sport": ["Biathlon"] * 4 + ["Luge"] * 3,
+        "event": ["Sprint"] * 4 + ["Singles"] * 3,
+        "event_gender": ["Men"] * 4 + ["Women"] * 3,
+        "noc": ["NOR", "FRA", "ITA", "GER", "GER", "ITA", "AUT"],
+        "prob": [0.4, 0.3, 0.2, 0.1, 0.5, 0.3, 0.2],
+    })
+    return ScenarioEngine(probs, lift=1.5, host="ITA")
+
+
+def test_scenarios(engine):
+    table = engine.score([
+        {"name": "no host", "host_advantage": 0},
+        {"name": "no NOR", "host_advantage": 0, "absent": ["NOR"]},
+        {"name": "no luge", "host_advantage": 0, "drop_sports": ["Luge"]},
+    ]).set_index(["scenario", "noc"])
+    assert table.groupby(level=0)["gold"].sum().round(9).to_dict() == {
+        "baseline": 2.0, "no host": 2.0, "no NOR": 2.0, "no luge": 1.0}
+    assert table.loc[("no NOR", "NOR"), "total"] == 0
+    assert table.loc[("no host", "GER"), "gold"] == pytest.approx(0.1 + 0.5)
+    assert table.loc[("no host", "ITA"), "gold_change"] < 0                 # the lift is gone
+    assert table.loc[("no luge", "AUT"), "total"] == 0
+
+
+def test_scenarios_memoized(engine):
+    engine.score([{"name": "a", "strength": {"FRA": 2}}])
+    n = len(engine._memo)
+    engine.score([{"name": "same, renamed", "strength": {"FRA": 2}}])
+    assert len(engine._memo) == n
+
+
+@pytest.mark.parametrize("sc", [{"absent": "NOR"}, {"drop_sports": "Luge"}, {"absnet": ["NOR"]},
+                                {"strength": ["NOR"]}, {"host_advantage": "2"}, "no NOR"])
+def test_bad_scenarios_rejected(engine, sc):
+    with pytest.raises(ValueError):
+        engine.score([sc])
+
+
+def test_examples_are_valid():
+    for sc in EXAMPLES:
+        check_scenario(sc)
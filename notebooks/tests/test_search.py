@@ -0,0 +1,32 @@
+# notebooks/tests/test_search.py
+"""Search documents and lookups on a tiny index."""
+import pandas as pd
+
+from olympic_data.athlete_index import build_athlete_dim
+from olympic_data.search import SearchIndex, build_documents
+
+
+def _medals():
+    return pd.DataFrame({
+        "participant_type": ["Athlete", "GameTeam", "GameTeam"],
+        "athlete": ["Marit BJØRGEN", "Gallia II", "United States team"],
+        "athlete_url": ["https://olympics.com/en/athletes/marit-bjorgen", None, None],
+    })
+
+
+def _awards():
+    return pd.DataFrame({"year": [2018, 1900], "sport": ["Cross Country Skiing", "Sailing"],
+                         "event": ["Women's 30km", "10m mixed"], "event_gender": ["Women", "Mixed"],
+                         "noc": ["NOR", "FRA"], "country": ["Norway", "France"]})
+
+
+def test_team_lines_are_not_athlete_documents():
+    docs = build_documents(_awards(), build_athlete_dim({"medals": _medals()}))
+    assert docs.loc[docs["kind"] == "athlete", "label"].tolist() == ["Marit BJØRGEN"]
+
+
+def test_search_prefix_and_transliteration():
+    idx = SearchIndex.build(build_documents(_awards(), build_athlete_dim({"medals": _medals()})))
+    assert [h["label"] for h in idx.search("bjørg", kind="athlete")] == ["Marit BJØRGEN"]
+    assert [h["label"] for h in idx.search("bjoergen", kind="athlete")] == ["Marit BJØRGEN"]
+    assert not idx.search("gallia", kind="athlete")
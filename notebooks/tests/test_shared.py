@@ -0,0 +1,33 @@
+# notebooks/tests/test_shared.py
+"""Shared Arrow versions: unique per publish, keyed on the written bytes."""
+import json
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from olympic_data import shared  # noqa: E402
+from olympic_data.shared import POINTER, SharedDataset, publish_shared  # noqa: E402
+
+
+def _frames(n=3):
+    return {"awards": pd.DataFrame({"noc": ["NOR", "GER", "AUT"][:n], "gold": [16, 12, 7][:n]})}
+
+
+def test_back_to_back_publishes_get_distinct_versions(tmp_path):
+    versions = [publish_shared(_frames(), root=tmp_path, keep=5) for _ in range(3)]
+    assert len(set(versions)) == 3
+    assert versions == sorted(versions)                         # publish order
+    assert json.loads((tmp_path / POINTER).read_text())["version"] == versions[-1]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(versions + [POINTER])
+
+
+def test_same_instant_differs_by_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+    a = publish_shared(_frames(), root=tmp_path)
+    b = publish_shared(_frames(2), root=tmp_path)
+    assert a != b and a.split("-")[0] == b.split("-")[0]
+    assert publish_shared(_frames(), root=tmp_path) == a        # same bytes, same instant: same version
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".")]
+    assert SharedDataset(tmp_path).snapshot().version == a
@@ -0,0 +1,63 @@
+# notebooks/tests/test_simulate.py
+"""Entrant slots: repeated medals in individual events, never in team events."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from olympic_data.scenarios import ScenarioEngine
+from olympic_data.simulate import ENTRANTS, event_programme, probability_matrix, simulate_games
+
+
+@pytest.fixture
+def probs():
+    return pd.DataFrame({
+        "sport": ["Biathlon"] * 3 + ["Bobsleigh"] * 3,
+        "event": ["Sprint"] * 3 + ["Four"] * 3,
+        "event_gender": ["Men"] * 3 + ["Open"] * 3,
+        "noc": ["NOR", "FRA", "ITA", "GER", "SUI", "CAN"],
+        "prob": [0.8, 0.1, 0.1, 0.8, 0.1, 0.1],
+        "team": [False] * 3 + [True] * 3,
+    })
+
+
+def test_probability_matrix_slots(probs):
+    events, nocs, cand_noc, cand_p = probability_matrix(probs)
+    per_event = (cand_p > 0).sum(axis=1)
+    assert dict(zip(events["sport"], per_event)) == {"Biathlon": 3 * ENTRANTS, "Bobsleigh": 3}
+    np.testing.assert_allclose(cand_p.sum(axis=1), 1.0)
+    nor = cand_p[0][nocs[cand_noc[0]] == "NOR"]
+    np.testing.assert_allclose(nor, 0.8 / ENTRANTS)
+    # no team column: every event is individual
+    _, _, _, p = probability_matrix(probs.drop(columns="team"))
+    assert ((p > 0).sum(axis=1) == 3 * ENTRANTS).all()
+
+
+def test_simulated_repeats_only_in_individual_events(probs):
+    nocs, counts = simulate_games(probs, n_sims=2_000, block=500)
+    total = dict(zip(nocs, counts.sum(axis=2).T))
+    assert total["NOR"].max() > 1                  # a sweep of the sprint is possible
+    assert total["GER"].max() == 1                 # one bob, one medal at most
+    assert (counts.sum(axis=(1, 2)) == 6).all()
+
+
+def test_expected_podium_with_slots(probs):
+    table = ScenarioEngine(probs, lift=1.0).score([]).set_index("noc")
+    assert table.loc["NOR", "total"] > 1
+    assert table.loc["GER", "total"] == pytest.approx(1.0)
+    assert table["total"].sum() == pytest.approx(6.0)
+
+
+def test_event_programme_team_flag():
+    awards = pd.DataFrame({
+        "season": "Winter", "year": [2018, 2022, 2022],
+        "sport": ["Luge", "Luge", "Bobsleigh"], "event": ["Singles", "Singles", "Four"],
+        "event_gender": ["Men", "Men", "Open"],
+    })
+    medals = pd.DataFrame({
+        "season": "Winter", "year": 2022,
+        "sport": ["Luge", "Bobsleigh", "Bobsleigh"], "event": ["Singles", "Four", "Four"],
+        "event_gender": ["Men", "Open", "Open"], "participant_type": ["Athlete", "GameTeam", "GameTeam"],
+    })
+    events = event_programme(awards, medals=medals).set_index("sport")
+    assert events["team"].to_dict() == {"Bobsleigh": True, "Luge": False}
+    assert "team" not in event_programme(awards).columns
@@ -0,0 +1,34 @@
+# notebooks/tests/test_validation.py
+"""Declarative rules: results medal flags and running without a hosts table."""
+import pandas as pd
+
+from olympic_data import validation
+from olympic_data.validation import validate
+
+
+def _results():
+    return pd.DataFrame({
+        "year": [2022] * 4, "slug_game": ["beijing-2022"] * 4,
+        "medal_type": ["GOLD", "", "", "SILVR"],
+        "gold": [1, 0, 0, 0], "silver": [0, 0, 1, 0], "bronze": [0, 0, 0, 0],
+        "country_3_letter_code": ["NOR", "FRA", "GER", "ITA"],
+    })
+
+
+def _report(report):
+    return report.set_index("rule")[["action", "failed"]].to_dict(orient="index")
+
+
+def test_results_medal_flags_ignore_non_medalists():
+    hosts = pd.DataFrame({"year": [2022], "slug": ["beijing-2022"]})
+    kept, _, report = validate(_results(), "results", hosts=hosts)
+    # row 2: no medal but a silver flag; row 3: unknown medal label
+    assert _report(report)["medal_flags"] == {"action": "warn", "failed": 2}
+    assert len(kept) == 4
+
+
+def test_known_games_skipped_without_hosts(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation, "CLEAN", tmp_path)          # no olympic_hosts_clean.csv
+    kept, quarantined, report = validate(_results(), "results")
+    assert _report(report)["known_games"]["action"] == "skipped"
+    assert quarantined.empty
@@ -0,0 +1,27 @@
+# notebooks/validate_clean_tables.py
+# Re-run the validation rules on the clean CSVs already in data/clean
+# (the cleaners run the same rules before saving).
+import time
+
+import pandas as pd
+
+from olympic_data.paths import CLEAN
+from olympic_data.validation import run_validation
+
+TABLES = {
+    "hosts":    CLEAN / "olympic_hosts_clean.csv",
+    "medals":   CLEAN / "olympic_medals_clean_v2.csv",
+    "awards":   CLEAN / "olympic_medal_awards_v2.csv",
+    "results":  CLEAN / "olympic_results_clean.csv",
+    "athletes": CLEAN / "olympic_athletes_clean.csv",
+}
+
+hosts = pd.read_csv(TABLES["hosts"])
+for table, path in TABLES.items():
+    if not path.exists():
+        print(f"\n skipped {table} (missing {path.name})")
+        continue
+    df = pd.read_csv(path)
+    t0 = time.perf_counter()
+    run_validation(df, table, hosts=hosts)
+    print(f" ({time.perf_counter() - t0:.3f}s for {len(df)} rows)")